@@ -0,0 +1,50 @@
+"""
+Measures how long play_sound() keeps the caller busy.
+Runs on the dummy SDL audio driver, so no sound card is needed:
+
+    python -m benchmarks.bench_audio_latency
+"""
+import os
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import time
+from modules.audio_engine import get_engine
+
+CLIPS = [
+    "assets/sounds/correct.mp3",
+    "assets/sounds/wrong.mp3",
+    "assets/sounds/welcome.mp3",
+]
+CALLS = 200
+BUDGET_MS = 2.0
+
+
+def main():
+    engine = get_engine().start()
+    if not engine.available:
+        print("❌ Audio engine failed to start")
+        return 1
+
+    timings = []
+    for i in range(CALLS):
+        lane = "hover" if i % 3 else "feedback"
+        start = time.perf_counter()
+        engine.play(CLIPS[i % len(CLIPS)], lane=lane)
+        timings.append((time.perf_counter() - start) * 1000)
+
+    # Awaitable path: the worker must eventually finish the handle
+    handle = engine.play(CLIPS[0], lane="voice")
+    finished = handle.wait(timeout=10)
+
+    timings.sort()
+    p50 = timings[len(timings) // 2]
+    worst = timings[-1]
+    print(f"play() calls: {CALLS}")
+    print(f"p50 {p50:.3f} ms   max {worst:.3f} ms   budget {BUDGET_MS} ms")
+    print(f"awaited clip finished: {finished}")
+    engine.shutdown()
+    return 0 if worst < BUDGET_MS and finished else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,127 @@
+"""
+Per-frame cost of showing the drawing at 1080p: the old full-frame
+cv2.addWeighted against Canvas.composite (inked tiles only), for an
+empty canvas, a few strokes and a canvas scribbled all over. Also times
+adding a point, undo / redo and exports, and checks that undoing every
+stroke leaves an empty layer and that undo / redo leaves the same ink
+as drawing the remaining strokes from scratch. Exits 1 when a check fails:
+
+    python -m benchmarks.bench_canvas
+"""
+import os
+import tempfile
+import time
+import cv2
+import numpy as np
+from modules.canvas import Canvas
+
+WIDTH, HEIGHT = 1920, 1080
+FRAMES = 300
+
+
+def scribble(seed, strokes, points=60, spread=1.0):
+    # Wobbly strokes, as (n, 2) point lists in pixels
+    rng = np.random.default_rng(seed)
+    paths = []
+    for _ in range(strokes):
+        cx, cy = rng.uniform(0.1, 0.9) * WIDTH, rng.uniform(0.1, 0.9) * HEIGHT
+        t = np.linspace(0, 2 * np.pi * rng.uniform(0.5, 1.5), points)
+        rx, ry = rng.uniform(40, 300) * spread, rng.uniform(40, 200) * spread
+        xs = np.clip(cx + rx * np.cos(t * rng.uniform(1, 3)), 0, WIDTH - 1)
+        ys = np.clip(cy + ry * np.sin(t * rng.uniform(1, 3)), 0, HEIGHT - 1)
+        paths.append([(int(x), int(y)) for x, y in zip(xs, ys)])
+    return paths
+
+
+def draw(canvas, paths):
+    costs = []
+    for i, path in enumerate(paths):
+        for point in path:
+            start = time.perf_counter()
+            canvas.extend(i, point)
+            costs.append((time.perf_counter() - start) * 1e6)
+        canvas.end(i)
+    return costs
+
+
+def frame_cost(step, frame):
+    times = []
+    for _ in range(FRAMES):
+        start = time.perf_counter()
+        step(frame)
+        times.append((time.perf_counter() - start) * 1000)
+    return np.percentile(times, 50), np.percentile(times, 99)
+
+
+def main():
+    ok = True
+    frame = np.full((HEIGHT, WIDTH, 3), 90, np.uint8)
+    old_canvas = np.zeros((HEIGHT, WIDTH, 3), np.uint8)
+    old = frame_cost(lambda f: cv2.addWeighted(f, 0.5, old_canvas, 0.5, 0, dst=f), frame.copy())
+    print(f"{'':>10} {'tiles':>6} {'p50 ms':>7} {'p99 ms':>7}")
+    print(f"{'addWeighted':>10} {'all':>6} {old[0]:>7.3f} {old[1]:>7.3f}")
+
+    for label, paths in (("empty", []), ("doodle", scribble(1, 5)), ("scribbled", scribble(2, 60, 120, 2.0))):
+        canvas = Canvas(WIDTH, HEIGHT)
+        extend = draw(canvas, paths)
+        p50, p99 = frame_cost(canvas.composite, frame.copy())
+        tiles = f"{canvas.layer.ink.mean() * 100:.0f}%"
+        print(f"{label:>10} {tiles:>6} {p50:>7.3f} {p99:>7.3f}" +
+              (f"   extend p50 {np.median(extend):.1f} us" if extend else ""))
+
+    # Undo / redo against a from-scratch rebuild (unsimplified, so both
+    # hold exactly the same points)
+    canvas = Canvas(WIDTH, HEIGHT, epsilon=0)
+    draw(canvas, scribble(3, 30))
+    undo, redo = [], []
+    for _ in range(10):
+        start = time.perf_counter()
+        canvas.undo()
+        undo.append((time.perf_counter() - start) * 1000)
+    for _ in range(5):
+        start = time.perf_counter()
+        canvas.redo()
+        redo.append((time.perf_counter() - start) * 1000)
+    rebuilt = Canvas(WIDTH, HEIGHT)
+    for i in range(len(canvas.store)):
+        points, color, width = canvas.store.stroke(i)
+        rebuilt.layer.draw(points, color, width)
+
+    simplified = Canvas(WIDTH, HEIGHT)
+    draw(simplified, scribble(3, 30))
+    raw_points = sum(len(path) for path in scribble(3, 30))
+    # Live segments mark their padded boxes, so a few extra tiles are fine;
+    # an inked tile left unmarked would never be composited
+    same_tiles = not (rebuilt.layer.ink & ~canvas.layer.ink).any()
+    diff = cv2.absdiff(canvas.layer.inverse, rebuilt.layer.inverse).max(axis=2)
+    mismatch = float((diff > 64).mean())  # Anti-aliased edges may differ slightly
+    ok = ok and same_tiles and mismatch < 1e-3
+    print(f"undo p50 {np.median(undo):.2f} ms, redo p50 {np.median(redo):.2f} ms, "
+          f"inked tiles marked: {same_tiles}, pixels off: {mismatch * 100:.3f}%")
+
+    stored = int(simplified.store.offsets[len(simplified.store) - 1, 1])
+    print(f"{len(simplified.store)} strokes: {raw_points} points drawn, {stored} kept after simplification "
+          f"({simplified.store.points[:stored].nbytes} bytes)")
+
+    while canvas.undo():
+        pass
+    empty = not canvas.layer.ink.any() and canvas.layer.inverse.min() == 255
+    ok = ok and empty
+    print(f"undo everything -> empty layer: {empty}")
+
+    canvas.redo()
+    with tempfile.TemporaryDirectory() as folder:
+        start = time.perf_counter()
+        canvas.export_png(os.path.join(folder, "drawing.png"))
+        png = (time.perf_counter() - start) * 1000
+        start = time.perf_counter()
+        canvas.export_svg(os.path.join(folder, "drawing.svg"))
+        svg = (time.perf_counter() - start) * 1000
+        png_ok = cv2.imread(os.path.join(folder, "drawing.png"), cv2.IMREAD_UNCHANGED).shape == (HEIGHT, WIDTH, 4)
+    ok = ok and png_ok
+    print(f"export png {png:.1f} ms (BGRA: {png_ok}), svg {svg:.2f} ms")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,91 @@
+"""
+Replays landmark sequences through every filter preset and reports
+jitter and end-to-end lag (in 640px-wide screen pixels / milliseconds).
+
+Without arguments a synthetic hand path (still / circling / still) with
+tracker-like noise is used, so the ground truth is known. A recorded
+sequence can be given as an .npz with 'points' (T, 21, 3) and
+'timestamps' (T,); the raw sequence is then the reference:
+
+    python -m benchmarks.bench_filters [recording.npz]
+"""
+import sys
+import numpy as np
+from modules.filters import FILTER_PRESETS, DISPLAY_DELAY, make_filter
+from modules.hand_pose import HandPose
+
+FPS = 30
+INFERENCE_LATENCY = 0.05
+NOISE = 0.003
+WIDTH = 640
+
+
+def synthetic(seconds=10, seed=0):
+    rng = np.random.default_rng(seed)
+    t = np.arange(int(seconds * FPS)) / FPS
+    center = np.tile([0.5, 0.5], (len(t), 1))
+    moving = (t > 3) & (t < 7)
+    phase = (t[moving] - 3) * 2 * np.pi * 0.5
+    center[moving] = 0.5 + 0.15 * np.stack([np.sin(phase), 1 - np.cos(phase)], axis=1)
+    center[t >= 7] = center[moving][-1]
+
+    offsets = rng.normal(0, 0.05, (21, 2))
+    truth = np.zeros((len(t), 21, 3), np.float32)
+    truth[:, :, :2] = center[:, None, :] + offsets[None]
+    noisy = truth + rng.normal(0, NOISE, truth.shape).astype(np.float32)
+    noisy[:, :, 2] = 0
+    return t, noisy, truth
+
+
+def truth_at(times, stamps, truth):
+    # Linear interpolation of the reference path at arbitrary times
+    flat = truth.reshape(len(stamps), -1)
+    out = np.stack([np.interp(times, stamps, flat[:, k]) for k in range(flat.shape[1])], axis=1)
+    return out.reshape(len(times), 21, 3)
+
+
+def evaluate(preset, stamps, noisy, truth):
+    pose_filter = make_filter(preset)
+    outputs, shown_at = [], []
+    for stamp, points in zip(stamps, noisy):
+        pose = HandPose(points, (WIDTH, WIDTH * 3 // 4), timestamp=stamp)
+        now = stamp + INFERENCE_LATENCY
+        if pose_filter is not None:
+            pose = pose_filter.apply([pose], now=now)[0]
+        outputs.append(pose.points)
+        shown_at.append(now + DISPLAY_DELAY)
+    outputs = np.array(outputs)
+    expected = truth_at(np.array(shown_at), stamps, truth)
+
+    error = (outputs - expected)[:, :, :2] * WIDTH
+    velocity = np.gradient(truth[:, :, :2], stamps, axis=0) * WIDTH
+    speed = np.linalg.norm(velocity, axis=2)
+    still = speed < 5
+    moving = speed > 50
+
+    jitter = float(np.sqrt((error[still] ** 2).sum(axis=-1).mean())) if still.any() else float("nan")
+    # Error along the direction of motion divided by speed = how far behind we are
+    behind = -(error * velocity).sum(axis=-1)[moving] / speed[moving] ** 2
+    lag_ms = float(np.median(behind) * 1000) if moving.any() else float("nan")
+    return jitter, lag_ms
+
+
+def main():
+    if len(sys.argv) > 1:
+        data = np.load(sys.argv[1])
+        noisy = data["points"].astype(np.float32)
+        stamps = data["timestamps"] - data["timestamps"][0]
+        truth = noisy
+    else:
+        stamps, noisy, truth = synthetic()
+
+    print(f"{len(stamps)} poses, inference latency {INFERENCE_LATENCY * 1000:.0f} ms")
+    print(f"{'preset':>8} {'jitter px':>10} {'lag ms':>8}")
+    for preset in FILTER_PRESETS:
+        jitter, lag_ms = evaluate(preset, stamps, noisy, truth)
+        print(f"{preset:>8} {jitter:>10.2f} {lag_ms:>8.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
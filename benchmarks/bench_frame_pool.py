@@ -0,0 +1,95 @@
+"""
+Per-frame allocations of the capture path, fresh arrays vs a FramePool.
+
+Runs read -> flip -> resize to the lesson size -> shrink + BGR->RGB for
+detection -> blend a drawing canvas, at 720p and 1080p, once allocating
+every output (the old loop) and once writing into reused buffers.
+Reports frame time p50/p99, new array bytes, minor page faults and GC
+runs per frame (Linux page-fault counts come from getrusage):
+
+    python -m benchmarks.bench_frame_pool
+"""
+import gc
+import resource
+import time
+import cv2
+import numpy as np
+from modules.frame_pool import FramePool
+from modules.headless import SyntheticCapture
+
+FRAMES = 600
+LESSON_SIZE = (640, 480)
+INFERENCE_WIDTH = 640
+
+
+def fresh_frame(cap, canvas, state):
+    ok, frame = cap.read()
+    frame = cv2.flip(frame, 1)
+    small = cv2.resize(frame, LESSON_SIZE)
+    h, w = frame.shape[:2]
+    detect = cv2.resize(frame, (INFERENCE_WIDTH, round(h * INFERENCE_WIDTH / w)), interpolation=cv2.INTER_AREA)
+    rgb = cv2.cvtColor(detect, cv2.COLOR_BGR2RGB)
+    combined = cv2.addWeighted(frame, 0.5, canvas, 0.5, 0)
+    return [frame, small, detect, rgb, combined]
+
+
+def pooled_frame(cap, canvas, state):
+    pool = state["pool"]
+    ok, frame = cap.read(state.get("capture"))
+    state["capture"] = frame
+    flipped = cv2.flip(frame, 1, dst=pool.like("flip", frame))
+    w, h = LESSON_SIZE
+    small = cv2.resize(flipped, LESSON_SIZE, dst=pool.get("resize", (h, w, 3)))
+    fh, fw = flipped.shape[:2]
+    size = (INFERENCE_WIDTH, round(fh * INFERENCE_WIDTH / fw))
+    detect = cv2.resize(flipped, size, dst=pool.get("detect", (size[1], size[0], 3)), interpolation=cv2.INTER_AREA)
+    rgb = cv2.cvtColor(detect, cv2.COLOR_BGR2RGB, dst=pool.like("rgb", detect))
+    cv2.addWeighted(flipped, 0.5, canvas, 0.5, 0, dst=flipped)
+    return [frame, flipped, small, detect, rgb]
+
+
+def run(step, size):
+    cap = SyntheticCapture(size)
+    canvas = np.zeros((size[1], size[0], 3), np.uint8)
+    state = {"pool": FramePool()}
+    for _ in range(30):  # Warm-up; fills the pool
+        step(cap, canvas, state)
+
+    def reused(array):
+        buffers = [state.get("capture")] + list(state["pool"].buffers.values())
+        return any(array is buffer for buffer in buffers)
+
+    collections = [0]
+
+    def on_gc(phase, info):
+        if phase == "start":
+            collections[0] += 1
+
+    gc.callbacks.append(on_gc)
+    faults = resource.getrusage(resource.RUSAGE_SELF).ru_minflt
+    times, new_bytes = [], 0
+    try:
+        for _ in range(FRAMES):
+            start = time.perf_counter()
+            outputs = step(cap, canvas, state)
+            times.append((time.perf_counter() - start) * 1000)
+            new_bytes += sum(a.nbytes for a in outputs if not reused(a))
+            del outputs
+    finally:
+        gc.callbacks.remove(on_gc)
+    faults = resource.getrusage(resource.RUSAGE_SELF).ru_minflt - faults
+    return (np.percentile(times, 50), np.percentile(times, 99), new_bytes / FRAMES / 1e6,
+            faults / FRAMES, collections[0] / FRAMES)
+
+
+def main():
+    print(f"{'':>14} {'p50 ms':>7} {'p99 ms':>7} {'new MB/frame':>12} {'faults/frame':>12} {'gc/frame':>9}")
+    for label, size in (("720p", (1280, 720)), ("1080p", (1920, 1080))):
+        for mode, step in (("fresh", fresh_frame), ("pooled", pooled_frame)):
+            p50, p99, mb, faults, collections = run(step, size)
+            print(f"{label + ' ' + mode:>14} {p50:>7.2f} {p99:>7.2f} {mb:>12.2f} {faults:>12.0f} {collections:>9.3f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
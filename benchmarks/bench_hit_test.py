@@ -0,0 +1,57 @@
+"""
+Hit-test cost per query: linear scan of a box list vs. WidgetRegistry,
+from a lesson-sized screen (10 targets) up to a full on-screen keyboard
+and beyond. Also checks both agree on every query point.
+
+    python -m benchmarks.bench_hit_test
+"""
+import time
+import numpy as np
+from modules.widgets import WidgetRegistry
+
+QUERIES = 20000
+W, H = 640, 480
+
+
+def linear_hit_test(boxes):
+    def hit(x, y):
+        for target, (bx, by, bw, bh) in boxes:
+            if bx < x < bx + bw and by < y < by + bh:
+                return target
+        return None
+    return hit
+
+
+def keyboard(count):
+    # Keys in a grid filling the screen, like an on-screen keyboard
+    cols = int(np.ceil(np.sqrt(count * W / H)))
+    rows = int(np.ceil(count / cols))
+    kw, kh = W // cols, H // rows
+    return [(i, ((i % cols) * kw + 2, (i // cols) * kh + 2, kw - 4, kh - 4)) for i in range(count)]
+
+
+def time_queries(hit, points):
+    start = time.perf_counter()
+    for x, y in points:
+        hit(x, y)
+    return (time.perf_counter() - start) / len(points) * 1e6
+
+
+def main():
+    rng = np.random.default_rng(0)
+    points = [(int(x), int(y)) for x, y in zip(rng.integers(0, W, QUERIES), rng.integers(0, H, QUERIES))]
+
+    print(f"{'targets':>7} {'linear us':>10} {'grid us':>8} {'speedup':>8} {'agree':>6}")
+    for count in (10, 50, 100, 300, 1000):
+        boxes = keyboard(count)
+        linear = linear_hit_test(boxes)
+        registry = WidgetRegistry(boxes)
+        agree = all(linear(x, y) == registry(x, y) for x, y in points[:2000])
+        linear_us = time_queries(linear, points)
+        grid_us = time_queries(registry, points)
+        print(f"{count:>7} {linear_us:>10.2f} {grid_us:>8.2f} {linear_us / grid_us:>7.1f}x {str(agree):>6}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
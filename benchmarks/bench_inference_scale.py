@@ -0,0 +1,72 @@
+"""
+Latency / accuracy trade-off of HandTracker's inference_width (and of
+ROI tracking at full width) on a clip. Accuracy is the mean landmark error (in display pixels) against
+full-resolution detection on the same frame:
+
+    python -m benchmarks.bench_inference_scale path/to/clip.mp4
+"""
+import sys
+import time
+import cv2
+import numpy as np
+from modules.hand_tracker import HandTracker
+
+SCALES = [1.0, 0.75, 0.5, 0.33, 0.25]
+
+
+def load_frames(path, limit=300):
+    cap = cv2.VideoCapture(path)
+    frames = []
+    while len(frames) < limit:
+        ok, frame = cap.read()
+        if not ok:
+            break
+        frames.append(cv2.flip(frame, 1))
+    cap.release()
+    return frames
+
+
+def track(frames, width, roi_tracking=False):
+    tracker = HandTracker(inference_width=width, roi_tracking=roi_tracking)
+    points, timings = [], []
+    for frame in frames:
+        start = time.perf_counter()
+        landmarks = tracker.get_landmarks(frame)
+        timings.append((time.perf_counter() - start) * 1000)
+        points.append(np.array(landmarks, np.float32) if landmarks else None)
+    return points, timings
+
+
+def main():
+    if len(sys.argv) < 2:
+        print(__doc__)
+        return 1
+    frames = load_frames(sys.argv[1])
+    if not frames:
+        print("❌ Could not read any frames")
+        return 1
+    full_w = frames[0].shape[1]
+
+    reference = None
+    print(f"{len(frames)} frames at {full_w}x{frames[0].shape[0]}")
+    print(f"{'scale':>6} {'width':>6} {'p50 ms':>8} {'p95 ms':>8} {'found':>6} {'err px':>7}")
+    runs = [(f"{scale:.2f}", int(full_w * scale), False) for scale in SCALES]
+    runs.append(("roi", full_w, True))
+    for name, width, roi_tracking in runs:
+        points, timings = track(frames, width, roi_tracking)
+        if reference is None:
+            reference = points
+        errors = [
+            float(np.linalg.norm(p - r, axis=1).mean())
+            for p, r in zip(points, reference) if p is not None and r is not None
+        ]
+        found = sum(p is not None for p in points) / len(points)
+        timings.sort()
+        print(f"{name:>6} {width:>6} {timings[len(timings) // 2]:>8.2f} "
+              f"{timings[int(len(timings) * 0.95)]:>8.2f} {found:>6.0%} "
+              f"{(np.mean(errors) if errors else float('nan')):>7.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
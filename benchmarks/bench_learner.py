@@ -0,0 +1,150 @@
+"""
+The learner model against simulated children.
+
+Each simulated child remembers every item with a strength: an item never
+seen is answered right with the child's base chance for its level, and a
+seen one with a chance that decays with the questions since it was last
+asked (slower the more often it was answered right). Answer time falls
+as recall rises.
+
+  levels     questions a quick and a struggling child need before the
+             addition lesson moves them up (or keeps them down)
+  retention  after a session on a 60-item bank, the child's average
+             chance of answering every item, scheduled by the learner
+             model vs. items drawn uniformly at random
+  scale      next_item() + record() cost with 1k, 10k and 100k items
+  save       a saved and reloaded model keeps every item's schedule
+             and its keys (tuples again after JSON)
+
+Exits 1 when a check fails:
+
+    python -m benchmarks.bench_learner
+"""
+import math
+import os
+import random
+import tempfile
+import time
+from modules.learner import LearnerModel, register
+from modules.numbers.problems import build_problems
+
+SESSION = 300         # Questions in the retention session
+BANK = 60             # Items in the retention bank
+CHILDREN = 20
+MAX_SCALE_RATIO = 4   # 100k items may cost at most this many times 1k items
+
+
+class SimulatedChild:
+    def __init__(self, rng, base, learning):
+        self.rng = rng
+        self.base = base          # level -> chance of answering an unseen item
+        self.learning = learning  # Strength gained per right answer
+        self.memory = {}          # key -> (strength, question last asked)
+        self.clock = 0
+
+    def recall(self, key, level):
+        if key not in self.memory:
+            return self.base[level]
+        strength, last = self.memory[key]
+        return self.base[level] + (1 - self.base[level]) * math.exp(-(self.clock - last) / strength)
+
+    def answer(self, key, level):
+        chance = self.recall(key, level)
+        correct = self.rng.random() < chance
+        strength, _ = self.memory.get(key, (1.0, 0))
+        self.memory[key] = (strength * self.learning if correct else strength + 1, self.clock)
+        self.clock += 1
+        latency = 2 + 6 * (1 - chance) + self.rng.uniform(-0.5, 0.5)
+        return correct, latency
+
+
+def climb(base, learning, questions=200):
+    # Questions each child needed to reach level 3 (if they did), and the
+    # average level at the end
+    reached, levels = [], []
+    for seed in range(CHILDREN):
+        model, child = LearnerModel(seed), SimulatedChild(random.Random(seed), base, learning)
+        first = None
+        for q in range(questions):
+            key, level = model.next_item("addition")
+            model.record("addition", key, *child.answer(key, level))
+            if first is None and model.level("addition") == 3:
+                first = q + 1
+        levels.append(model.level("addition"))
+        if first is not None:
+            reached.append(first)
+    return reached, sum(levels) / len(levels)
+
+
+def retention(scheduled):
+    scores = []
+    for seed in range(CHILDREN):
+        child = SimulatedChild(random.Random(seed), {1: 0.2}, 3.0)
+        model, rng = LearnerModel(seed), random.Random(seed)
+        for _ in range(SESSION):
+            if scheduled:
+                key, _ = model.next_item("bench")
+                model.record("bench", key, *child.answer(key, 1))
+            else:
+                child.answer(rng.randrange(BANK), 1)
+        scores.append(sum(child.recall(key, 1) for key in range(BANK)) / BANK)
+    return sum(scores) / len(scores)
+
+
+def op_cost(n):
+    # Introduce n items, then time answering 5000 more questions
+    register(f"scale{n}", lambda level, n=n: range(n) if level == 1 else ())
+    model, rng = LearnerModel(0), random.Random(0)
+    lesson = f"scale{n}"
+    for _ in range(n):
+        key, _ = model.next_item(lesson)
+        model.record(lesson, key, rng.random() < 0.6, rng.uniform(1, 6))
+    start = time.perf_counter()
+    for _ in range(5000):
+        key, _ = model.next_item(lesson)
+        model.record(lesson, key, rng.random() < 0.6, rng.uniform(1, 6))
+    return (time.perf_counter() - start) * 1e6 / 5000
+
+
+def main():
+    ok = True
+    register("bench", lambda level: range(BANK) if level == 1 else ())
+
+    quick, quick_level = climb({1: 0.9, 2: 0.8, 3: 0.6}, 4.0)
+    slow, slow_level = climb({1: 0.35, 2: 0.15, 3: 0.05}, 1.5)
+    print(f"quick child: level 3 in {len(quick)}/{CHILDREN} sessions, after "
+          f"{sum(quick) / max(len(quick), 1):.0f} questions on average; final level {quick_level:.2f}")
+    print(f"struggling child: level 3 in {len(slow)}/{CHILDREN} sessions; final level {slow_level:.2f}")
+    ok = ok and len(quick) == CHILDREN and slow_level < quick_level
+
+    spaced, uniform = retention(True), retention(False)
+    print(f"retention after {SESSION} questions on {BANK} items: scheduled {spaced * 100:.1f}%, "
+          f"uniform random {uniform * 100:.1f}%")
+    ok = ok and spaced > uniform
+
+    costs = {n: op_cost(n) for n in (1000, 10000, 100000)}
+    print("next_item + record: " + ", ".join(f"{n} items {us:.1f} us" for n, us in costs.items()))
+    ok = ok and costs[100000] <= MAX_SCALE_RATIO * costs[1000]
+
+    model, child = LearnerModel(1), SimulatedChild(random.Random(1), {1: 0.7, 2: 0.5, 3: 0.3}, 3.0)
+    for _ in range(100):
+        key, level = model.next_item("addition")
+        model.record("addition", key, *child.answer(key, level))
+    path = os.path.join(tempfile.mkdtemp(), "learner.json")
+    model.save(path)
+    loaded = LearnerModel(1)
+    loaded.load(path)
+    fields = ("level", "reps", "ease", "interval", "due", "attempts", "correct", "latency")
+    saved, restored = model.lessons["addition"], loaded.lessons["addition"]
+    same = loaded.stats("addition") == model.stats("addition") and list(saved.recent) == list(restored.recent)
+    for key, item in saved.items.items():
+        copy = restored.items.get(key)
+        same = same and copy is not None and all(getattr(item, f) == getattr(copy, f) for f in fields)
+    valid = {p.operands for level in (1, 2, 3) for p in build_problems("addition", level)}
+    same = same and all(key in valid for key in loaded.lessons["addition"].items)
+    print(f"save / load keeps the schedule: {same}")
+    return 0 if ok and same else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,60 @@
+"""
+Per-stage frame cost of every menu and lesson, headless: no camera, no
+window, no GPU. Frames are synthetic (or a clip, tracked by MediaPipe)
+and a scripted hand tours the screen pinching as it goes. Reports
+p50 / p95 / p99 in milliseconds for capture, tracking, logic, audio,
+render and display:
+
+    python -m benchmarks.bench_lessons [path/to/clip.mp4] [frames]
+"""
+import os
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import sys
+from modules.headless import STAGES, LoopingCapture, SyntheticCapture, ScriptedTracker, profile_scene
+from modules.menu import MenuScene
+from modules.numbers.numbers import LESSONS, NumbersScene
+from modules.numbers.numbers_menu import numbers_menu_scene
+from modules.shapes_colors import ShapesColorsScene
+from modules.spellings import SpellingsScene
+from modules.drawing import DrawingScene
+
+FRAMES = 300
+
+SCENES = [
+    ("Main menu", lambda: MenuScene(["Shapes & Colors", "Numbers", "Counting", "Spellings", "Drawing", "Quit"], {})),
+    ("Numbers grid", NumbersScene),
+    ("Numbers menu", numbers_menu_scene),
+    ("Shapes & Colors", ShapesColorsScene),
+    ("Spellings", SpellingsScene),
+    ("Drawing", DrawingScene),
+] + list(LESSONS.items())
+
+
+def main():
+    args = sys.argv[1:]
+    path = args.pop(0) if args and not args[0].isdigit() else None
+    frames = int(args[0]) if args else FRAMES
+
+    print(f"{frames} frames per scene, "
+          f"{'clip ' + path + ' + HandTracker' if path else 'synthetic 1280x720 frames + scripted hand'}")
+    print(f"{'scene':>16} " + " ".join(f"{stage:>17}" for stage in STAGES + ("total",)))
+    print(f"{'':>16} " + " ".join(f"{'p50/p95/p99':>17}" for _ in STAGES + ("total",)))
+    for name, factory in SCENES:
+        if path:
+            from modules.hand_tracker import HandTracker
+            cap, tracker = LoopingCapture(path), HandTracker(max_num_hands=2)
+        else:
+            cap, tracker = SyntheticCapture(), ScriptedTracker()
+        times = profile_scene(factory, frames, cap, tracker)
+        cap.release()
+        cells = []
+        for stage in STAGES + ("total",):
+            p50, p95, p99 = times.percentiles(stage)
+            cells.append(f"{p50:5.2f}/{p95:5.2f}/{p99:5.2f}")
+        print(f"{name:>16} " + " ".join(f"{cell:>17}" for cell in cells))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
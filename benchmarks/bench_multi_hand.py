@@ -0,0 +1,69 @@
+"""
+How per-frame tracking cost scales from 1 to 4 hands.
+
+The id-association step is measured on synthetic poses. Inference cost
+(HandTracker at max_num_hands = 1..4, and the hands it finds) is only
+measured when given a clip of real hands; no clip ships with the repo,
+so without one the tracking columns are left out and nothing is said
+about how inference scales:
+
+    python -m benchmarks.bench_multi_hand [path/to/clip.mp4]
+"""
+import sys
+import time
+import numpy as np
+from modules.hand_pose import HandPose, HandAssociator
+
+FRAMES = 2000
+
+
+def bench_association(hands):
+    rng = np.random.default_rng(hands)
+    base = rng.random((hands, 21, 3), dtype=np.float32) * 0.2 + np.linspace(0, 0.7, hands)[:, None, None]
+    associator = HandAssociator()
+    start = time.perf_counter()
+    for i in range(FRAMES):
+        jitter = rng.normal(0, 0.003, base.shape).astype(np.float32)
+        poses = [HandPose(p, (640, 480), "Right" if k % 2 else "Left")
+                 for k, p in enumerate(base + jitter)]
+        associator.assign(poses, now=i / 30)
+    elapsed = (time.perf_counter() - start) / FRAMES * 1000
+    stable = sorted(associator.tracks) == list(range(hands))
+    return elapsed, stable
+
+
+def bench_clip(path, hands):
+    import cv2
+    from modules.hand_tracker import HandTracker
+    tracker = HandTracker(max_num_hands=hands)
+    cap = cv2.VideoCapture(path)
+    timings, found = [], []
+    while True:
+        ok, frame = cap.read()
+        if not ok:
+            break
+        start = time.perf_counter()
+        poses = tracker.get_poses(cv2.flip(frame, 1))
+        timings.append((time.perf_counter() - start) * 1000)
+        found.append(len(poses))
+    cap.release()
+    return np.median(timings), np.mean(found), max(found)
+
+
+def main():
+    path = sys.argv[1] if len(sys.argv) > 1 else None
+    print(f"{'hands':>5} {'assoc ms':>9} {'ids stable':>10}" + (f" {'track ms':>9} {'avg found':>9}" if path else ""))
+    for hands in range(1, 5):
+        assoc_ms, stable = bench_association(hands)
+        line = f"{hands:>5} {assoc_ms:>9.3f} {str(stable):>10}"
+        if path:
+            track_ms, avg_found, _ = bench_clip(path, hands)
+            line += f" {track_ms:>9.2f} {avg_found:>9.2f}"
+        print(line)
+    if not path:
+        print("(no clip given: inference cost per hand count not measured)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
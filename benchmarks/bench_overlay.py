@@ -0,0 +1,98 @@
+"""
+Per-frame UI draw cost: immediate-mode cv2 drawing (as the lessons did)
+vs. the cached Overlay, on the run_numbers 3x3 grid and the addition
+screen. "1 dirty" changes one button's state every frame, like a hover
+glow or progress ring would. Also reports the largest pixel difference
+between the two results.
+
+    python -m benchmarks.bench_overlay
+"""
+import time
+import cv2
+import numpy as np
+from modules.overlay import Overlay, text_box, union_box
+
+FRAMES = 500
+W, H = 640, 480
+FONT = cv2.FONT_HERSHEY_SIMPLEX
+
+
+def numbers_grid():
+    labels = ["Addition", "Subtraction", "Multiplication", "Division",
+              "Counting", "Tracing", "Odd/Even", "Fill Missing", "Back"]
+    items = []
+    for i, label in enumerate(labels):
+        x, y = 25 + (i % 3) * 205, 40 + (i // 3) * 120
+        def draw(img, glow, label=label, x=x, y=y):
+            cv2.rectangle(img, (x, y), (x + 180, y + 80), (0, 255, 0) if glow else (0, 150, 255), -1)
+            cv2.putText(img, label, (x + 10, y + 50), FONT, 0.8, (0, 0, 0), 2)
+        box = union_box((x, y, 180, 80), text_box(label, (x + 10, y + 50), FONT, 0.8, 2))
+        items.append((label, box, draw))
+    return items
+
+
+def addition_screen():
+    items = []
+    def question(img, state):
+        cv2.putText(img, "What is 4 + 7?", (30, 70), FONT, 1.5, (0, 120, 255), 4)
+    items.append(("question", text_box("What is 4 + 7?", (30, 70), FONT, 1.5, 4), question))
+    for i, val in enumerate([11, 9, 14, 6]):
+        x, y = 80 + i * 120, H // 2
+        def option(img, state, val=val, x=x, y=y):
+            cv2.rectangle(img, (x, y), (x + 100, y + 100), (255, 230, 180), -1)
+            cv2.putText(img, str(val), (x + 20, y + 65), FONT, 2, (0, 0, 0), 4)
+        items.append((val, (x, y, 100, 100), option))
+    def back(img, state):
+        cv2.rectangle(img, (W - 130, 20), (W - 30, 80), (255, 255, 255), -1)
+        cv2.putText(img, "BACK", (W - 120, 60), FONT, 1, (0, 0, 255), 2)
+    items.append(("BACK", (W - 130, 20, 100, 60), back))
+    return items
+
+
+def bench(items, frames):
+    def immediate(frame, i):
+        for k, (_, _, draw) in enumerate(items):
+            draw(frame, k == i % len(items))
+
+    overlay = Overlay(W, H)
+    for name, box, draw in items:
+        overlay.add(name, box, draw, False)
+
+    def cached(frame, i):
+        overlay.composite(frame)
+
+    def one_dirty(frame, i):
+        for k, (name, _, _) in enumerate(items):
+            overlay.set_state(name, k == i % len(items))
+        overlay.composite(frame)
+
+    results = {}
+    for name, fn in (("immediate", immediate), ("overlay", cached), ("overlay 1 dirty", one_dirty)):
+        start = time.perf_counter()
+        for i, frame in enumerate(frames):
+            fn(frame.copy(), i)
+        results[name] = (time.perf_counter() - start) / len(frames) * 1000
+
+    # Same state on both sides, then compare pixels
+    a, b = frames[0].copy(), frames[0].copy()
+    for k, (name, _, draw) in enumerate(items):
+        draw(a, False)
+        overlay.set_state(name, False)
+    overlay.composite(b)
+    results["max diff"] = int(np.abs(a.astype(np.int16) - b).max())
+    return results
+
+
+def main():
+    rng = np.random.default_rng(0)
+    frames = [rng.integers(0, 256, (H, W, 3), dtype=np.uint8) for _ in range(8)] * (FRAMES // 8)
+    print(f"{'screen':>14} {'immediate ms':>13} {'overlay ms':>11} {'1 dirty ms':>11} {'max diff':>9}")
+    for name, items in (("numbers grid", numbers_grid()), ("addition", addition_screen())):
+        r = bench(items, frames)
+        print(f"{name:>14} {r['immediate']:>13.3f} {r['overlay']:>11.3f} "
+              f"{r['overlay 1 dirty']:>11.3f} {r['max diff']:>9}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,51 @@
+"""
+Replays a recorded clip through the capture pipeline and compares the
+serial loop with the threaded one:
+
+    python -m benchmarks.bench_pipeline path/to/clip.mp4
+"""
+import sys
+import time
+import cv2
+from modules.hand_tracker import HandTracker
+from modules.capture_pipeline import CapturePipeline
+
+
+def run(path, threaded):
+    pipeline = CapturePipeline(path, HandTracker(), threaded=threaded, realtime=threaded)
+    tracker = pipeline.tracker
+    frames, ages = 0, []
+    start = time.perf_counter()
+    while True:
+        ok, frame = pipeline.read()
+        if not ok:
+            break
+        frame = cv2.flip(frame, 1)
+        tracker.get_landmarks(frame)
+        if tracker.track is not None:
+            ages.append(tracker.track.age() * 1000)
+        tracker.draw_hand(frame)
+        frames += 1
+    elapsed = time.perf_counter() - start
+    pipeline.release()
+    return frames, elapsed, ages
+
+
+def main():
+    if len(sys.argv) < 2:
+        print(__doc__)
+        return 1
+    path = sys.argv[1]
+    for threaded in (False, True):
+        frames, elapsed, ages = run(path, threaded)
+        mode = "threaded" if threaded else "serial"
+        line = f"{mode:>8}: {frames} frames in {elapsed:.2f}s ({frames / elapsed:.1f} render fps)"
+        if ages:
+            ages.sort()
+            line += f", landmark age p50 {ages[len(ages) // 2]:.1f} ms"
+        print(line)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,135 @@
+"""
+Problem banks: build cost, validity, dealing speed and reproducibility.
+
+Builds every lesson at every difficulty and checks each problem (right
+answer, distinct options, none below the lesson's lowest number), deals
+thousands of problems per bank checking that a round never repeats a
+problem and that the same seed deals the same sequence, and compares
+the deal time with the old rejection-sampling loops (reporting how
+often those offered a negative option or needed extra tries). Exits 1
+when a check fails:
+
+    python -m benchmarks.bench_problems
+"""
+import random
+import time
+from modules.numbers.problems import DIFFICULTIES, SPECS, ProblemBank, build_problems, get_bank, seed_banks
+
+DRAWS = 20000
+
+CHECKS = {
+    "addition": lambda ops: ops[0] + ops[1],
+    "subtraction": lambda ops: ops[0] - ops[1],
+    "multiplication": lambda ops: ops[0] * ops[1],
+    "division": lambda ops: ops[0] // ops[1],
+    "counting": lambda ops: ops[0],
+    "fill_missing": lambda ops: ops[0] + ops[2] * ops[1],
+    "odd_even": lambda ops: "Even" if ops[0] % 2 == 0 else "Odd",
+    "tracing": lambda ops: ops[0],
+}
+
+
+def old_fill_missing(rng, stats):
+    # The loop the lesson used to run
+    start = rng.randint(1, 5)
+    step = rng.choice([1, 2])
+    correct = start + rng.randint(1, 3) * step
+    options = [correct]
+    while len(options) < 4:
+        stats["tries"] += 1
+        fake = rng.randint(correct - 3, correct + 3)
+        if fake not in options:
+            options.append(fake)
+    stats["negative"] += any(o < 0 for o in options)
+    return options
+
+
+def old_addition(rng, stats):
+    correct = rng.randint(1, 9) + rng.randint(1, 9)
+    options = [correct]
+    while len(options) < 4:
+        stats["tries"] += 1
+        wrong = rng.randint(2, 18)
+        if wrong != correct and wrong not in options:
+            options.append(wrong)
+    return options
+
+
+def validate(lesson, difficulty):
+    spec, errors = SPECS[lesson], []
+    problems = build_problems(lesson, difficulty)
+    if len({p.operands for p in problems}) != len(problems):
+        errors.append("duplicate problems")
+    for p in problems:
+        ok = (p.answer == CHECKS[lesson](p.operands) and p.options[0] == p.answer
+              and len(p.options) == spec.options and len(set(p.options)) == spec.options
+              and all(isinstance(o, str) or o >= spec.lowest for o in p.options))
+        if not ok:
+            errors.append(repr(p))
+    return problems, errors
+
+
+def deal(bank):
+    # Draw DRAWS problems; count repeats within a round and back to back
+    n, repeats, back_to_back, previous = len(bank), 0, 0, None
+    seen = set()
+    start = time.perf_counter()
+    for i in range(DRAWS):
+        problem = bank.draw()
+        if i % n == 0:
+            seen = set()
+        base = tuple(sorted(problem.operands)) if bank.spec.commutative else problem.operands
+        repeats += base in seen
+        seen.add(base)
+        back_to_back += base == previous
+        previous = base
+    return (time.perf_counter() - start) * 1e6 / DRAWS, repeats, back_to_back
+
+
+def main():
+    ok = True
+    print(f"{'lesson':>15} {'level':>5} {'problems':>8} {'build ms':>8} {'draw us':>7} {'repeats':>7}")
+    for lesson in SPECS:
+        for difficulty in DIFFICULTIES:
+            build_problems.cache_clear()
+            start = time.perf_counter()
+            problems, errors = validate(lesson, difficulty)
+            build_ms = (time.perf_counter() - start) * 1000
+            draw_us, repeats, back_to_back = deal(ProblemBank(lesson, difficulty, seed=7))
+            ok = ok and not errors and not repeats and not back_to_back
+            print(f"{lesson:>15} {difficulty:>5} {len(problems):>8} {build_ms:>8.2f} {draw_us:>7.2f} "
+                  f"{repeats + back_to_back:>7}")
+            for error in errors[:3]:
+                print(f"    invalid: {error}")
+
+    bank_a, bank_b = ProblemBank("addition", seed=42), ProblemBank("addition", seed=42)
+    same = all((x.operands, x.options) == (y.operands, y.options)
+               for x, y in ((bank_a.draw(), bank_b.draw()) for _ in range(1000)))
+    seed_banks(5)
+    shared = [get_bank("division").draw().operands for _ in range(50)]
+    seed_banks(5)
+    shared_again = [get_bank("division").draw().operands for _ in range(50)]
+    seed_banks(None)
+    reproducible = same and shared == shared_again
+    ok = ok and reproducible
+    print(f"same seed, same problems and options: {reproducible}")
+
+    for name, old, lesson in (("fill_missing", old_fill_missing, "fill_missing"),
+                              ("addition", old_addition, "addition")):
+        rng, stats = random.Random(0), {"tries": 0, "negative": 0}
+        start = time.perf_counter()
+        for _ in range(DRAWS):
+            old(rng, stats)
+        old_us = (time.perf_counter() - start) * 1e6 / DRAWS
+        bank = ProblemBank(lesson, seed=0)
+        start = time.perf_counter()
+        for _ in range(DRAWS):
+            bank.draw()
+        new_us = (time.perf_counter() - start) * 1e6 / DRAWS
+        print(f"{name:>15}: old loop {old_us:.2f} us ({stats['tries'] / DRAWS:.2f} tries for 3 distractors, "
+              f"{stats['negative'] / DRAWS * 100:.1f}% with a negative option), bank {new_us:.2f} us")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
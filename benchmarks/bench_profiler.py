@@ -0,0 +1,101 @@
+"""
+Profiler overhead, disabled and enabled.
+
+Times span() / add() calls on their own, then a headless lesson loop
+(scripted hand, no camera) with the profiler off and on, and exports a
+Chrome trace to check it loads. Exits 1 if the disabled profiler costs
+more than BUDGET_US per frame:
+
+    python -m benchmarks.bench_profiler
+"""
+import os
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import json
+import tempfile
+import time
+import numpy as np
+from modules.headless import NullDisplay, SyntheticCapture, ScriptedTracker
+from modules.numbers.addition import AdditionScene
+from modules.profiler import Profiler, get_profiler
+from modules.runtime import App
+
+CALLS = 200000
+FRAMES = 300
+ROUNDS = 5        # Off / on runs are interleaved and the fastest of each kept
+BUDGET_US = 10.0  # Disabled-profiler cost allowed per frame (a 30 fps frame is 33000 us)
+
+
+def per_call_ns(fn):
+    start = time.perf_counter()
+    for _ in range(CALLS):
+        fn()
+    return (time.perf_counter() - start) / CALLS * 1e9
+
+
+def bench_calls(profiler):
+    def span():
+        with profiler.span("bench"):
+            pass
+
+    def add():
+        profiler.add("bench", 0.0, 1.0)
+
+    return per_call_ns(span), per_call_ns(add)
+
+
+def run_frames(enabled):
+    profiler = get_profiler()
+    profiler.enabled = enabled
+    profiler.clear()
+    app = App(SyntheticCapture(), ScriptedTracker(), display=NullDisplay())
+    app.start(AdditionScene())
+    times = []
+    for _ in range(FRAMES):
+        start = time.perf_counter()
+        app.tick()
+        times.append((time.perf_counter() - start) * 1e6)
+        if not app.stack:
+            app.push(AdditionScene())
+    spans_per_frame = profiler.count / FRAMES if enabled else 0
+    profiler.enabled = False
+    return np.median(times), spans_per_frame
+
+
+def main():
+    loop_ns = per_call_ns(lambda: None)
+    off_span, off_add = bench_calls(Profiler(enabled=False))
+    on_span, on_add = bench_calls(Profiler(enabled=True))
+    print(f"empty call {loop_ns:.0f} ns")
+    print(f"  disabled: span {off_span:.0f} ns, add {off_add:.0f} ns")
+    print(f"  enabled:  span {on_span:.0f} ns, add {on_add:.0f} ns")
+
+    run_frames(False)  # Warm-up
+    off_us = on_us = float("inf")
+    for _ in range(ROUNDS):
+        off_us = min(off_us, run_frames(False)[0])
+        us, spans = run_frames(True)
+        on_us = min(on_us, us)
+    # Worst case: every span of a frame paid as a disabled span() call
+    disabled_cost = spans * max(off_span, off_add) / 1000
+    print(f"\nheadless Addition frame p50: profiler off {off_us:.0f} us, on {on_us:.0f} us "
+          f"({spans:.1f} spans/frame)")
+    print(f"disabled profiler cost: ~{disabled_cost:.2f} us/frame (budget {BUDGET_US} us)")
+
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "trace.json")
+        profiler = get_profiler()
+        profiler.enabled = True
+        run_frames(True)
+        profiler.enabled = True
+        written = profiler.export_chrome_trace(path)
+        profiler.enabled = False
+        with open(path, encoding="utf-8") as f:
+            events = json.load(f)["traceEvents"]
+        print(f"chrome trace: {written} spans, {len(events)} events, {os.path.getsize(path) / 1024:.0f} KiB")
+
+    return 0 if disabled_cost <= BUDGET_US else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,123 @@
+"""
+Offline accuracy and latency of the air-writing recognizer.
+
+Accuracy, always on glyphs the recognizer was not built from:
+  fonts    leave one Hershey font out, build from the others, and read
+           that font's digits / letters with random rotation, shear and
+           stretch
+  strokes  the tracing lesson's digit paths with hand jitter and random
+           slant, read through recognize() by a recognizer built from
+           the fonts only, and by one built from the fonts and every
+           other digit's path (the shipped set minus that digit's path)
+  numbers  two- and three-digit answers written left to right, read by
+           the fonts-only recognizer
+Latency is recognize() on one glyph (digits only and all labels) and
+read_number() on a two-digit answer. Exits 1 when recognize() takes
+longer than MAX_MS at p99:
+
+    python -m benchmarks.bench_recognizer
+"""
+import time
+import numpy as np
+from modules.numbers.trace_scoring import DIGIT_PATHS, _strokes
+from modules.recognizer import (DIGITS, FONTS, LETTERS, GlyphRecognizer, distort, features,
+                                render_glyph, template_images)
+
+SAMPLES = 10   # Distorted copies of every test glyph
+MAX_MS = 3.0
+
+
+def random_distortion(rng):
+    return rng.uniform(-12, 12), rng.uniform(-0.25, 0.25), rng.uniform(0.75, 1.25)
+
+
+def handwritten(digit, rng, size=(120, 180), offset=(0, 0)):
+    # A digit path as a hand would draw it: slanted, stretched and jittery
+    slant, stretch = rng.uniform(-0.3, 0.3), rng.uniform(0.8, 1.2)
+    strokes = []
+    for stroke in _strokes(DIGIT_PATHS[digit], size):
+        dense = np.concatenate([np.linspace(a, b, 6, endpoint=False) for a, b in zip(stroke[:-1], stroke[1:])]
+                               + [stroke[-1:]])
+        x = (dense[:, 0] + slant * (size[1] - dense[:, 1])) * stretch
+        points = np.stack([x, dense[:, 1]], axis=1) + rng.normal(0, 3, dense.shape)
+        strokes.append(points + offset)
+    return strokes
+
+
+def accuracy(recognizer, cases):
+    correct = sum(recognizer.classify(vector, labels)[0] == truth for truth, vector, labels in cases)
+    return correct / max(len(cases), 1)
+
+
+def font_accuracy(rng):
+    results = {"digits": [], "letters": []}
+    for held_out in FONTS:
+        recognizer = GlyphRecognizer(template_images(fonts=[f for f in FONTS if f != held_out], paths=False))
+        for name, labels in (("digits", DIGITS), ("letters", LETTERS)):
+            cases = []
+            for char in labels:
+                image = render_glyph(char, held_out)
+                for _ in range(SAMPLES):
+                    cases.append((char, features(distort(image, *random_distortion(rng))), labels))
+            results[name].append(accuracy(recognizer, cases))
+    return {name: float(np.mean(values)) for name, values in results.items()}
+
+
+def timed(call, repeat=300):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        call()
+        times.append((time.perf_counter() - start) * 1000)
+    return np.percentile(times, 50), np.percentile(times, 99)
+
+
+def main():
+    rng = np.random.default_rng(0)
+    start = time.perf_counter()
+    recognizer = GlyphRecognizer()
+    build_ms = (time.perf_counter() - start) * 1000
+    print(f"built from {len(recognizer.labels)} templates in {build_ms:.0f} ms")
+
+    fonts = font_accuracy(rng)
+    print(f"held-out font: digits {fonts['digits'] * 100:.1f}%, letters {fonts['letters'] * 100:.1f}%")
+
+    fonts_only = template_images(paths=False)
+    without_paths = GlyphRecognizer(fonts_only)
+    # Each digit read by a recognizer that has every path but its own
+    held_out = {digit: GlyphRecognizer(fonts_only + template_images([d for d in DIGITS if d != digit], fonts=[]))
+                for digit in DIGITS}
+    for name, reader_for in (("fonts only", lambda digit: without_paths),
+                             ("own path held out", held_out.get)):
+        hits = total = 0
+        for digit in DIGITS:
+            reader = reader_for(digit)
+            for _ in range(SAMPLES * 3):
+                label, _ = reader.recognize(handwritten(digit, rng), DIGITS)
+                hits += label == digit
+                total += 1
+        print(f"handwritten digits, {name}: {hits / total * 100:.1f}%")
+
+    hits = total = 0
+    for _ in range(100):
+        answer = int(rng.integers(10, 1000))
+        strokes = []
+        for i, digit in enumerate(str(answer)):
+            strokes += handwritten(digit, rng, offset=(i * 160, rng.uniform(-10, 10)))
+        hits += without_paths.read_number(strokes) == answer
+        total += 1
+    print(f"multi-digit answers: {hits / total * 100:.1f}%")
+
+    one = handwritten("7", rng)
+    two = handwritten("1", rng) + handwritten("2", rng, offset=(160, 0))
+    digits = timed(lambda: recognizer.recognize(one, DIGITS))
+    everything = timed(lambda: recognizer.recognize(one))
+    number = timed(lambda: recognizer.read_number(two))
+    print(f"latency p50 / p99: digit {digits[0]:.3f} / {digits[1]:.3f} ms, "
+          f"any label {everything[0]:.3f} / {everything[1]:.3f} ms, "
+          f"two-digit number {number[0]:.3f} / {number[1]:.3f} ms")
+    return 0 if max(digits[1], everything[1]) <= MAX_MS else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,111 @@
+"""
+Session recording cost and replay determinism.
+
+Records a headless Drawing session (scripted hand) with and without
+frames, reports the per-frame cost on the lesson's thread and the file
+size, then replays the recording and checks that the lesson received
+identical poses and drew an identical canvas. Exits 1 on a mismatch:
+
+    python -m benchmarks.bench_recording
+"""
+import os
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import math
+import tempfile
+import time
+import numpy as np
+from modules.drawing import DrawingScene
+from modules.headless import NullDisplay, SyntheticCapture, ScriptedTracker
+from modules.recording import Recorder, RecordingTracker, ReplaySource
+from modules.runtime import App
+
+FRAMES = 600
+
+
+def stroke_script(index, frame_size):
+    # A hand drawing loops in the middle of the frame, lifting every 40 frames
+    w, h = frame_size
+    t = index / 15
+    x = 0.5 + 0.25 * math.sin(t)
+    y = 0.55 + 0.2 * math.sin(2 * t + 0.5)
+    return [(x * w, y * h, index % 40 < 32)]
+
+
+class PoseLog:
+    # Keeps what get_poses returned, frame by frame
+    def __init__(self, tracker):
+        self.tracker = tracker
+        self.frames = []
+
+    def get_poses(self, frame):
+        poses = self.tracker.get_poses(frame)
+        self.frames.append([(p.hand_id, p.points.copy()) for p in poses])
+        return poses
+
+    def set_filter(self, preset):
+        return self.tracker.set_filter(preset)
+
+    def draw_hand(self, frame):
+        self.tracker.draw_hand(frame)
+
+
+def run(cap, tracker, frames=None):
+    app = App(cap, tracker, display=NullDisplay())
+    scene = DrawingScene()
+    app.start(scene)
+    count = 0
+    while app.stack and (frames is None or count < frames) and app.tick():
+        count += 1
+    return scene.canvas.image()
+
+
+def record(path, save_frames):
+    # Room for every frame: a dropped record would (rightly) break replay identity
+    recorder = Recorder(path, save_frames=save_frames, queue_size=FRAMES + 1)
+    log = PoseLog(RecordingTracker(ScriptedTracker(stroke_script), recorder))
+    cost = []
+    record_call = recorder.record
+
+    def timed(*args):
+        start = time.perf_counter()
+        record_call(*args)
+        cost.append((time.perf_counter() - start) * 1e6)
+
+    recorder.record = timed
+    canvas = run(SyntheticCapture(), log, FRAMES)
+    recorder.close()
+    return log, canvas, recorder, cost
+
+
+def main():
+    ok = True
+    with tempfile.TemporaryDirectory() as folder:
+        for save_frames in (False, True):
+            path = os.path.join(folder, f"session_{save_frames}.rec")
+            live, live_canvas, recorder, cost = record(path, save_frames)
+            size = os.path.getsize(path)
+
+            replay = PoseLog(ReplaySource(path).tracker)
+            source = replay.tracker.source
+            start = time.perf_counter()
+            replay_canvas = run(source, replay)
+            replay_fps = len(replay.frames) / (time.perf_counter() - start)
+
+            same_poses = len(live.frames) == len(replay.frames) and all(
+                len(a) == len(b) and all(ia == ib and np.array_equal(pa, pb) for (ia, pa), (ib, pb) in zip(a, b))
+                for a, b in zip(live.frames, replay.frames))
+            same_canvas = np.array_equal(live_canvas, replay_canvas)
+            ok = ok and same_poses and same_canvas
+
+            mode = "landmarks + frames" if save_frames else "landmarks only"
+            print(f"{mode:>18}: record p50 {np.median(cost):.1f} us / p99 {np.percentile(cost, 99):.1f} us "
+                  f"on the lesson thread, {size / max(recorder.frames, 1):.0f} bytes/frame, "
+                  f"{recorder.dropped} dropped")
+            print(f"{'':>18}  replay {replay_fps:.0f} fps, poses identical: {same_poses}, "
+                  f"canvas identical: {same_canvas}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
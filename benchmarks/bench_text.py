@@ -0,0 +1,63 @@
+"""
+Static label cost: cv2.putText (Hershey) vs. the TrueType TextRenderer,
+per label and for a whole lesson screen through a TextBatch. Also shows
+the one-off cold cost of rendering a string the first time.
+
+    python -m benchmarks.bench_text
+"""
+import time
+import cv2
+import numpy as np
+from modules.text_renderer import TextRenderer, TextBatch
+
+FRAMES = 2000
+FONT = cv2.FONT_HERSHEY_SIMPLEX
+
+# (text, org, Hershey scale, thickness, TTF size, weight, colour), as in the lessons
+LABELS = [
+    ("What is 4 + 7?", (30, 70), 1.5, 4, 46, 2, (0, 120, 255)),
+    ("BACK", (520, 60), 1.0, 2, 32, 1, (0, 0, 255)),
+    ("11", (100, 305), 2.0, 4, 62, 2, (0, 0, 0)),
+    ("Score: 3  Lives: 2", (20, 40), 1.0, 2, 32, 1, (50, 50, 255)),
+    ("Selected: CA", (20, 455), 1.0, 2, 32, 1, (0, 50, 200)),
+]
+
+
+def per_frame_us(fn, frame):
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        fn(frame)
+    return (time.perf_counter() - start) / FRAMES * 1e6
+
+
+def main():
+    frame = np.random.default_rng(0).integers(0, 256, (480, 640, 3), dtype=np.uint8)
+    renderer = TextRenderer()
+
+    print(f"{'label':>20} {'putText us':>11} {'ttf cold ms':>12} {'ttf warm us':>12}")
+    for text, org, scale, thickness, size, weight, color in LABELS:
+        hershey = per_frame_us(lambda f: cv2.putText(f, text, org, FONT, scale, color, thickness), frame.copy())
+        start = time.perf_counter()
+        renderer.render(text, size, color, weight)
+        cold = (time.perf_counter() - start) * 1000
+        warm = per_frame_us(lambda f: renderer.draw(f, text, org, size, color, weight), frame.copy())
+        print(f"{text:>20} {hershey:>11.1f} {cold:>12.2f} {warm:>12.1f}")
+
+    def hershey_screen(f):
+        for text, org, scale, thickness, _, _, color in LABELS:
+            cv2.putText(f, text, org, FONT, scale, color, thickness)
+
+    batch = TextBatch(renderer)
+
+    def batched_screen(f):
+        for text, org, _, _, size, weight, color in LABELS:
+            batch.add(text, org, size, color, weight)
+        batch.draw(f)
+
+    print(f"\nwhole screen ({len(LABELS)} labels): putText {per_frame_us(hershey_screen, frame.copy()):.1f} us, "
+          f"TextBatch {per_frame_us(batched_screen, frame.copy()):.1f} us")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,107 @@
+"""
+Tracing scorer accuracy and cost on synthetic traces.
+
+For every digit, good traces follow the reference path with hand jitter
+(after walking the finger in from off the template); bad traces are a
+random scribble, the path traced backwards, the first 40% of it, a flat
+line, a finger held still and every other digit's path. Good traces
+must all pass and the generated bad ones must all fail; other digits are
+reported as a confusion rate. Also times template building, scoring and
+the trail ring buffer against the old list with pop(0). Exits 1 when a
+check fails:
+
+    python -m benchmarks.bench_tracing
+"""
+import time
+import numpy as np
+from modules.numbers.trace_scoring import (DIGIT_PATHS, TEMPLATE_SIZE, TrailBuffer, TraceTemplate,
+                                           _resample, _strokes, score_trace)
+
+ORIGIN = (220, 90)   # Where TracingScene puts the template on a 640 x 480 frame
+SPEED = 8            # px the finger moves per frame
+JITTER = 3.0         # px of hand tremor
+SEEDS = 5
+
+
+def trace(strokes, rng, jitter=JITTER, approach=True):
+    # Frame-by-frame finger positions along strokes, in frame pixels
+    points, _ = _resample(strokes, SPEED)
+    if approach:
+        walk_in = np.linspace((-60, TEMPLATE_SIZE[1] + 60), points[0], 12)
+        points = np.concatenate((walk_in, points))
+    return points + rng.normal(0, jitter, points.shape) + ORIGIN
+
+
+def bad_traces(digit, rng):
+    w, h = TEMPLATE_SIZE
+    strokes = _strokes(DIGIT_PATHS[digit], TEMPLATE_SIZE)
+    path, _ = _resample(strokes, SPEED)
+    return {
+        "scribble": rng.uniform((0, 0), (w, h), (60, 2)) + ORIGIN,
+        "reversed": trace([path[::-1]], rng),
+        "partial": trace([path[:int(len(path) * 0.4)]], rng),
+        "flat line": trace([np.float32([(0, h / 2), (w, h / 2)])], rng),
+        "held still": np.full((60, 2), (w / 2, h / 2), np.float32) + rng.normal(0, 1, (60, 2)) + ORIGIN,
+    }
+
+
+def main():
+    ok = True
+    start = time.perf_counter()
+    templates = {digit: TraceTemplate.for_digit(digit) for digit in DIGIT_PATHS}
+    build_ms = (time.perf_counter() - start) * 1000 / len(templates)
+
+    good_scores, missed, wrongly_passed, timings = [], [], [], []
+    confused = compared = 0
+    for digit, template in templates.items():
+        for seed in range(SEEDS):
+            rng = np.random.default_rng(seed)
+            good = trace(_strokes(DIGIT_PATHS[digit], TEMPLATE_SIZE), rng)
+            start = time.perf_counter()
+            result = score_trace(template, good, ORIGIN)
+            timings.append((time.perf_counter() - start) * 1000)
+            good_scores.append(result.score)
+            if not result.passed:
+                missed.append((digit, result))
+
+            for kind, points in bad_traces(digit, rng).items():
+                result = score_trace(template, points, ORIGIN)
+                if result.passed:
+                    wrongly_passed.append((digit, kind, result))
+
+            for other in DIGIT_PATHS:
+                if other != digit:
+                    result = score_trace(template, trace(_strokes(DIGIT_PATHS[other], TEMPLATE_SIZE), rng), ORIGIN)
+                    confused += result.passed
+                    compared += 1
+
+    ok = ok and not missed and not wrongly_passed
+    print(f"template build {build_ms:.2f} ms per digit, score p50 {np.median(timings):.3f} ms / "
+          f"p99 {np.percentile(timings, 99):.3f} ms per trace")
+    print(f"good traces: {len(good_scores) - len(missed)}/{len(good_scores)} passed, "
+          f"score p50 {np.median(good_scores):.0f}, min {min(good_scores)}")
+    for digit, result in missed:
+        print(f"  missed {digit}: {result}")
+    print(f"bad traces passed: {len(wrongly_passed)}")
+    for digit, kind, result in wrongly_passed:
+        print(f"  {kind} on {digit}: {result}")
+    print(f"another digit's path passed: {confused}/{compared} ({100 * confused / compared:.1f}%)")
+
+    # Trail: ring buffer vs list.pop(0), at the ring's capacity
+    buffer, trail, capacity = TrailBuffer(), [], TrailBuffer().capacity
+    start = time.perf_counter()
+    for i in range(20000):
+        buffer.append((i, i))
+    ring_us = (time.perf_counter() - start) * 1e6 / 20000
+    start = time.perf_counter()
+    for i in range(20000):
+        trail.append((i, i))
+        if len(trail) > capacity:
+            trail.pop(0)
+    list_us = (time.perf_counter() - start) * 1e6 / 20000
+    print(f"trail append ({capacity} points): ring {ring_us:.2f} us, list + pop(0) {list_us:.2f} us")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,93 +1,93 @@
 import cv2
-import time
 from modules.hand_tracker import HandTracker
-from modules.menu import Menu
-from modules.sound_player import play_sound
+from modules.capture_pipeline import CapturePipeline
+from modules.menu import MenuScene
+from modules.runtime import App
+from modules.recording import Recorder, RecordingTracker
+from modules.profiler import get_profiler
+from modules.sound_player import preload_sounds
+from modules.learner import get_learner
 
 # 🎓 Lesson Modules
-from modules.shapes_colors import run_shapes_colors
-from modules.numbers.numbers import run_numbers      # ✅ Submenu for Numbers
-from modules.numbers.counting import run_counting    # ✅ Renamed from run_counting_game
-from modules.spellings import run_spellings
-from modules.drawing import run_drawing
+from modules.shapes_colors import ShapesColorsScene
+from modules.numbers.numbers import NumbersScene     # ✅ Submenu for Numbers
+from modules.numbers.counting import CountingScene
+from modules.spellings import SpellingsScene
+from modules.drawing import DrawingScene
 
-# 🟨 Setup Camera & Hand Tracker
-cap = cv2.VideoCapture(0)
-success, frame = cap.read()
-if not success:
-    print("❌ Failed to grab frame on startup.")
-    exit()
-
-h, w = frame.shape[:2]
-tracker = HandTracker()
-
-# 🧡 Main Menu Items
-menu_labels = [
-    "Shapes & Colors",
-    "Numbers",
-    "Counting",
-    "Spellings",
-    "Drawing",
-    "Quit"
-]
-menu = Menu(menu_labels, w, h)
-
-# 🟧 Main Loop
-while True:
-    success, frame = cap.read()
-    if not success:
-        print("❌ Failed to grab frame")
-        break
-
-    frame = cv2.flip(frame, 1)
-    landmarks = tracker.get_landmarks(frame)
-
-    # 🎨 Draw Menu
-    menu.draw(frame)
+# 🧵 Capture and hand tracking run on background threads; set False for the old serial loop
+THREADED_PIPELINE = True
 
-    # ✋ Check Pinch-Hold Selection
-    if landmarks and len(landmarks) >= 9:
-        x1, y1 = landmarks[4]  # Thumb tip
-        x2, y2 = landmarks[8]  # Index tip
-        cx, cy = (x1 + x2) // 2, (y1 + y2) // 2
-        dist = ((x1 - x2) ** 2 + (y1 - y2) ** 2) ** 0.5
+# 🎞 Record every frame's landmarks to this file (None = off); replay it with
+#    modules.recording.ReplaySource. RECORD_FRAMES also keeps JPEG frames.
+RECORD_SESSION = None   # e.g. "recordings/session.rec"
+RECORD_FRAMES = False
 
-        # 🔄 Update hover (with glow/sound in Menu class)
-        menu.update_hover(cx, cy)
+# ⏱ Time every stage of every frame; "p" shows the HUD. TRACE_FILE gets a
+#    Chrome trace (chrome://tracing) of the last spans on exit.
+PROFILE = False
+TRACE_FILE = None       # e.g. "trace.json"
 
-        # ✅ Detect press-and-hold gesture
-        if dist < 40:
-            selection = menu.update_selection_timer(cx, cy)
-            if selection:
-                print(f"✅ Selected: {selection}")
-                play_sound("assets/sounds/welcome.mp3")
+# 🧠 What the child knows (per-question accuracy, speed, spacing, level),
+#    kept between runs; None starts every run from scratch
+LEARNER_FILE = "cache/learner.json"
 
-                # 🚀 Launch the selected module
-                if selection == "Shapes & Colors":
-                    run_shapes_colors(cap, tracker)
-                elif selection == "Numbers":
-                    run_numbers(cap, tracker)  # ➕ Submenu with math modes
-                elif selection == "Counting":
-                    run_counting(cap, tracker)
-                elif selection == "Spellings":
-                    run_spellings(cap, tracker)
-                elif selection == "Drawing":
-                    run_drawing(cap, tracker)
-                elif selection == "Quit":
-                    break
-
-                time.sleep(1)  # ⏸ Prevent accidental re-entry
-
-    # ✋ Draw Hand Skeleton
-    tracker.draw_hand(frame)
-
-    # 👀 Show App Window
-    cv2.imshow("🟦 Touchless Tutor", frame)
-
-    # 🔚 Exit Key
-    if cv2.waitKey(1) & 0xFF == ord("q"):
-        break
+# 🟨 Setup Camera & Hand Tracker
+# 🔎 Detect on a 640px-wide copy, cropped around the last known hand;
+#    landmarks are mapped back to the full frame. Two children can share the screen.
+pipeline = CapturePipeline(0, HandTracker(max_num_hands=2, inference_width=640, roi_tracking=True),
+                           threaded=THREADED_PIPELINE)
+cap = pipeline                # Drop-in for cv2.VideoCapture
+tracker = pipeline.tracker    # Drop-in for HandTracker, never blocks on inference
+recorder = None
+if RECORD_SESSION:
+    recorder = Recorder(RECORD_SESSION, save_frames=RECORD_FRAMES)
+    tracker = RecordingTracker(tracker, recorder)
+
+profiler = get_profiler()
+profiler.enabled = PROFILE or bool(TRACE_FILE)
+
+learner = get_learner()
+if LEARNER_FILE and learner.load(LEARNER_FILE):
+    print(f"🧠 Loaded learner progress from {LEARNER_FILE}")
+
+# 🔊 Decode feedback sounds up front so no lesson waits on the first play
+preload_sounds([
+    "assets/sounds/welcome.mp3",
+    "assets/sounds/correct.mp3",
+    "assets/sounds/wrong.mp3",
+    "assets/sounds/well_done.mp3",
+])
+
+# 🧡 Main Menu: each item opens its lesson scene on top of the menu
+main_menu = MenuScene(
+    [
+        "Shapes & Colors",
+        "Numbers",
+        "Counting",
+        "Spellings",
+        "Drawing",
+        "Quit"
+    ],
+    {
+        "Shapes & Colors": ShapesColorsScene,
+        "Numbers": NumbersScene,      # ➕ Submenu with math modes
+        "Counting": CountingScene,
+        "Spellings": SpellingsScene,
+        "Drawing": DrawingScene,
+    },
+)
+
+# 🟧 One loop and one window for every scene; q / ESC steps back, Quit leaves
+App(cap, tracker, "🟦 Touchless Tutor").run(main_menu)
 
 # 🔒 Cleanup
+if LEARNER_FILE:
+    learner.save(LEARNER_FILE)
+if TRACE_FILE:
+    print(f"⏱ Wrote {profiler.export_chrome_trace(TRACE_FILE)} spans to {TRACE_FILE}")
+if recorder:
+    recorder.close()
+    print(f"🎞 Recorded {recorder.frames} frames to {RECORD_SESSION} ({recorder.dropped} dropped)")
 cap.release()
 cv2.destroyAllWindows()
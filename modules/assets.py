@@ -0,0 +1,144 @@
+import os
+import threading
+import time
+from collections import OrderedDict, deque
+from modules.compositing import Sprite
+
+ASSET_ROOT = "assets"
+IMAGE_BUDGET = 32 * 1024 * 1024  # Decoded sprites kept in memory
+
+
+def _nbytes(sprite):
+    return sum(a.nbytes for a in (sprite.color, sprite.inverse, sprite.mask) if a is not None)
+
+
+class AssetManager:
+    """
+    📦 One place to find and load assets.
+
+    The asset folder is listed once into a manifest, so existence checks
+    (e.g. "is there a hover sound for this label?") never touch the disk.
+    Images are decoded, resized and premultiplied once per (path, size)
+    and kept in an LRU cache within a byte budget; sounds are decoded by
+    the audio engine, which keeps its own budgeted cache.
+
+    Every load is timed as cold (from disk) or warm (from cache); see
+    stats() or run `python -m modules.assets`.
+    """
+
+    def __init__(self, root=ASSET_ROOT, image_budget=IMAGE_BUDGET):
+        self.root = os.path.normpath(root)
+        self.image_budget = image_budget
+        self.manifest = None   # normalized path -> size in bytes
+        self.sprites = OrderedDict()   # (path, size, binary) -> Sprite, LRU order
+        self.sprite_bytes = 0
+        self.timings = {"cold": deque(maxlen=1000), "warm": deque(maxlen=1000)}
+        self._lock = threading.Lock()
+
+    # === Manifest ===
+
+    def scan(self):
+        manifest = {}
+        for folder, _, files in os.walk(self.root):
+            for name in files:
+                path = os.path.normpath(os.path.join(folder, name))
+                manifest[path] = os.path.getsize(path)
+        self.manifest = manifest
+        return manifest
+
+    def _in_root(self, path):
+        return path == self.root or path.startswith(self.root + os.sep)
+
+    def exists(self, path):
+        path = os.path.normpath(path)
+        if not self._in_root(path):
+            return os.path.exists(path)  # e.g. generated TTS clips
+        if self.manifest is None:
+            self.scan()
+        return path in self.manifest
+
+    def list(self, folder):
+        if self.manifest is None:
+            self.scan()
+        folder = os.path.normpath(folder) + os.sep
+        return sorted(p for p in self.manifest if p.startswith(folder))
+
+    # === Images ===
+
+    def sprite(self, path, size=None, binary=False):
+        """
+        Decoded Sprite for path resized to size (w, h), or None if missing.
+        """
+        key = (os.path.normpath(path), size, binary)
+        start = time.perf_counter()
+        with self._lock:
+            sprite = self.sprites.get(key)
+            if sprite is not None:
+                self.sprites.move_to_end(key)
+                self.timings["warm"].append(time.perf_counter() - start)
+                return sprite
+        if not self.exists(key[0]):
+            return None
+
+        sprite = Sprite.load(key[0], size, binary)
+        if sprite is None:
+            return None
+        with self._lock:
+            if key not in self.sprites:
+                self.sprites[key] = sprite
+                self.sprite_bytes += _nbytes(sprite)
+                self._evict()
+            self.timings["cold"].append(time.perf_counter() - start)
+        return sprite
+
+    def _evict(self):
+        # Least recently used first, but always keep the newest sprite
+        while self.sprite_bytes > self.image_budget and len(self.sprites) > 1:
+            _, old = self.sprites.popitem(last=False)
+            self.sprite_bytes -= _nbytes(old)
+
+    def preload_images(self, paths, size=None, binary=False):
+        for path in paths:
+            self.sprite(path, size, binary)
+
+    # === Sounds ===
+
+    def preload_sounds(self, paths):
+        from modules.audio_engine import get_engine
+        get_engine().preload(p for p in paths if self.exists(p))
+
+    # === Reporting ===
+
+    def stats(self):
+        report = {}
+        for kind, samples in self.timings.items():
+            mean = sum(samples) / len(samples) * 1000 if samples else 0.0
+            report[kind] = {"count": len(samples), "mean_ms": mean}
+        report["sprites"] = len(self.sprites)
+        report["sprite_bytes"] = self.sprite_bytes
+        return report
+
+
+_assets = None
+_assets_lock = threading.Lock()
+
+
+def get_assets():
+    global _assets
+    with _assets_lock:
+        if _assets is None:
+            _assets = AssetManager()
+    return _assets
+
+
+if __name__ == "__main__":
+    # Load every image twice and report cold vs warm load times
+    assets = get_assets()
+    images = [p for p in assets.list(assets.root) if p.lower().endswith((".png", ".jpg", ".jpeg"))]
+    print(f"📦 {len(assets.manifest)} files in {assets.root}/, {len(images)} images")
+    assets.preload_images(images, (200, 200))
+    assets.preload_images(images, (200, 200))
+    report = assets.stats()
+    for kind in ("cold", "warm"):
+        print(f"  {kind}: {report[kind]['count']} loads, {report[kind]['mean_ms']:.3f} ms mean")
+    print(f"  cached: {report['sprites']} sprites, {report['sprite_bytes'] / 1024:.0f} KiB")
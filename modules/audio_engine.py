@@ -0,0 +1,255 @@
+import queue
+import threading
+import time
+from collections import OrderedDict
+import pygame
+
+# 🔊 Lanes: each one owns a mixer channel and a playback policy.
+#   priority     - higher priority clips stop "interruptible" clips on lower lanes
+#   policy       - "preempt": newest request replaces what is playing / waiting
+#                  "queue":   requests play one after another
+#   max_age      - requests older than this (seconds) are dropped as stale
+#   interruptible- may be cut off when a higher priority lane starts
+LANES = {
+    "hover":    {"priority": 0, "policy": "preempt", "max_age": 0.3, "interruptible": True},
+    "feedback": {"priority": 1, "policy": "preempt", "max_age": 1.5, "interruptible": False},
+    "voice":    {"priority": 2, "policy": "queue", "max_age": None, "interruptible": False},
+}
+
+_POLL_INTERVAL = 0.02
+
+# Decoded PCM kept in memory; least recently played clips are dropped first
+SOUND_BUDGET = 32 * 1024 * 1024
+
+
+class PlaybackHandle:
+    """
+    Returned by AudioEngine.play. wait() blocks until the clip has finished,
+    been stopped or been dropped; the caller never blocks otherwise.
+    """
+
+    def __init__(self, path, lane, priority, max_age=None, after=None, cache=True):
+        self.path = path
+        self.cache = cache
+        self.lane = lane
+        self.priority = priority
+        self.max_age = max_age
+        self.after = after
+        self.created = time.monotonic()
+        self.seq = 0
+        self.dropped = False
+        self._done = threading.Event()
+
+    def done(self):
+        return self._done.is_set()
+
+    def wait(self, timeout=None):
+        return self._done.wait(timeout)
+
+    def is_stale(self, now):
+        return self.max_age is not None and now - self.created > self.max_age
+
+    def _finish(self, dropped=False):
+        self.dropped = dropped
+        self._done.set()
+
+
+class AudioEngine:
+    """
+    Background audio player. All pygame.mixer calls happen on one worker
+    thread; play() only enqueues a request and returns a PlaybackHandle.
+    Decoded pygame.mixer.Sound objects are cached (LRU, within
+    sound_budget bytes) so each clip is normally loaded once.
+    """
+
+    def __init__(self, lanes=None, sound_budget=SOUND_BUDGET):
+        self.lanes = dict(lanes or LANES)
+        self.sound_budget = sound_budget
+        self._requests = queue.Queue()
+        self._sounds = OrderedDict()   # path -> (Sound, bytes)
+        self._sound_bytes = 0
+        self._channels = {}
+        self._playing = {}
+        self._pending = []
+        self._seq = 0
+        self._thread = None
+        self._lock = threading.Lock()
+        self.available = False
+
+    # === Public API ===
+
+    def start(self):
+        with self._lock:
+            if self._thread is not None:
+                return self
+            self._thread = threading.Thread(target=self._run, name="AudioEngine", daemon=True)
+            self._ready = threading.Event()
+            self._thread.start()
+        self._ready.wait(5)
+        return self
+
+    def play(self, path, lane="feedback", priority=None, max_age=None, after=None, cache=True):
+        """
+        Fire-and-forget playback. Use the returned handle's wait() to block.
+        'after' delays the clip until another handle has finished; cache=False
+        skips the decoded-sound cache for one-off files.
+        """
+        config = self.lanes[lane]
+        handle = PlaybackHandle(
+            path, lane,
+            config["priority"] if priority is None else priority,
+            config["max_age"] if max_age is None else max_age,
+            after,
+            cache,
+        )
+        self.start()
+        if not self.available:
+            handle._finish(dropped=True)
+            return handle
+        self._requests.put(("play", handle))
+        return handle
+
+    def preload(self, paths):
+        """Decodes the given clips on the worker thread ahead of first use."""
+        self.start()
+        self._requests.put(("preload", list(paths)))
+
+    def stop(self, lane=None):
+        self._requests.put(("stop", lane))
+
+    def shutdown(self, timeout=1.0):
+        if self._thread is None:
+            return
+        self._requests.put(("quit", None))
+        self._thread.join(timeout)
+        self._thread = None
+        self.available = False  # play() starts the engine again
+
+    # === Worker thread ===
+
+    def _run(self):
+        try:
+            if not pygame.mixer.get_init():
+                pygame.mixer.init()
+            pygame.mixer.set_num_channels(max(8, len(self.lanes)))
+            for i, lane in enumerate(self.lanes):
+                self._channels[lane] = pygame.mixer.Channel(i)
+            pygame.mixer.set_reserved(len(self.lanes))
+            self.available = True
+        except Exception as e:
+            print("❌ Audio unavailable:", e)
+        finally:
+            self._ready.set()
+
+        while self.available:
+            try:
+                command, arg = self._requests.get(timeout=_POLL_INTERVAL)
+            except queue.Empty:
+                command, arg = None, None
+
+            if command == "quit":
+                break
+            elif command == "play":
+                self._enqueue(arg)
+            elif command == "preload":
+                for path in arg:
+                    self._load(path)
+            elif command == "stop":
+                self._stop_lanes(arg)
+
+            self._reap()
+            self._dispatch()
+
+        for lane in list(self._playing):
+            self._stop_lanes(lane)
+        for handle in self._pending:
+            handle._finish(dropped=True)
+        self._pending = []
+
+    def _enqueue(self, handle):
+        if self.lanes[handle.lane]["policy"] == "preempt":
+            # Only the newest request of a preempting lane is worth playing
+            for old in [h for h in self._pending if h.lane == handle.lane]:
+                self._pending.remove(old)
+                old._finish(dropped=True)
+        handle.seq = self._seq
+        self._seq += 1
+        self._pending.append(handle)
+        self._pending.sort(key=lambda h: (-h.priority, h.seq))
+
+    def _load(self, path, cache=True):
+        cached = self._sounds.get(path)
+        if cached is not None:
+            self._sounds.move_to_end(path)
+            return cached[0]
+        try:
+            sound = pygame.mixer.Sound(path)
+        except Exception as e:
+            print(f"❌ Error loading sound {path}:", e)
+            return None
+        if cache:
+            frequency, size, channels = pygame.mixer.get_init()
+            nbytes = int(sound.get_length() * frequency) * channels * abs(size) // 8
+            self._sounds[path] = (sound, nbytes)
+            self._sound_bytes += nbytes
+            # A playing channel keeps its own reference, so eviction is safe
+            while self._sound_bytes > self.sound_budget and len(self._sounds) > 1:
+                _, (_, old_bytes) = self._sounds.popitem(last=False)
+                self._sound_bytes -= old_bytes
+        return sound
+
+    def _reap(self):
+        for lane, handle in list(self._playing.items()):
+            if not self._channels[lane].get_busy():
+                del self._playing[lane]
+                handle._finish()
+
+    def _stop_lanes(self, lane=None):
+        for name in ([lane] if lane else list(self._playing)):
+            handle = self._playing.pop(name, None)
+            if handle is not None:
+                self._channels[name].stop()
+                handle._finish()
+
+    def _dispatch(self):
+        now = time.monotonic()
+        for handle in list(self._pending):
+            if handle.after is not None and not handle.after.done():
+                continue
+            if handle.is_stale(now):
+                self._pending.remove(handle)
+                handle._finish(dropped=True)
+                continue
+
+            lane = handle.lane
+            current = self._playing.get(lane)
+            if current is not None:
+                if self.lanes[lane]["policy"] == "queue":
+                    continue
+                self._stop_lanes(lane)
+
+            self._pending.remove(handle)
+            sound = self._load(handle.path, handle.cache)
+            if sound is None:
+                handle._finish(dropped=True)
+                continue
+
+            # Higher priority clips cut off interruptible cues on lower lanes
+            for other, playing in list(self._playing.items()):
+                if self.lanes[other]["interruptible"] and playing.priority < handle.priority:
+                    self._stop_lanes(other)
+
+            self._channels[lane].play(sound)
+            self._playing[lane] = handle
+
+
+_engine = None
+_engine_lock = threading.Lock()
+
+
+def get_engine():
+    global _engine
+    with _engine_lock:
+        if _engine is None:
+            _engine = AudioEngine()
+    return _engine
@@ -0,0 +1,347 @@
+import math
+import cv2
+import numpy as np
+
+# 🎨 Drawing engine: strokes are kept as vector polylines (StrokeStore) and
+#    rasterized into a tiled, premultiplied ink layer (InkLayer). A new
+#    point only rasterizes its own segment, undo / redo only redraw the
+#    tiles under the stroke, and compositing only touches tiles that hold
+#    ink, so an empty canvas costs nothing per frame.
+
+TILE = 64               # Ink layer tile size in pixels
+SIMPLIFY_EPSILON = 1.0  # Max distance (px) a simplified stroke may stray
+MIN_STEP = 2.0          # Points closer than this to the last one are skipped
+COLORS = [(255, 0, 255), (0, 0, 255), (0, 200, 0), (255, 128, 0), (0, 220, 255), (0, 0, 0)]
+BRUSHES = [3, 6, 12]
+
+
+def simplify(points, epsilon=SIMPLIFY_EPSILON):
+    """
+    Ramer-Douglas-Peucker on an (n, 2) polyline; the end points are kept.
+    """
+    if len(points) < 3 or epsilon <= 0:
+        return points
+    simplified = cv2.approxPolyDP(points.reshape(-1, 1, 2), epsilon, False)
+    return simplified.reshape(-1, 2)
+
+
+def _grow(array, needed):
+    if needed <= len(array):
+        return array
+    grown = np.zeros((max(needed, 2 * len(array)),) + array.shape[1:], array.dtype)
+    grown[:len(array)] = array
+    return grown
+
+
+class StrokeStore:
+    """
+    Finished strokes in flat arrays: every point lives in one (n, 2)
+    float32 array and each stroke is a (start, end) slice of it plus its
+    colour, width and bounding box. The first `count` strokes are
+    visible; undo / redo move that cursor and a new stroke drops the
+    undone ones.
+    """
+
+    def __init__(self, capacity=64, point_capacity=4096):
+        self.points = np.zeros((point_capacity, 2), np.float32)
+        self.offsets = np.zeros((capacity, 2), np.int64)  # (start, end) into points
+        self.colors = np.zeros((capacity, 3), np.uint8)   # BGR
+        self.widths = np.zeros(capacity, np.int32)
+        self.boxes = np.zeros((capacity, 4), np.int32)    # x0, y0, x1, y1 (exclusive), brush included
+        self.count = 0   # Visible strokes
+        self.total = 0   # Visible + undone (redo-able) strokes
+
+    def __len__(self):
+        return self.count
+
+    def append(self, points, color, width):
+        self.total = self.count  # A new stroke forgets what was undone
+        start = int(self.offsets[self.count - 1, 1]) if self.count else 0
+        end = start + len(points)
+        self.points = _grow(self.points, end)
+        self.points[start:end] = points
+        i = self.count
+        for name in ("offsets", "colors", "widths", "boxes"):
+            setattr(self, name, _grow(getattr(self, name), i + 1))
+        self.offsets[i] = (start, end)
+        self.colors[i] = color
+        self.widths[i] = width
+        self.boxes[i] = stroke_box(points, width)
+        self.count = self.total = i + 1
+        return i
+
+    def stroke(self, i):
+        start, end = self.offsets[i]
+        return self.points[start:end], tuple(int(c) for c in self.colors[i]), int(self.widths[i])
+
+    def box(self, i):
+        return tuple(int(v) for v in self.boxes[i])
+
+    def undo(self):
+        if not self.count:
+            return None
+        self.count -= 1
+        return self.count
+
+    def redo(self):
+        if self.count >= self.total:
+            return None
+        self.count += 1
+        return self.count - 1
+
+    def clear(self):
+        self.count = self.total = 0
+
+    def intersecting(self, box):
+        # Visible strokes whose bounding box overlaps box, in drawing order
+        x0, y0, x1, y1 = box
+        boxes = self.boxes[:self.count]
+        hit = (boxes[:, 0] < x1) & (boxes[:, 2] > x0) & (boxes[:, 1] < y1) & (boxes[:, 3] > y0)
+        return np.flatnonzero(hit)
+
+
+def stroke_box(points, width):
+    pad = width / 2 + 2  # Anti-aliased edge included
+    x0, y0 = points.min(axis=0)
+    x1, y1 = points.max(axis=0)
+    return (math.floor(x0 - pad), math.floor(y0 - pad), math.ceil(x1 + pad), math.ceil(y1 + pad))
+
+
+class InkLayer:
+    """
+    Premultiplied ink raster like a Sprite (`color` = colour * alpha,
+    `inverse` = 255 - alpha) split into tile x tile tiles. `ink` marks
+    the tiles holding any ink; composite() blends only those, merged into
+    as few rectangles as possible.
+    """
+
+    def __init__(self, width, height, tile=TILE):
+        self.width, self.height, self.tile = width, height, tile
+        self.color = np.zeros((height, width, 3), np.uint8)
+        self.inverse = np.full((height, width, 3), 255, np.uint8)
+        self.ink = np.zeros((math.ceil(height / tile), math.ceil(width / tile)), bool)
+        self._rects = []  # Cached composite rectangles; None when ink changed
+
+    def _tiles(self, box):
+        # Tile rows / cols covered by a pixel box, clipped to the layer
+        x0, y0, x1, y1 = box
+        t = self.tile
+        rows, cols = self.ink.shape
+        return (slice(max(y0 // t, 0), min((y1 - 1) // t + 1, rows)),
+                slice(max(x0 // t, 0), min((x1 - 1) // t + 1, cols)))
+
+    def snap(self, box):
+        # Pixel box grown to whole tiles, clipped to the layer
+        rows, cols = self._tiles(box)
+        t = self.tile
+        return (cols.start * t, rows.start * t, min(cols.stop * t, self.width), min(rows.stop * t, self.height))
+
+    def draw(self, points, color, width, region=None):
+        """
+        Rasterize a polyline (or a dot for a single point) on top of the
+        ink. With region=(x0, y0, x1, y1) only pixels inside it change.
+        """
+        x0, y0 = (region[0], region[1]) if region else (0, 0)
+        pts = np.round(points - (x0, y0)).astype(np.int32)
+        if region:
+            color_view = self.color[region[1]:region[3], region[0]:region[2]]
+            inverse_view = self.inverse[region[1]:region[3], region[0]:region[2]]
+        else:
+            color_view, inverse_view = self.color, self.inverse
+        for target, value in ((color_view, color), (inverse_view, (0, 0, 0))):
+            if len(pts) == 1:
+                cv2.circle(target, tuple(int(v) for v in pts[0]), max(width // 2, 1), value, -1, cv2.LINE_AA)
+            else:
+                cv2.polylines(target, [pts], False, value, width, cv2.LINE_AA)
+        if region:
+            return
+        box = stroke_box(points, width)
+        if len(pts) > 2:
+            self.refresh(self.snap(box))  # A long stroke's box holds many empty tiles
+            return
+        rows, cols = self._tiles(box)
+        if not self.ink[rows, cols].all():
+            self.ink[rows, cols] = True
+            self._rects = None
+
+    def erase(self, box):
+        # Clear the tiles under box; returns the snapped region
+        region = self.snap(box)
+        x0, y0, x1, y1 = region
+        if x1 > x0 and y1 > y0:
+            self.color[y0:y1, x0:x1] = 0
+            self.inverse[y0:y1, x0:x1] = 255
+        return region
+
+    def refresh(self, region):
+        # Recompute which tiles in a snapped region still hold ink
+        rows, cols = self._tiles(region)
+        t = self.tile
+        for row in range(rows.start, rows.stop):
+            for col in range(cols.start, cols.stop):
+                self.ink[row, col] = self.inverse[row * t:(row + 1) * t, col * t:(col + 1) * t, 0].min() < 255
+        self._rects = None
+
+    def clear(self):
+        self.color[:] = 0
+        self.inverse[:] = 255
+        self.ink[:] = False
+        self._rects = []
+
+    def rects(self):
+        """
+        Inked tiles as pixel rectangles: runs of tiles along each row,
+        merged with the run below when they span the same columns.
+        """
+        if self._rects is not None:
+            return self._rects
+        t = self.tile
+        open_runs, rects = {}, []  # (col0, col1) -> [row0, row1]
+        for row, line in enumerate(self.ink):
+            runs = set()
+            cols = np.flatnonzero(line)
+            if len(cols):
+                breaks = np.flatnonzero(np.diff(cols) > 1)
+                starts = np.concatenate(([cols[0]], cols[breaks + 1]))
+                ends = np.concatenate((cols[breaks], [cols[-1]])) + 1
+                runs = set(zip(starts.tolist(), ends.tolist()))
+            for run in list(open_runs):
+                if run not in runs:
+                    rects.append((run, open_runs.pop(run)))
+            for run in runs:
+                open_runs.setdefault(run, [row, row + 1])[1] = row + 1
+        rects += open_runs.items()
+        self._rects = [(c0 * t, r0 * t, min(c1 * t, self.width), min(r1 * t, self.height))
+                       for (c0, c1), (r0, r1) in rects]
+        return self._rects
+
+    def composite(self, frame):
+        """
+        Blend the ink onto frame in place, only over inked tiles.
+        """
+        fh, fw = frame.shape[:2]
+        for x0, y0, x1, y1 in self.rects():
+            x1, y1 = min(x1, fw), min(y1, fh)
+            if x1 <= x0 or y1 <= y0:
+                continue
+            roi = frame[y0:y1, x0:x1]
+            cv2.multiply(roi, self.inverse[y0:y1, x0:x1], dst=roi, scale=1 / 255)
+            cv2.add(roi, self.color[y0:y1, x0:x1], dst=roi)
+        return frame
+
+
+class Canvas:
+    """
+    Strokes drawn by any number of hands at once, with undo / redo:
+
+        canvas = Canvas(w, h)
+        canvas.extend(hand_id, tip)   # While pinching
+        canvas.end(hand_id)           # Pinch released
+        canvas.composite(frame)
+
+    A stroke in progress is rasterized segment by segment; when it ends
+    it is simplified and stored. `color` and `brush` apply to strokes
+    started afterwards.
+    """
+
+    def __init__(self, width, height, color=COLORS[0], brush=BRUSHES[1], tile=TILE, epsilon=SIMPLIFY_EPSILON):
+        self.width, self.height = width, height
+        self.color = color
+        self.brush = brush
+        self.epsilon = epsilon
+        self.store = StrokeStore()
+        self.layer = InkLayer(width, height, tile)
+        self.live = {}  # key -> (points list, color, width)
+
+    def extend(self, key, point):
+        stroke = self.live.get(key)
+        if stroke is None:
+            stroke = self.live[key] = ([point], self.color, self.brush)
+            self.layer.draw(np.float32([point]), stroke[1], stroke[2])
+            return
+        points = stroke[0]
+        last = points[-1]
+        if math.hypot(point[0] - last[0], point[1] - last[1]) < MIN_STEP:
+            return
+        points.append(point)
+        self.layer.draw(np.float32([last, point]), stroke[1], stroke[2])
+
+    def end(self, key):
+        stroke = self.live.pop(key, None)
+        if stroke is None:
+            return None
+        points, color, width = stroke
+        return self.store.append(simplify(np.float32(points), self.epsilon), color, width)
+
+    def end_all(self):
+        for key in list(self.live):
+            self.end(key)
+
+    def undo(self):
+        i = self.store.undo()
+        if i is None:
+            return False
+        self._redraw(self.store.box(i))
+        return True
+
+    def redo(self):
+        i = self.store.redo()
+        if i is None:
+            return False
+        self._redraw(self.store.box(i))
+        return True
+
+    def clear(self):
+        self.store.clear()
+        self.live.clear()
+        self.layer.clear()
+
+    def _redraw(self, box):
+        # Rebuild the tiles under box from the visible and live strokes
+        region = self.layer.erase(box)
+        if region[2] <= region[0] or region[3] <= region[1]:
+            return
+        for i in self.store.intersecting(region):
+            self.layer.draw(*self.store.stroke(i), region=region)
+        for points, color, width in self.live.values():
+            self.layer.draw(np.float32(points), color, width, region=region)
+        self.layer.refresh(region)
+
+    def composite(self, frame):
+        return self.layer.composite(frame)
+
+    def strokes(self):
+        # Point arrays of the visible strokes, then those in progress
+        return ([self.store.stroke(i)[0] for i in range(len(self.store))] +
+                [np.float32(points) for points, _, _ in self.live.values()])
+
+    # === Export ===
+
+    def image(self):
+        """
+        The drawing as a BGRA image (transparent where there is no ink).
+        """
+        alpha = 255 - self.layer.inverse[:, :, 0]
+        bgr = cv2.divide(self.layer.color, cv2.merge([alpha, alpha, alpha]), scale=255)
+        return cv2.merge([*cv2.split(bgr), alpha])
+
+    def export_png(self, path):
+        return cv2.imwrite(path, self.image())
+
+    def export_svg(self, path):
+        lines = [f'<svg xmlns="http://www.w3.org/2000/svg" width="{self.width}" height="{self.height}" '
+                 f'viewBox="0 0 {self.width} {self.height}">']
+        for i in range(len(self.store)):
+            points, (b, g, r), width = self.store.stroke(i)
+            color = f"#{r:02x}{g:02x}{b:02x}"
+            if len(points) == 1:
+                x, y = points[0]
+                lines.append(f'<circle cx="{x:g}" cy="{y:g}" r="{max(width // 2, 1)}" fill="{color}"/>')
+                continue
+            coords = " ".join(f"{x:g},{y:g}" for x, y in points.tolist())
+            lines.append(f'<polyline points="{coords}" fill="none" stroke="{color}" stroke-width="{width}" '
+                         f'stroke-linecap="round" stroke-linejoin="round"/>')
+        lines.append("</svg>")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+        return len(self.store)
@@ -0,0 +1,295 @@
+import threading
+import time
+from collections import deque
+import cv2
+from modules.profiler import get_profiler
+from modules.frame_pool import FramePool
+
+READ_WAIT = 1 / 60     # Longest read() waits for a new camera frame before repeating the last one
+STARTUP_WAIT = 5.0     # ... and for the very first frame, while the camera opens
+
+
+class LatestQueue:
+    """
+    Bounded queue that drops the oldest item when full, so consumers only
+    ever see the freshest data. get() can wait for something newer than the
+    last sequence number the caller has seen. on_drop(item) is called for
+    every item pushed out.
+    """
+
+    def __init__(self, maxsize=1, on_drop=None):
+        self.maxsize = maxsize
+        self.on_drop = on_drop
+        self._items = deque(maxlen=maxsize)
+        self._cond = threading.Condition()
+        self._seq = 0
+        self.closed = False
+
+    def put(self, item):
+        with self._cond:
+            dropped = self._items[0] if len(self._items) == self.maxsize else None
+            self._seq += 1
+            self._items.append((self._seq, item))
+            self._cond.notify_all()
+            if dropped and self.on_drop:
+                self.on_drop(dropped[1])
+
+    def close(self):
+        with self._cond:
+            self.closed = True
+            self._cond.notify_all()
+
+    def latest(self):
+        with self._cond:
+            return self._items[-1] if self._items else (0, None)
+
+    def get_newer(self, seq, timeout=None, claim=None):
+        # Returns (seq, item) newer than 'seq', or the latest one on timeout / close.
+        # claim(item) runs under the lock on a newer item, before it can be dropped
+        with self._cond:
+            self._cond.wait_for(lambda: self._seq > seq or self.closed, timeout)
+            if not self._items:
+                return 0, None
+            latest = self._items[-1]
+            if claim and latest[0] > seq:
+                claim(latest[1])
+            return latest
+
+
+class FrameBuffers:
+    """
+    ♻️ Camera buffers with explicit owners.
+
+    A frame the camera filled is held by the frame queue until it is
+    dropped; read() and the inference worker claim it before using it and
+    release it when done. Only a buffer nobody holds goes back to the
+    camera, so a frame is never overwritten while someone still uses it.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._held = {}   # id(buffer) -> [buffer, owners]
+        self._free = []
+
+    def take(self):
+        # A buffer for the camera to fill, or None to let it allocate one
+        with self._lock:
+            return self._free.pop() if self._free else None
+
+    def claim(self, buffer):
+        with self._lock:
+            self._held.setdefault(id(buffer), [buffer, 0])[1] += 1
+
+    def release(self, buffer):
+        with self._lock:
+            entry = self._held[id(buffer)]
+            entry[1] -= 1
+            if not entry[1]:
+                del self._held[id(buffer)]
+                self._free.append(buffer)
+
+    def __len__(self):
+        with self._lock:
+            return len(self._held) + len(self._free)
+
+
+class TrackResult:
+    """
+    Landmarks published by the inference worker. frame_time is when the
+    frame was captured, done_time when inference finished on it.
+    """
+
+    def __init__(self, results, poses, frame_index, frame_time, done_time):
+        self.results = results
+        self.poses = poses
+        self.frame_index = frame_index
+        self.frame_time = frame_time
+        self.done_time = done_time
+
+    def age(self, now=None):
+        return (now or time.monotonic()) - self.frame_time
+
+
+class CapturePipeline:
+    """
+    Capture -> inference -> render, each on its own clock.
+
+    A capture thread keeps only the newest camera frame, an inference worker
+    runs the HandTracker on the newest frame it can get, and the render loop
+    calls read() / tracker.get_landmarks() exactly like it would with a
+    cv2.VideoCapture and a HandTracker, without ever waiting on inference.
+
+    'source' can be a camera index, a video file path or an opened capture.
+    threaded=False falls back to the old serial read-then-track behaviour.
+    """
+
+    def __init__(self, source, hand_tracker, threaded=True, flip=True,
+                 queue_size=1, realtime=None):
+        self.cap = source if hasattr(source, "read") else cv2.VideoCapture(source)
+        self.hand_tracker = hand_tracker
+        self.threaded = threaded
+        self.flip = flip
+        # Files are paced at their native FPS unless told otherwise
+        self.realtime = isinstance(source, str) if realtime is None else realtime
+        self.tracker = PipelineTracker(self)
+
+        self.buffers = FrameBuffers()
+        self.frames = LatestQueue(queue_size, on_drop=self._release_frame)
+        self.tracks = LatestQueue(queue_size)
+        self._last_read = 0
+        self._reading = None  # Frame read() last handed out, held until the next read()
+        self._running = False
+        self._threads = []
+
+    # === cv2.VideoCapture-compatible surface ===
+
+    def isOpened(self):
+        return self.cap.isOpened()
+
+    def get(self, prop):
+        return self.cap.get(prop)
+
+    def read(self, image=None):
+        # Serial mode reads into 'image' when given; threaded reads hand out
+        # the capture thread's buffers, left untouched until the next read()
+        # or release()
+        if not self.threaded:
+            return self.cap.read(image)
+        if not self._running:
+            self.start()
+
+        # Never hold the render loop up for more than about a frame: with
+        # no new camera frame yet, the last one is shown again
+        wait = READ_WAIT if self._last_read else STARTUP_WAIT
+        seq, item = self.frames.get_newer(self._last_read, timeout=wait, claim=self._claim_frame)
+        if item is None or (seq == self._last_read and self.frames.closed):
+            return False, None
+        if seq != self._last_read:
+            self._hand_back()
+            self._reading = item
+            self._last_read = seq
+        _, frame = self._reading
+        return True, frame
+
+    def release(self):
+        self.stop()
+        self._hand_back()
+        self.cap.release()
+
+    def _claim_frame(self, item):
+        self.buffers.claim(item[1])
+
+    def _release_frame(self, item):
+        self.buffers.release(item[1])
+
+    def _hand_back(self):
+        if self._reading is not None:
+            self._release_frame(self._reading)
+            self._reading = None
+
+    # === Threads ===
+
+    def start(self):
+        if self._running or not self.threaded:
+            return self
+        self._running = True
+        self._threads = [
+            threading.Thread(target=self._capture_loop, name="Capture", daemon=True),
+            threading.Thread(target=self._inference_loop, name="Inference", daemon=True),
+        ]
+        for t in self._threads:
+            t.start()
+        return self
+
+    def stop(self):
+        self._running = False
+        self.frames.close()
+        for t in self._threads:
+            t.join(timeout=1.0)
+        self._threads = []
+
+    def _capture_loop(self):
+        profiler = get_profiler()
+        fps = self.cap.get(cv2.CAP_PROP_FPS) if self.realtime else 0
+        period = 1.0 / fps if fps and fps > 0 else 0
+        next_due = time.monotonic()
+        # Frames are read into buffers nobody holds any more (see FrameBuffers);
+        # the queue holds each new one until it is dropped
+        while self._running:
+            with profiler.span("camera.read"):
+                ok, frame = self.cap.read(self.buffers.take())
+            if not ok:
+                break
+            self.buffers.claim(frame)
+            self.frames.put((time.monotonic(), frame))
+            if period:
+                next_due += period
+                delay = next_due - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+        self.frames.close()
+
+    def _inference_loop(self):
+        profiler = get_profiler()
+        pool = FramePool()
+        seq = 0
+        while self._running:
+            new_seq, item = self.frames.get_newer(seq, timeout=0.5, claim=self._claim_frame)
+            if new_seq == seq:
+                if self.frames.closed:
+                    break
+                continue
+            seq = new_seq
+            frame_time, frame = item
+            try:
+                if self.flip:
+                    frame = cv2.flip(frame, 1, dst=pool.like("flip", frame))
+                with profiler.span("tracker.process"):
+                    results = self.hand_tracker.process(frame)
+            finally:
+                self._release_frame(item)
+            self.tracks.put(TrackResult(results, self.hand_tracker.poses, seq,
+                                        frame_time, time.monotonic()))
+        self.tracks.close()
+
+    def latest_track(self):
+        return self.tracks.latest()[1]
+
+
+class PipelineTracker:
+    """
+    HandTracker stand-in for lessons: returns the most recently published
+    landmarks instead of running inference on the frame it is given.
+    """
+
+    def __init__(self, pipeline):
+        self.pipeline = pipeline
+        self.results = None
+        self.track = None
+
+    def get_poses(self, frame):
+        if not self.pipeline.threaded:
+            tracker = self.pipeline.hand_tracker
+            poses = tracker.get_poses(frame)
+            self.results = tracker.results
+            return poses
+
+        self.track = self.pipeline.latest_track()
+        if self.track is None:
+            self.results = None
+            return []
+        self.results = self.track.results
+        # Same landmark arrays, just mapped onto the frame the lesson renders
+        size = (frame.shape[1], frame.shape[0])
+        return self.pipeline.hand_tracker.filtered([pose.resized(size) for pose in self.track.poses])
+
+    def set_filter(self, preset):
+        return self.pipeline.hand_tracker.set_filter(preset)
+
+    def get_landmarks(self, frame):
+        poses = self.get_poses(frame)
+        return poses[0] if poses else None
+
+    def draw_hand(self, frame):
+        if self.track is not None:
+            self.pipeline.hand_tracker.draw_hand(frame, self.track.poses)
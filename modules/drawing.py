@@ -1,63 +1,119 @@
-import cv2
-import numpy as np
+import os
 import time
+import cv2
 from modules.sound_player import play_sound
+from modules.gestures import GestureEngine, boxes_hit_test, SELECT
+from modules.runtime import App, Scene
+from modules.canvas import Canvas, COLORS, BRUSHES
+from modules.recognizer import get_recognizer
 
-def run_drawing(cap, tracker):
-    canvas = None
-    prev_point = None
-    last_click = 0
-    back_button = (30, 30, 100, 60)
-
-    while True:
-        success, frame = cap.read()
-        if not success:
-            print("Failed to grab frame")
-            break
-
-        frame = cv2.flip(frame, 1)
-        h, w, _ = frame.shape
-        if canvas is None:
-            canvas = np.zeros_like(frame)
-
-        landmarks = tracker.get_landmarks(frame)
-
-        # Draw back button
-        x, y, bw, bh = back_button
-        cv2.rectangle(frame, (x, y), (x + bw, y + bh), (0, 0, 0), 2)
-        cv2.putText(frame, "BACK", (x + 10, y + 40), cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 0, 0), 2)
-
-        if landmarks and len(landmarks) >= 9:
-            x1, y1 = landmarks[4]   # Thumb tip
-            x2, y2 = landmarks[8]   # Index tip
-            cx, cy = (x1 + x2) // 2, (y1 + y2) // 2
-            dist = ((x1 - x2)**2 + (y1 - y2)**2) ** 0.5
+MAX_GUESS_STROKES = 4  # Past this it is a picture, not a letter
+
+SAVE_DIR = "drawings"
+
+class DrawingScene(Scene):
+    size = None                  # Full camera frame
+    tracking_filter = "drawing"  # Low-lag strokes
 
+    def __init__(self):
+        super().__init__()
+        self.canvas = None
+        self.back_button = (30, 30, 100, 60)
+        self.tools = [(name, (140 + 110 * i, 30, 100, 60)) for i, name in enumerate(["UNDO", "REDO", "CLEAR", "SAVE"])]
+        self.brushes = [(("BRUSH", size), (30, 110 + 70 * i, 60, 60)) for i, size in enumerate(BRUSHES)]
+        self.swatches = []
+        self.saved = None  # (message, until)
+        self.guess = None  # Digit or letter the strokes look like
+        self.gestures = GestureEngine(cooldown=1)
+
+    def enter(self, app):
+        super().enter(app)
+        w, h = app.frame_size
+        self.canvas = Canvas(w, h)
+        self.swatches = [(("COLOR", color), (w - 70, 30 + 60 * i, 50, 50)) for i, color in enumerate(COLORS)]
+        self.hit_test = boxes_hit_test([("BACK", self.back_button)] + self.tools + self.brushes + self.swatches)
+        get_recognizer()
+
+    def update(self, poses, events, dt):
+        for e in events:
+            if e.kind != SELECT:
+                continue
             # Back button pinch detection
-            if dist < 40 and x < cx < x + bw and y < cy < y + bh:
-                if time.time() - last_click > 1:
-                    play_sound("assets/sounds/welcome.mp3")
-                    break
-                last_click = time.time()
-
-            # Drawing
-            if dist < 40:
-                if prev_point:
-                    cv2.line(canvas, prev_point, (x2, y2), (255, 0, 255), 5)
-                prev_point = (x2, y2)
-            else:
-                prev_point = None
+            if e.target == "BACK":
+                play_sound("assets/sounds/welcome.mp3")
+                self.app.pop()
+                return
+            if e.target == "UNDO":
+                self.canvas.undo()
+            elif e.target == "REDO":
+                self.canvas.redo()
+            elif e.target == "CLEAR":
+                self.canvas.clear()
+            elif e.target == "SAVE":
+                self.save()
+            elif isinstance(e.target, tuple):
+                kind, value = e.target
+                if kind == "COLOR":
+                    self.canvas.color = value
+                else:
+                    self.canvas.brush = value
 
-        # Draw instructions
-        cv2.putText(frame, "Draw with Index & Thumb - Pinch BACK to return", (10, h - 20), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0,255,255), 2)
+        # Drawing: every pinching hand away from the buttons draws its own stroke
+        drawing = set()
+        for pose in poses:
+            state = self.gestures.state(pose.hand_id)
+            if state.pinching and state.target is None:
+                self.canvas.extend(pose.hand_id, pose[8])  # Index tip
+                drawing.add(pose.hand_id)
+        for hand_id in list(self.canvas.live):
+            if hand_id not in drawing:
+                self.canvas.end(hand_id)
 
-        # Combine canvas with live frame
-        combined = cv2.addWeighted(frame, 0.5, canvas, 0.5, 0)
+        # Live guess of the letter or digit being written
+        strokes = self.canvas.strokes()
+        self.guess = None
+        if 0 < len(strokes) <= MAX_GUESS_STROKES:
+            self.guess = get_recognizer().recognize(strokes)[0]
 
-        tracker.draw_hand(combined)
+    def save(self):
+        self.canvas.end_all()
+        os.makedirs(SAVE_DIR, exist_ok=True)
+        path = os.path.join(SAVE_DIR, time.strftime("drawing_%Y%m%d_%H%M%S"))
+        self.canvas.export_png(path + ".png")
+        self.canvas.export_svg(path + ".svg")
+        print(f"💾 Saved {path}.png / .svg")
+        play_sound("assets/sounds/well_done.mp3")
+        self.saved = ("Saved!", time.time() + 1.5)
 
-        cv2.imshow("Drawing", combined)
-        if cv2.waitKey(1) & 0xFF == ord('q'):
-            break
+    def render(self, frame):
+        h = frame.shape[0]
 
-    cv2.destroyWindow("Drawing")
+        # Ink first, only over the tiles that hold any, then the UI on top
+        self.canvas.composite(frame)
+
+        # Draw back button and tools
+        for name, (x, y, bw, bh) in [("BACK", self.back_button)] + self.tools:
+            cv2.rectangle(frame, (x, y), (x + bw, y + bh), (0, 0, 0), 2)
+            cv2.putText(frame, name, (x + 8, y + 40), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0, 0, 0), 2)
+
+        # Brush sizes and colours; the current ones are outlined in white
+        for (_, size), (x, y, bw, bh) in self.brushes:
+            selected = size == self.canvas.brush
+            cv2.rectangle(frame, (x, y), (x + bw, y + bh), (255, 255, 255) if selected else (0, 0, 0), 2)
+            cv2.circle(frame, (x + bw // 2, y + bh // 2), max(size // 2, 1), self.canvas.color, -1, cv2.LINE_AA)
+        for (_, color), (x, y, bw, bh) in self.swatches:
+            cv2.rectangle(frame, (x, y), (x + bw, y + bh), color, -1)
+            if color == self.canvas.color:
+                cv2.rectangle(frame, (x - 3, y - 3), (x + bw + 3, y + bh + 3), (255, 255, 255), 2)
+
+        if self.guess:
+            cv2.putText(frame, f"Looks like: {self.guess}", (140, frame.shape[0] - 60),
+                        cv2.FONT_HERSHEY_SIMPLEX, 1, (255, 255, 255), 2)
+        if self.saved and time.time() < self.saved[1]:
+            cv2.putText(frame, self.saved[0], (140, 130), cv2.FONT_HERSHEY_SIMPLEX, 1.2, (0, 255, 0), 3)
+
+        # Draw instructions
+        cv2.putText(frame, "Draw with Index & Thumb - Pinch BACK to return", (10, h - 20), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0,255,255), 2)
+
+def run_drawing(cap, tracker):
+    App(cap, tracker).run(DrawingScene())
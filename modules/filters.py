@@ -0,0 +1,162 @@
+import math
+import time
+import numpy as np
+from modules.hand_pose import HandPose
+
+# 🎚 Per-lesson tuning. Coordinates are normalized (0..1), speeds in screens/second.
+#   min_cutoff - smoothing when the hand is still (lower = steadier, laggier)
+#   beta       - how fast smoothing relaxes as the hand speeds up
+#   prediction - max seconds to extrapolate towards the expected display time
+FILTER_PRESETS = {
+    "raw":     None,
+    "menu":    {"kind": "one_euro", "min_cutoff": 0.6, "beta": 4.0, "prediction": 0.0},
+    "lesson":  {"kind": "one_euro", "min_cutoff": 1.0, "beta": 8.0, "prediction": 0.02},
+    "drawing": {"kind": "one_euro", "min_cutoff": 2.5, "beta": 20.0, "prediction": 0.05},
+    "kalman":  {"kind": "kalman", "process_noise": 2.0, "measurement_noise": 1e-5, "prediction": 0.04},
+}
+
+# Assume the frame we are building is shown about one 60 Hz refresh from now
+DISPLAY_DELAY = 1 / 60
+
+
+def _alpha(cutoff, dt):
+    tau = 1.0 / (2 * math.pi * cutoff)
+    return 1.0 / (1.0 + tau / dt)
+
+
+class OneEuroFilter:
+    """
+    One Euro filter (Casiez et al.) applied element-wise to a whole array,
+    so all 21 landmarks are smoothed in a couple of NumPy operations.
+    """
+
+    def __init__(self, min_cutoff=1.0, beta=0.0, d_cutoff=1.0):
+        self.min_cutoff = min_cutoff
+        self.beta = beta
+        self.d_cutoff = d_cutoff
+        self.x = None
+        self.dx = None
+        self.t = None
+
+    def update(self, x, t):
+        x = np.asarray(x, dtype=np.float32)
+        if self.x is None:
+            self.x, self.dx, self.t = x.copy(), np.zeros_like(x), t
+            return self.x
+        dt = t - self.t
+        if dt <= 0:
+            return self.x
+        dx = (x - self.x) / dt
+        self.dx += _alpha(self.d_cutoff, dt) * (dx - self.dx)
+        cutoff = self.min_cutoff + self.beta * np.abs(self.dx)
+        tau = 1.0 / (2 * np.pi * cutoff)
+        a = 1.0 / (1.0 + tau / dt)
+        self.x += a * (x - self.x)
+        self.t = t
+        return self.x
+
+    def predict(self, horizon):
+        return self.x + self.dx * horizon
+
+
+class KalmanFilter:
+    """
+    Constant-velocity Kalman filter per coordinate, vectorized. Each
+    coordinate has its own 2x2 covariance stored as three arrays.
+    """
+
+    def __init__(self, process_noise=2.0, measurement_noise=1e-5):
+        self.q = process_noise
+        self.r = measurement_noise
+        self.x = None
+        self.t = None
+
+    def update(self, z, t):
+        z = np.asarray(z, dtype=np.float32)
+        if self.x is None:
+            self.x, self.v = z.copy(), np.zeros_like(z)
+            self.p00 = np.full_like(z, self.r)
+            self.p01 = np.zeros_like(z)
+            self.p11 = np.full_like(z, 1.0)
+            self.t = t
+            return self.x
+        dt = t - self.t
+        if dt <= 0:
+            return self.x
+
+        # Predict (white-noise acceleration model)
+        self.x += self.v * dt
+        q = self.q
+        p00 = self.p00 + dt * (2 * self.p01 + dt * self.p11) + q * dt ** 4 / 4
+        p01 = self.p01 + dt * self.p11 + q * dt ** 3 / 2
+        p11 = self.p11 + q * dt ** 2
+
+        # Correct with the measured position
+        s = p00 + self.r
+        k0, k1 = p00 / s, p01 / s
+        innovation = z - self.x
+        self.x += k0 * innovation
+        self.v += k1 * innovation
+        self.p00 = (1 - k0) * p00
+        self.p01 = (1 - k0) * p01
+        self.p11 = p11 - k1 * p01
+        self.t = t
+        return self.x
+
+    def predict(self, horizon):
+        return self.x + self.v * horizon
+
+
+def make_filter(preset):
+    config = FILTER_PRESETS[preset] if isinstance(preset, str) else preset
+    if config is None:
+        return None
+    return PoseFilter(**config)
+
+
+class PoseFilter:
+    """
+    Smooths HandPose streams, one filter per hand_id. A filter is only
+    updated when a pose carries a new timestamp, but every call extrapolates
+    to the expected display time, so repeated renders of the same inference
+    result still move with the hand.
+    """
+
+    def __init__(self, kind="one_euro", prediction=0.0, max_missing=0.5, **params):
+        self.kind = kind
+        self.prediction = prediction
+        self.max_missing = max_missing
+        self.params = params
+        self.hands = {}  # hand_id -> (filter, last timestamp)
+
+    def _new_filter(self):
+        if self.kind == "kalman":
+            return KalmanFilter(**self.params)
+        return OneEuroFilter(**self.params)
+
+    def reset(self):
+        self.hands = {}
+
+    def apply(self, poses, now=None):
+        now = time.monotonic() if now is None else now
+        filtered = []
+        for pose in poses:
+            entry = self.hands.get(pose.hand_id)
+            if entry is None:
+                entry = (self._new_filter(), None)
+            filt, last = entry
+            if pose.timestamp != last:
+                filt.update(pose.points, pose.timestamp)
+            self.hands[pose.hand_id] = (filt, pose.timestamp)
+
+            points = filt.x.copy()
+            if self.prediction:
+                horizon = min(self.prediction, max(0.0, now + DISPLAY_DELAY - pose.timestamp))
+                points = filt.predict(horizon)
+            filtered.append(HandPose(points, (pose.width, pose.height), pose.handedness,
+                                     pose.score, pose.timestamp, pose.hand_id))
+
+        for hand_id, (filt, last) in list(self.hands.items()):
+            if last is not None and now - last > self.max_missing:
+                del self.hands[hand_id]
+        return filtered
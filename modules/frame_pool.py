@@ -0,0 +1,41 @@
+from collections import OrderedDict
+import numpy as np
+
+MAX_BUFFERS = 16  # Per pool; the least recently used shape is dropped first
+
+
+class FramePool:
+    """
+    ♻️ Reusable destination arrays for per-frame OpenCV calls.
+
+        small = cv2.resize(frame, size, dst=pool.get("small", (h, w, 3)))
+
+    Each name keeps one buffer per shape, so a frame-sized buffer is
+    allocated once and then overwritten every frame instead of a fresh
+    array (and page faults) each time. A buffer is only valid until the
+    next get() with the same name and shape; copy what must outlive it.
+    One pool per thread.
+    """
+
+    def __init__(self, max_buffers=MAX_BUFFERS):
+        self.max_buffers = max_buffers
+        self.buffers = OrderedDict()  # (name, shape, dtype) -> array
+        self.allocations = 0
+
+    def get(self, name, shape, dtype=np.uint8):
+        key = (name, tuple(shape), np.dtype(dtype).str)
+        buffer = self.buffers.get(key)
+        if buffer is None:
+            buffer = self.buffers[key] = np.empty(shape, dtype)
+            self.allocations += 1
+            if len(self.buffers) > self.max_buffers:
+                self.buffers.popitem(last=False)
+        else:
+            self.buffers.move_to_end(key)
+        return buffer
+
+    def like(self, name, array):
+        return self.get(name, array.shape, array.dtype)
+
+    def nbytes(self):
+        return sum(buffer.nbytes for buffer in self.buffers.values())
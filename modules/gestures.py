@@ -0,0 +1,133 @@
+import time
+from modules.widgets import WidgetRegistry
+
+# 🖐 Event kinds emitted by GestureEngine.update()
+HOVER = "hover"                  # Cursor moved onto a new target (target may be None)
+PINCH_START = "pinch_start"
+HOLD_PROGRESS = "hold_progress"  # Pinch held on a target; progress goes 0 -> 1
+SELECT = "select"
+RELEASE = "release"
+
+# Pinch thresholds as a fraction of hand size (wrist -> middle knuckle).
+# At a normal distance from the camera the hand is ~100px, so 0.4 matches
+# the old fixed 40px test; the gap between on/off stops flicker at the edge.
+PINCH_ON = 0.4
+PINCH_OFF = 0.5
+
+
+def is_pinching(pose, was_pinching=False):
+    threshold = PINCH_OFF if was_pinching else PINCH_ON
+    return pose.pinch_distance() < threshold * max(pose.hand_size(), 1.0)
+
+
+def boxes_hit_test(boxes):
+    """
+    Hit test over a list of (target, (x, y, w, h)); first match wins.
+    Build it once per screen, not per frame.
+    """
+    return WidgetRegistry(boxes)
+
+
+class GestureEvent:
+    __slots__ = ("kind", "hand_id", "target", "x", "y", "progress")
+
+    def __init__(self, kind, hand_id, target, x, y, progress=0.0):
+        self.kind = kind
+        self.hand_id = hand_id
+        self.target = target
+        self.x = x
+        self.y = y
+        self.progress = progress
+
+
+class HandGesture:
+    """
+    Gesture state of one hand, kept between frames.
+    """
+    __slots__ = ("x", "y", "target", "pinching", "hold_start", "fired",
+                 "last_select", "seen")
+
+    def __init__(self):
+        self.x = self.y = 0
+        self.target = None
+        self.pinching = False
+        self.hold_start = None
+        self.fired = False
+        self.last_select = float("-inf")
+        self.seen = 0.0
+
+
+class GestureEngine:
+    """
+    Turns a stream of HandPoses into hover / pinch / hold / select events,
+    one pass per frame for every hand.
+
+    hold_time > 0: a pinch must stay on the same target that long to select
+                   (HOLD_PROGRESS events report how far along it is).
+    hold_time = 0: pinching on a target selects straight away (a "click").
+    cooldown:      minimum seconds between two selects of the same hand.
+    Each pinch selects at most once; release or move to a new target to
+    select again.
+    """
+
+    def __init__(self, hold_time=0.0, cooldown=1.0, max_missing=0.5):
+        self.hold_time = hold_time
+        self.cooldown = cooldown
+        self.max_missing = max_missing
+        self.hands = {}  # hand_id -> HandGesture
+
+    def reset(self):
+        self.hands = {}
+
+    def state(self, hand_id):
+        return self.hands.get(hand_id)
+
+    def update(self, poses, hit_test=None, now=None):
+        now = time.time() if now is None else now
+        events = []
+        for pose in poses:
+            state = self.hands.get(pose.hand_id)
+            if state is None:
+                state = self.hands[pose.hand_id] = HandGesture()
+            state.seen = now
+            x, y = state.x, state.y = pose.pinch_center()
+            hand_id = pose.hand_id
+
+            target = hit_test(x, y) if hit_test else None
+            pinching = is_pinching(pose, state.pinching)
+
+            if target != state.target:
+                state.target = target
+                state.hold_start = now if pinching else None
+                state.fired = False
+                events.append(GestureEvent(HOVER, hand_id, target, x, y))
+
+            if pinching and not state.pinching:
+                state.hold_start = now
+                state.fired = False
+                events.append(GestureEvent(PINCH_START, hand_id, target, x, y))
+            elif state.pinching and not pinching:
+                state.hold_start = None
+                state.fired = False
+                events.append(GestureEvent(RELEASE, hand_id, target, x, y))
+            state.pinching = pinching
+
+            if pinching and target is not None and not state.fired:
+                progress = 1.0
+                if self.hold_time > 0:
+                    progress = min((now - state.hold_start) / self.hold_time, 1.0)
+                    events.append(GestureEvent(HOLD_PROGRESS, hand_id, target, x, y, progress))
+                if progress >= 1.0 and now - state.last_select >= self.cooldown:
+                    state.fired = True
+                    state.last_select = now
+                    events.append(GestureEvent(SELECT, hand_id, target, x, y, 1.0))
+
+        # Hands that left the camera release whatever they were holding
+        for hand_id, state in list(self.hands.items()):
+            if now - state.seen > self.max_missing:
+                if state.pinching:
+                    events.append(GestureEvent(RELEASE, hand_id, state.target, state.x, state.y))
+                if state.target is not None:
+                    events.append(GestureEvent(HOVER, hand_id, None, state.x, state.y))
+                del self.hands[hand_id]
+        return events
@@ -0,0 +1,199 @@
+import time
+import cv2
+import numpy as np
+
+# ✋ MediaPipe hand landmark indices
+WRIST = 0
+THUMB_TIP = 4
+INDEX_MCP = 5
+INDEX_TIP = 8
+MIDDLE_MCP = 9
+
+FINGER_TIPS = np.array([4, 8, 12, 16, 20])
+FINGER_PIPS = np.array([2, 6, 10, 14, 18])  # Thumb uses its MCP joint
+
+# Landmark pairs drawn by draw_poses, same as MediaPipe's HAND_CONNECTIONS
+HAND_CONNECTIONS = [
+    (0, 1), (1, 2), (2, 3), (3, 4),
+    (0, 5), (5, 6), (6, 7), (7, 8),
+    (5, 9), (9, 10), (10, 11), (11, 12),
+    (9, 13), (13, 14), (14, 15), (15, 16),
+    (13, 17), (0, 17), (17, 18), (18, 19), (19, 20),
+]
+
+
+class HandPose:
+    """
+    One tracked hand: 21 landmarks in a (21, 3) float32 array of
+    normalized x, y and relative z depth, plus the frame size they map to.
+
+    Indexing and iterating behave like the old list of (x, y) pixel tuples,
+    so existing code such as `x1, y1 = landmarks[4]` keeps working; the
+    pixel array behind it is computed once and shared.
+    """
+
+    __slots__ = ("points", "width", "height", "handedness", "score",
+                 "timestamp", "hand_id", "_pixels")
+
+    def __init__(self, points, frame_size, handedness=None, score=1.0,
+                 timestamp=None, hand_id=0):
+        self.points = np.asarray(points, dtype=np.float32).reshape(21, 3)
+        self.width, self.height = frame_size
+        self.handedness = handedness
+        self.score = score
+        self.timestamp = time.monotonic() if timestamp is None else timestamp
+        self.hand_id = hand_id
+        self._pixels = None
+
+    @classmethod
+    def from_mediapipe(cls, hand_landmarks, frame_size, handedness=None, timestamp=None):
+        label, score = None, 1.0
+        if handedness is not None:
+            label = handedness.classification[0].label
+            score = handedness.classification[0].score
+        points = np.array([(lm.x, lm.y, lm.z) for lm in hand_landmarks.landmark], dtype=np.float32)
+        return cls(points, frame_size, label, score, timestamp)
+
+    def resized(self, frame_size):
+        # Same landmarks (shared array) mapped to a different frame size
+        if frame_size == (self.width, self.height):
+            return self
+        return HandPose(self.points, frame_size, self.handedness, self.score,
+                        self.timestamp, self.hand_id)
+
+    # === Views ===
+
+    @property
+    def normalized(self):
+        return self.points[:, :2]
+
+    @property
+    def z(self):
+        return self.points[:, 2]
+
+    @property
+    def pixels(self):
+        if self._pixels is None:
+            scale = np.array([self.width, self.height], dtype=np.float32)
+            self._pixels = (self.points[:, :2] * scale).astype(np.int32)
+        return self._pixels
+
+    def pixel_coords(self):
+        # Float pixel positions, aspect-correct for distance maths
+        return self.points[:, :2] * np.array([self.width, self.height], dtype=np.float32)
+
+    # === List compatibility ===
+
+    def __len__(self):
+        return 21
+
+    def __getitem__(self, index):
+        x, y = self.pixels[index]
+        return int(x), int(y)
+
+    def __iter__(self):
+        return iter(map(tuple, self.pixels.tolist()))
+
+    # === Gesture helpers ===
+
+    def pinch_distance(self):
+        p = self.pixels
+        dx, dy = p[THUMB_TIP] - p[INDEX_TIP]
+        return float(np.hypot(dx, dy))
+
+    def pinch_center(self):
+        p = self.pixels
+        cx, cy = (p[THUMB_TIP] + p[INDEX_TIP]) // 2
+        return int(cx), int(cy)
+
+    def hand_size(self):
+        # Wrist to middle-finger knuckle in pixels; stable regardless of pose
+        p = self.pixel_coords()
+        return float(np.linalg.norm(p[MIDDLE_MCP] - p[WRIST]))
+
+    def fingers_extended(self):
+        # Bool per finger (thumb..pinky): tip farther from the wrist than its lower joint
+        p = self.pixel_coords()
+        tips = np.linalg.norm(p[FINGER_TIPS] - p[WRIST], axis=1)
+        joints = np.linalg.norm(p[FINGER_PIPS] - p[WRIST], axis=1)
+        return tips > joints * 1.1
+
+    def bbox(self):
+        p = self.pixels
+        x0, y0 = p.min(axis=0)
+        x1, y1 = p.max(axis=0)
+        return int(x0), int(y0), int(x1 - x0), int(y1 - y0)
+
+
+class HandAssociator:
+    """
+    Gives each hand a stable hand_id across frames by matching it to the
+    closest palm seen last time (handedness mismatches cost extra).
+    Tracks unseen for max_missing seconds are forgotten along with their
+    per-hand state dict.
+    """
+
+    def __init__(self, max_distance=0.25, handedness_penalty=0.15, max_missing=0.5):
+        self.max_distance = max_distance
+        self.handedness_penalty = handedness_penalty
+        self.max_missing = max_missing
+        self.tracks = {}   # hand_id -> (palm center, handedness, last seen)
+        self.states = {}   # hand_id -> dict owned by gesture / lesson code
+        self._next_id = 0
+
+    @staticmethod
+    def palm_center(pose):
+        return pose.points[[0, 5, 9, 13, 17], :2].mean(axis=0)
+
+    def assign(self, poses, now=None):
+        now = time.monotonic() if now is None else now
+        centers = [self.palm_center(p) for p in poses]
+
+        # Greedy matching on the cheapest pairs first (a handful of hands at most)
+        pairs = []
+        for i, (pose, center) in enumerate(zip(poses, centers)):
+            for hand_id, (old_center, handedness, _) in self.tracks.items():
+                cost = float(np.linalg.norm(center - old_center))
+                if handedness and pose.handedness and handedness != pose.handedness:
+                    cost += self.handedness_penalty
+                if cost <= self.max_distance:
+                    pairs.append((cost, i, hand_id))
+        pairs.sort()
+
+        matched, used = {}, set()
+        for _, i, hand_id in pairs:
+            if i not in matched and hand_id not in used:
+                matched[i] = hand_id
+                used.add(hand_id)
+
+        for i, pose in enumerate(poses):
+            hand_id = matched.get(i)
+            if hand_id is None:
+                hand_id = self._next_id
+                self._next_id += 1
+            pose.hand_id = hand_id
+            self.tracks[hand_id] = (centers[i], pose.handedness, now)
+
+        for hand_id, (_, _, seen) in list(self.tracks.items()):
+            if now - seen > self.max_missing:
+                del self.tracks[hand_id]
+                self.states.pop(hand_id, None)
+
+        # Longest-tracked hand first, so poses[0] stays the same child
+        poses.sort(key=lambda p: p.hand_id)
+        return poses
+
+    def state(self, hand_id):
+        return self.states.setdefault(hand_id, {})
+
+
+def draw_poses(frame, poses):
+    """
+    Skeletons of HandPoses, drawn like MediaPipe's draw_landmarks.
+    """
+    for pose in poses:
+        points = pose.resized((frame.shape[1], frame.shape[0])).pixels
+        for a, b in HAND_CONNECTIONS:
+            cv2.line(frame, tuple(points[a].tolist()), tuple(points[b].tolist()), (224, 224, 224), 2)
+        for x, y in points.tolist():
+            cv2.circle(frame, (x, y), 4, (0, 0, 255), -1)
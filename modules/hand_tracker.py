@@ -1,31 +1,172 @@
+import time
 import cv2
 import mediapipe as mp
+import numpy as np
+from modules.hand_pose import HandPose, HandAssociator, draw_poses
+from modules.filters import make_filter
+from modules.profiler import get_profiler
+from modules.frame_pool import FramePool
+
+ROI_GRID = 32  # Pixels; ROI crops are snapped to this grid
 
 class HandTracker:
-    def __init__(self, max_num_hands=1, detection_confidence=0.7, tracking_confidence=0.6):
+    def __init__(self, max_num_hands=1, detection_confidence=0.7, tracking_confidence=0.6,
+                 inference_width=None, roi_tracking=False, roi_padding=0.3,
+                 roi_min_score=0.6, roi_refresh=30):
         self.hands_module = mp.solutions.hands
+        # Full frames: MediaPipe's video mode, which follows the hands itself
         self.hands = self.hands_module.Hands(
             max_num_hands=max_num_hands,
             min_detection_confidence=detection_confidence,
             min_tracking_confidence=tracking_confidence,
         )
-        self.mp_draw = mp.solutions.drawing_utils
-        self.results = None
+        # ROI crops: every crop is a new image, so they get their own
+        # still-image instance and never upset the video-mode tracking
+        self.crop_hands = self.hands_module.Hands(
+            static_image_mode=True,
+            max_num_hands=max_num_hands,
+            min_detection_confidence=detection_confidence,
+        ) if roi_tracking else None
+        self.max_num_hands = max_num_hands
+        self.results = None     # MediaPipe's output for the last image (a crop in ROI frames)
+        self.results_time = None
+        self.poses = []
+        # 👫 Stable per-hand ids (and per-hand state) across frames
+        self.associator = HandAssociator()
+        # 🎚 Optional smoothing / prediction of what get_poses() hands out
+        self.filter = None
+        # Frames wider than this are shrunk before detection (None = full resolution)
+        self.inference_width = inference_width
+
+        # ✂️ ROI mode: once every hand slot is tracked, only look inside a padded
+        #    box around the hands; with a slot free the full frame is searched,
+        #    so a hand joining shows up at once
+        self.roi_tracking = roi_tracking
+        self.roi_padding = roi_padding        # Padding as a fraction of the hand box size
+        self.roi_min_score = roi_min_score    # Below this handedness score, search the full frame
+        self.roi_refresh = roi_refresh        # Full-frame search every N frames to catch lost hands
+        self.roi = None                       # (x0, y0, x1, y1), normalized to the full frame
+        self._roi_frames = 0
+        self.profiler = get_profiler()
+        self.pool = FramePool()
+
+    def inference_size(self, frame_shape):
+        h, w = frame_shape[:2]
+        if not self.inference_width or w <= self.inference_width:
+            return w, h
+        scale = self.inference_width / w
+        return self.inference_width, max(1, round(h * scale))
+
+    def _detect(self, image, hands=None):
+        # Resize and colour conversion write into reused buffers
+        size = self.inference_size(image.shape)
+        if size != (image.shape[1], image.shape[0]):
+            image = cv2.resize(image, size, dst=self.pool.get("detect", (size[1], size[0], 3)),
+                               interpolation=cv2.INTER_AREA)
+        rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB, dst=self.pool.like("rgb", image))
+        return (hands or self.hands).process(rgb)
+
+    def process(self, frame):
+        # Runs detection only; poses hold normalized landmarks, so they
+        # map back onto the full-size frame no matter what size we detect at
+        timestamp = time.monotonic()
+        found = None
+        if (self.roi_tracking and self.roi is not None and self._roi_frames < self.roi_refresh
+                and len(self.poses) >= self.max_num_hands):
+            found = self._detect_in_roi(frame, timestamp)
+            self._roi_frames += 1
+        if found is None:
+            results = self._detect(frame)
+            found = results, self.poses_from(results, frame.shape, timestamp)
+            self._roi_frames = 0
+        results, poses = found
+
+        if self.roi_tracking:
+            self.roi = self._roi_around(poses)
+        self.results = results
+        self.results_time = timestamp
+        self.poses = self.associator.assign(poses, timestamp)
+        return self.results
+
+    def _detect_in_roi(self, frame, timestamp):
+        # (results, full-frame poses) found in the crop around the last
+        # hands, or None when the full frame has to be searched
+        h, w = frame.shape[:2]
+        x0, y0, x1, y1 = self.roi
+        # Snap the crop outwards to a ROI_GRID grid, so it takes a handful of
+        # sizes (and reused buffers) instead of a new one every frame
+        px0, py0 = int(x0 * w) // ROI_GRID * ROI_GRID, int(y0 * h) // ROI_GRID * ROI_GRID
+        px1 = min(w, -(-int(x1 * w) // ROI_GRID) * ROI_GRID)
+        py1 = min(h, -(-int(y1 * h) // ROI_GRID) * ROI_GRID)
+        if px1 - px0 < 32 or py1 - py0 < 32:
+            return None
+
+        results = self._detect(frame[py0:py1, px0:px1], self.crop_hands)
+        if not results.multi_hand_landmarks:
+            return None
+        for handedness in results.multi_handedness:
+            if handedness.classification[0].score < self.roi_min_score:
+                return None
+
+        # Hand touching the crop edge is leaving the box: redo the full frame
+        margin = 0.02
+        poses = self.poses_from(results, frame.shape, timestamp)
+        for pose in poses:
+            xy = pose.normalized
+            if xy.min() <= margin or xy.max() >= 1 - margin:
+                return None
+
+        # Crop-normalized landmarks -> full-frame ones (MediaPipe's protos
+        # are left as they are)
+        sx, sy = (px1 - px0) / w, (py1 - py0) / h
+        scale = np.array([sx, sy, sx], np.float32)
+        offset = np.array([px0 / w, py0 / h, 0.0], np.float32)
+        for pose in poses:
+            pose.points = pose.points * scale + offset
+        return results, poses
+
+    def _roi_around(self, poses):
+        if not poses:
+            return None
+        points = np.concatenate([pose.normalized for pose in poses])
+        (x0, y0), (x1, y1) = points.min(axis=0).tolist(), points.max(axis=0).tolist()
+        pad = self.roi_padding * max(x1 - x0, y1 - y0, 0.1)
+        return (max(0.0, x0 - pad), max(0.0, y0 - pad),
+                min(1.0, x1 + pad), min(1.0, y1 + pad))
+
+    def poses_from(self, results, frame_shape, timestamp=None):
+        # Maps normalized results onto a frame of the given shape, one HandPose per hand
+        if not results or not results.multi_hand_landmarks:
+            return []
+        h, w = frame_shape[:2]
+        handedness = results.multi_handedness or [None] * len(results.multi_hand_landmarks)
+        return [HandPose.from_mediapipe(hand, (w, h), side, timestamp)
+                for hand, side in zip(results.multi_hand_landmarks, handedness)]
+
+    def set_filter(self, preset):
+        """
+        Picks a smoothing preset from filters.FILTER_PRESETS ("menu",
+        "drawing", "raw", ...) or a config dict. Returns the previous filter
+        so a lesson can restore it on exit.
+        """
+        previous = self.filter
+        self.filter = make_filter(preset) if isinstance(preset, (str, dict)) else preset
+        return previous
+
+    def filtered(self, poses):
+        return self.filter.apply(poses) if self.filter else poses
+
+    def get_poses(self, frame):
+        with self.profiler.span("tracker.process"):
+            self.process(frame)
+        with self.profiler.span("tracker.filter"):
+            return self.filtered(self.poses)
 
     def get_landmarks(self, frame):
-        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        self.results = self.hands.process(rgb)
-        if self.results.multi_hand_landmarks:
-            landmarks = []
-            for hand in self.results.multi_hand_landmarks:
-                for id, lm in enumerate(hand.landmark):
-                    h, w, _ = frame.shape
-                    cx, cy = int(lm.x * w), int(lm.y * h)
-                    landmarks.append((cx, cy))
-                return landmarks
-        return None
-
-    def draw_hand(self, frame):
-        if self.results and self.results.multi_hand_landmarks:
-            for hand in self.results.multi_hand_landmarks:
-                self.mp_draw.draw_landmarks(frame, hand, self.hands_module.HAND_CONNECTIONS)
+        # Primary (longest tracked) hand, for single-cursor lessons
+        poses = self.get_poses(frame)
+        return poses[0] if poses else None
+
+    def draw_hand(self, frame, poses=None):
+        # Drawn from the full-frame poses: in ROI frames `results` is crop-relative
+        draw_poses(frame, self.poses if poses is None else poses)
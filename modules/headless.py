@@ -0,0 +1,268 @@
+import math
+import threading
+import time
+from collections import defaultdict
+import cv2
+import numpy as np
+from modules.hand_pose import HandPose, HandAssociator, draw_poses
+from modules.filters import make_filter
+from modules.runtime import App
+
+# 🧪 Run scenes without a camera, MediaPipe or a window, e.g. on a CI box:
+#    frames come from a synthetic or recorded source, hands from a script,
+#    and frames go to a display that only counts them.
+
+STAGES = ("capture", "tracking", "logic", "audio", "render", "display")
+
+# An open right hand in units of hand size (wrist -> middle knuckle),
+# with the middle knuckle at the origin and y pointing down
+OPEN_HAND = np.array([
+    (0.0, 1.0),
+    (-0.35, 0.8), (-0.6, 0.55), (-0.75, 0.3), (-0.85, 0.1),
+    (-0.3, 0.05), (-0.35, -0.35), (-0.38, -0.6), (-0.4, -0.85),
+    (0.0, 0.0), (0.0, -0.45), (0.0, -0.72), (0.0, -0.95),
+    (0.28, 0.05), (0.3, -0.35), (0.32, -0.6), (0.33, -0.8),
+    (0.52, 0.15), (0.58, -0.15), (0.62, -0.35), (0.65, -0.52),
+], dtype=np.float32)
+
+# Same hand with thumb and index tips touching
+PINCHED_HAND = OPEN_HAND.copy()
+PINCHED_HAND[4] = (-0.58, -0.25)
+PINCHED_HAND[8] = (-0.52, -0.33)
+
+# Where the cursor (the pinch centre) sits on the pinched hand
+_CURSOR = (PINCHED_HAND[4] + PINCHED_HAND[8]) / 2
+
+
+def synthetic_pose(x, y, frame_size, pinching=False, hand_size=100, handedness="Right"):
+    """
+    A HandPose whose cursor is at pixel (x, y), open or pinching.
+    """
+    w, h = frame_size
+    shape = PINCHED_HAND if pinching else OPEN_HAND
+    pixels = (shape - _CURSOR) * hand_size + (x, y)
+    points = np.zeros((21, 3), np.float32)
+    points[:, 0] = pixels[:, 0] / w
+    points[:, 1] = pixels[:, 1] / h
+    return HandPose(points, frame_size, handedness)
+
+
+def tour_script(period=30, seed=0):
+    """
+    Per-frame hand positions for a hand that visits random spots of the
+    frame, pinching for the second half of each stop. `period` is frames
+    per stop. Returns script(index, frame_size) -> [(x, y, pinching)].
+    """
+    rng = np.random.default_rng(seed)
+    stops = rng.random((64, 2)) * 0.8 + 0.1
+
+    def script(index, frame_size):
+        w, h = frame_size
+        stop, phase = divmod(index, period)
+        x0, y0 = stops[stop % len(stops)]
+        x1, y1 = stops[(stop + 1) % len(stops)]
+        t = phase / period
+        if t < 0.5:
+            # Glide towards the next stop with a little wobble
+            s = t * 2
+            x = x0 + (x1 - x0) * s + 0.01 * math.sin(index)
+            y = y0 + (y1 - y0) * s
+            return [(x * w, y * h, False)]
+        return [(x1 * w, y1 * h, True)]
+
+    return script
+
+
+class SyntheticCapture:
+    """
+    Stand-in for cv2.VideoCapture: hands out a copy of one textured frame,
+    like a camera producing a new image every read.
+    """
+
+    def __init__(self, size=(1280, 720), frames=None, seed=0):
+        w, h = size
+        rng = np.random.default_rng(seed)
+        self.frame = cv2.GaussianBlur(rng.integers(0, 256, (h, w, 3), dtype=np.uint8), (0, 0), 3)
+        self.frames = frames   # None = endless
+        self.count = 0
+
+    def isOpened(self):
+        return True
+
+    def read(self, image=None):
+        if self.frames is not None and self.count >= self.frames:
+            return False, None
+        self.count += 1
+        if image is not None and image.shape == self.frame.shape:
+            np.copyto(image, self.frame)
+            return True, image
+        return True, self.frame.copy()
+
+    def release(self):
+        pass
+
+
+class LoopingCapture:
+    """
+    A video file that starts over when it ends, for fixed-length runs.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.cap = cv2.VideoCapture(path)
+
+    def isOpened(self):
+        return self.cap.isOpened()
+
+    def read(self, image=None):
+        success, frame = self.cap.read(image)
+        if not success:
+            self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            success, frame = self.cap.read(image)
+        return success, frame
+
+    def release(self):
+        self.cap.release()
+
+
+class ScriptedTracker:
+    """
+    Drop-in for HandTracker that takes hand positions from a script
+    instead of MediaPipe. Id assignment and filtering run as usual, so
+    only the model inference is missing from the tracking cost.
+    """
+
+    def __init__(self, script=None):
+        self.script = script or tour_script()
+        self.associator = HandAssociator()
+        self.filter = None
+        self.poses = []
+        self.frames = 0
+
+    def set_filter(self, preset):
+        previous = self.filter
+        self.filter = make_filter(preset) if isinstance(preset, (str, dict)) else preset
+        return previous
+
+    def filtered(self, poses):
+        return self.filter.apply(poses) if self.filter else poses
+
+    def get_poses(self, frame):
+        h, w = frame.shape[:2]
+        now = time.monotonic()
+        poses = [synthetic_pose(x, y, (w, h), pinching)
+                 for x, y, pinching in self.script(self.frames, (w, h))]
+        for pose in poses:
+            pose.timestamp = now
+        self.frames += 1
+        self.poses = self.associator.assign(poses, now)
+        return self.filtered(self.poses)
+
+    def get_landmarks(self, frame):
+        poses = self.get_poses(frame)
+        return poses[0] if poses else None
+
+    def draw_hand(self, frame, poses=None):
+        draw_poses(frame, self.poses if poses is None else poses)
+
+
+class NullDisplay:
+    """
+    Display that never opens a window and never reports a key.
+    """
+
+    def __init__(self):
+        self.frames = 0
+
+    def show(self, frame):
+        self.frames += 1
+        return None
+
+    def close(self):
+        pass
+
+
+class StageTimes:
+    """
+    Per-frame stage durations in milliseconds, for percentiles.
+    Audio time is measured inside scene logic and reported apart from it.
+    """
+
+    def __init__(self):
+        self.frames = []
+        self.current = defaultdict(float)
+
+    def add(self, stage, seconds):
+        self.current[stage] += seconds * 1000
+
+    def end_frame(self):
+        frame = self.current
+        frame["logic"] = max(0.0, frame["logic"] - frame["audio"])
+        frame["total"] = sum(frame[stage] for stage in STAGES)
+        self.frames.append(frame)
+        self.current = defaultdict(float)
+
+    def percentiles(self, stage, q=(50, 95, 99)):
+        values = [frame[stage] for frame in self.frames]
+        if not values:
+            return [0.0] * len(q)
+        return np.percentile(values, q).tolist()
+
+
+class _TimedAudio:
+    # Times AudioEngine.play calls made from the frame loop's thread
+    def __init__(self, engine, times):
+        self.engine = engine
+        self.times = times
+        self.play = engine.play
+        self.thread = threading.current_thread()
+
+    def __call__(self, *args, **kwargs):
+        if threading.current_thread() is not self.thread:
+            return self.play(*args, **kwargs)
+        start = time.perf_counter()
+        try:
+            return self.play(*args, **kwargs)
+        finally:
+            self.times.add("audio", time.perf_counter() - start)
+
+    def __enter__(self):
+        self.engine.play = self
+        return self
+
+    def __exit__(self, *exc):
+        del self.engine.play  # Back to the class method
+
+
+def profile_scene(factory, frames=300, cap=None, tracker=None, warmup=30):
+    """
+    Run the scene made by factory() for `frames` frames headless and
+    return its StageTimes. When the scene leaves or opens another one,
+    a fresh scene from factory() takes over, so every frame is measured
+    on the scene under test.
+    """
+    from modules.audio_engine import get_engine
+
+    cap = cap or SyntheticCapture()
+    tracker = tracker or ScriptedTracker()
+    app = App(cap, tracker, display=NullDisplay())
+    times = StageTimes()
+    scene = factory()
+    if not app.start(scene):
+        return times
+
+    with _TimedAudio(get_engine(), times):
+        for i in range(warmup + frames):
+            if i == warmup:
+                times.current.clear()  # Drop audio timed during warm-up
+            app.on_stage = times.add if i >= warmup else None
+            if not app.tick():
+                break
+            if i >= warmup:
+                times.end_frame()
+            if app.stack != [scene]:
+                app.quit()
+                scene = factory()
+                app.push(scene)
+    app.quit()
+    return times
@@ -0,0 +1,290 @@
+import heapq
+import json
+import os
+import random
+import threading
+from collections import deque
+
+# 🧠 Learner model: per-item accuracy, answer time and SM-2 spacing, plus
+#    a difficulty level per lesson that goes up as the child gets fluent
+#    and down when they struggle. Intervals are counted in questions of
+#    that lesson (sessions are minutes, not days). Each lesson keeps a
+#    heap of its items by due question, so picking the next one is
+#    O(log n) however big the bank; unseen items are dealt O(1).
+#
+#    Lessons register a catalogue (level -> item keys) and then ask:
+#
+#        key, level = get_learner().next_item("addition")
+#        ... show it, time the answer ...
+#        get_learner().record("addition", key, correct, seconds)
+
+LEVELS = (1, 2, 3)
+START_LEVEL = 2         # Middle level: the ranges the lessons used before (problems.DEFAULT_DIFFICULTY)
+EASE = 2.5              # SM-2 starting easiness
+MIN_EASE = 1.3
+FIRST_INTERVALS = (2, 5)  # Questions until the 1st / 2nd review after a correct answer
+RETRY_INTERVAL = 2      # A missed item comes back after one other question
+WINDOW = 8              # Recent answers judged for a level change
+RAISE_FLUENCY = 0.8     # Share of fluent answers (quality >= 4) to level up
+LOWER_ACCURACY = 0.5    # Accuracy below which the level goes down
+LATENCY_SMOOTHING = 0.2
+
+_catalogue = {}  # lesson -> function(level) -> sequence of item keys
+
+
+def register(lesson, items):
+    """
+    items(level) returns the item keys (hashable, JSON-able) of a lesson
+    at a level. Called once by each lesson module at import.
+    """
+    _catalogue[lesson] = items
+
+
+class ItemState:
+    __slots__ = ("key", "level", "reps", "ease", "interval", "due",
+                 "attempts", "correct", "latency")
+
+    def __init__(self, key, level):
+        self.key = key
+        self.level = level
+        self.reps = 0          # Correct answers in a row
+        self.ease = EASE
+        self.interval = 0      # Questions
+        self.due = 0           # Lesson question number it is due at
+        self.attempts = 0
+        self.correct = 0
+        self.latency = None    # Smoothed seconds to answer
+
+    @property
+    def accuracy(self):
+        return self.correct / self.attempts if self.attempts else 0.0
+
+
+def quality(correct, latency, typical):
+    """
+    SM-2 grade 0-5 from one answer: wrong is 1; right is 5 when faster
+    than the lesson's typical time, 4 within twice that, else 3.
+    """
+    if not correct:
+        return 1
+    if latency is None or typical is None or latency <= typical:
+        return 5
+    return 4 if latency <= 2 * typical else 3
+
+
+def schedule(item, grade, clock):
+    # SM-2 with intervals in questions
+    if grade >= 3:
+        item.interval = (FIRST_INTERVALS[item.reps] if item.reps < len(FIRST_INTERVALS)
+                         else max(round(item.interval * item.ease), item.interval + 1))
+        item.reps += 1
+    else:
+        item.reps = 0
+        item.interval = RETRY_INTERVAL
+    item.ease = max(MIN_EASE, item.ease + 0.1 - (5 - grade) * (0.08 + (5 - grade) * 0.02))
+    item.due = clock + item.interval
+
+
+class LessonState:
+    """
+    One lesson's items (dict by key), its due heap of (due, seq, key)
+    and its level. Heap entries left behind by a reschedule are skipped
+    when they surface (their due no longer matches the item's).
+    """
+
+    def __init__(self, lesson, level=START_LEVEL):
+        self.lesson = lesson
+        self.level = level
+        self.clock = 0           # Questions asked so far
+        self.items = {}          # key -> ItemState
+        self.heap = []
+        self.recent = deque(maxlen=WINDOW)  # Grades at the current level
+        self.latency = None      # Smoothed seconds to answer, any item
+        self.pending = None      # Key handed out and not answered yet
+        self._seq = 0
+        self._unseen = {}        # level -> [keys, undealt count]
+
+    def push(self, item):
+        self._seq += 1
+        heapq.heappush(self.heap, (item.due, self._seq, item.key))
+
+    def peek(self):
+        # Earliest due item, dropping stale heap entries
+        heap = self.heap
+        while heap:
+            due, _, key = heap[0]
+            item = self.items.get(key)
+            if item is not None and item.due == due and key != self.pending:
+                return item
+            heapq.heappop(heap)
+        return None
+
+    def deal_unseen(self, rng):
+        # A random never-shown item (Fisher-Yates step): of the current
+        # level if any are left, else of the levels below, then above
+        below = [l for l in reversed(LEVELS) if l < self.level]
+        above = [l for l in LEVELS if l > self.level]
+        for level in [self.level] + below + above:
+            pool = self._unseen.get(level)
+            if pool is None:
+                keys = list(_catalogue[self.lesson](level))
+                pool = self._unseen[level] = [keys, len(keys)]
+            keys = pool[0]
+            while pool[1]:
+                j = rng.randrange(pool[1])
+                pool[1] -= 1
+                keys[j], keys[pool[1]] = keys[pool[1]], keys[j]
+                key = keys[pool[1]]
+                if key not in self.items:
+                    return key, level
+        return None, None
+
+
+class LearnerModel:
+    """
+    The learner's state across lessons. Thread-safe; save() / load()
+    keep it between runs as JSON.
+    """
+
+    def __init__(self, seed=None):
+        self.lessons = {}  # lesson -> LessonState
+        self.rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def lesson(self, lesson):
+        state = self.lessons.get(lesson)
+        if state is None:
+            state = self.lessons[lesson] = LessonState(lesson)
+        return state
+
+    def level(self, lesson):
+        return self.lesson(lesson).level
+
+    def next_item(self, lesson):
+        """
+        (key, level) to ask next: an item that is due, else a new item of
+        the current level (or the nearest level with new items left), else
+        the item due soonest. (None, level) if the lesson has no items.
+        """
+        with self._lock:
+            state = self.lesson(lesson)
+            if state.pending is not None:
+                # Never answered (the child left): ask it again soon
+                item = state.items[state.pending]
+                state.pending = None
+                item.due = state.clock
+                state.push(item)
+            due = state.peek()
+            key = None
+            if due is None or due.due > state.clock + 1:  # Not due at the question being asked
+                key, level = state.deal_unseen(self.rng)
+                if key is not None:
+                    state.items[key] = ItemState(key, level)
+            if key is None:
+                if due is None:
+                    return None, state.level
+                heapq.heappop(state.heap)
+                key = due.key
+            state.pending = key
+            state.clock += 1
+            return key, state.items[key].level
+
+    def record(self, lesson, key, correct, latency=None):
+        """
+        First answer to an item handed out by next_item(): updates its
+        spacing, the lesson's typical answer time and maybe the level.
+        Returns the SM-2 grade.
+        """
+        with self._lock:
+            state = self.lesson(lesson)
+            item = state.items.get(key)
+            if item is None:
+                item = state.items[key] = ItemState(key, state.level)
+            if state.pending == key:
+                state.pending = None
+            grade = quality(correct, latency, state.latency)
+            item.attempts += 1
+            item.correct += bool(correct)
+            if latency is not None:
+                item.latency = latency if item.latency is None else (
+                    item.latency + LATENCY_SMOOTHING * (latency - item.latency))
+                if correct:
+                    state.latency = latency if state.latency is None else (
+                        state.latency + LATENCY_SMOOTHING * (latency - state.latency))
+            schedule(item, grade, state.clock)
+            state.push(item)
+            if item.level == state.level:
+                state.recent.append(grade)
+                self._adapt(state)
+            return grade
+
+    def _adapt(self, state):
+        # Judged on a full window of answers at the current level
+        recent = state.recent
+        if len(recent) < WINDOW:
+            return
+        fluent = sum(g >= 4 for g in recent) / len(recent)
+        accuracy = sum(g >= 3 for g in recent) / len(recent)
+        if fluent >= RAISE_FLUENCY and state.level < LEVELS[-1]:
+            state.level += 1
+            recent.clear()
+        elif accuracy < LOWER_ACCURACY and state.level > LEVELS[0]:
+            state.level -= 1
+            recent.clear()
+
+    def stats(self, lesson):
+        state = self.lesson(lesson)
+        items = state.items.values()
+        attempts = sum(i.attempts for i in items)
+        return {"level": state.level, "asked": state.clock, "items": len(state.items),
+                "accuracy": sum(i.correct for i in items) / attempts if attempts else 0.0,
+                "latency": state.latency}
+
+    # === Persistence ===
+
+    def save(self, path):
+        with self._lock:
+            data = {}
+            for name, state in self.lessons.items():
+                data[name] = {
+                    "level": state.level, "clock": state.clock, "latency": state.latency,
+                    "recent": list(state.recent),
+                    "items": [[item.key, item.level, item.reps, item.ease, item.interval, item.due,
+                               item.attempts, item.correct, item.latency] for item in state.items.values()],
+                }
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+
+    def load(self, path):
+        if not os.path.exists(path):
+            return False
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        with self._lock:
+            self.lessons = {}
+            for name, saved in data.items():
+                state = self.lessons[name] = LessonState(name, saved["level"])
+                state.clock, state.latency = saved["clock"], saved["latency"]
+                state.recent.extend(saved.get("recent", ()))
+                for key, level, reps, ease, interval, due, attempts, correct, latency in saved["items"]:
+                    key = tuple(key) if isinstance(key, list) else key  # JSON has no tuples
+                    item = state.items[key] = ItemState(key, level)
+                    item.reps, item.ease, item.interval, item.due = reps, ease, interval, due
+                    item.attempts, item.correct, item.latency = attempts, correct, latency
+                    state.push(item)
+        return True
+
+
+_learner = None
+_learner_lock = threading.Lock()
+
+
+def get_learner():
+    global _learner
+    with _learner_lock:
+        if _learner is None:
+            _learner = LearnerModel()
+    return _learner
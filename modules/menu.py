@@ -1,18 +1,22 @@
 import cv2
-import os
-import time
 from modules.sound_player import play_sound
+from modules.gestures import GestureEngine, HOVER, HOLD_PROGRESS, SELECT
+from modules.widgets import WidgetRegistry
+from modules.overlay import Overlay
+from modules.compositing import blend
+from modules.assets import get_assets
+from modules.runtime import Scene
 
 class Menu:
-    def __init__(self, items, width, height):
+    def __init__(self, items, width, height, hold_time=4):
         self.items = items
         self.buttons = []
         self.icons = {}
-        self.hovered_index = -1
-        self.last_hovered = -1
+        self.widgets = WidgetRegistry()
+        self.overlay = Overlay(width, height)
         self.width = width
         self.height = height
-        self.hover_sounds_played = {}
+        self.gestures = GestureEngine(hold_time=hold_time)
         self.build_buttons(width, height)
 
     def build_buttons(self, width, height):
@@ -24,75 +28,132 @@ class Menu:
                 "label": label,
                 "pos": (x, y),
                 "hovered": False,
-                "select_start_time": None
+                "progress": 0.0
             })
+            self.widgets.add(label, (x, y, 320, 70))
 
             icon_path = f"assets/icons/{label.lower().replace('&', '').replace(' ', '')}.png"
-            if os.path.exists(icon_path):
-                self.icons[label] = cv2.resize(cv2.imread(icon_path, cv2.IMREAD_UNCHANGED), (50, 50))
+            icon = get_assets().sprite(icon_path, (50, 50))
+            if icon is not None:
+                self.icons[label] = icon
+
+            # Box includes the progress ring, which pokes out above and below
+            btn = self.buttons[-1]
+            self.overlay.add(label, (x, y - 8, 320, 86),
+                             lambda img, state, btn=btn: self.draw_button(img, btn, state),
+                             (False, 0))
+
+    def draw_button(self, img, btn, state):
+        x, y = btn["pos"]
+        label = btn["label"]
+        hovered, angle = state
+        color = (0, 120, 255) if hovered else (0, 0, 200)
+
+        cv2.rectangle(img, (x, y), (x + 320, y + 70), color, -1)
+
+        # Icon
+        if label in self.icons:
+            blend(img, self.icons[label], x + 10, y + 10)
+
+        # Text
+        cv2.putText(img, label, (x + 70, y + 45),
+                    cv2.FONT_HERSHEY_SIMPLEX, 1, (255, 255, 255), 2)
+
+        # Progress ring for selection
+        if angle:
+            center = (x + 160, y + 35)
+            cv2.ellipse(img, center, (40, 40), 0, 0, angle, (0, 255, 0), 5)
 
     def draw(self, frame):
-        for idx, btn in enumerate(self.buttons):
-            x, y = btn["pos"]
-            label = btn["label"]
-            hovered = btn["hovered"]
-            color = (0, 120, 255) if hovered else (0, 0, 200)
-
-            cv2.rectangle(frame, (x, y), (x + 320, y + 70), color, -1)
-
-            # Icon
-            if label in self.icons:
-                icon = self.icons[label]
-                if icon.shape[2] == 4:
-                    alpha_s = icon[:, :, 3] / 255.0
-                    alpha_l = 1.0 - alpha_s
-                    for c in range(3):
-                        frame[y+10:y+60, x+10:x+60, c] = (
-                            alpha_s * icon[:, :, c] + alpha_l * frame[y+10:y+60, x+10:x+60, c]
-                        )
-                else:
-                    frame[y+10:y+60, x+10:x+60] = icon
-
-            # Text
-            cv2.putText(frame, label, (x + 70, y + 45),
-                        cv2.FONT_HERSHEY_SIMPLEX, 1, (255, 255, 255), 2)
-
-            # Progress ring for selection
-            if btn["select_start_time"]:
-                duration = time.time() - btn["select_start_time"]
-                if duration < 4:
-                    progress = int((duration / 4) * 360)
-                    center = (x + 160, y + 35)
-                    cv2.ellipse(frame, center, (40, 40), 0, 0, progress, (0, 255, 0), 5)
-
-    def update_hover(self, x, y):
-        self.hovered_index = -1
-        for i, btn in enumerate(self.buttons):
-            bx, by = btn["pos"]
-            in_button = bx < x < bx + 320 and by < y < by + 70
-            btn["hovered"] = in_button
-
-            if in_button:
-                self.hovered_index = i
-                label = btn["label"]
-
-                # Play sound only once per hover
-                if i != self.last_hovered:
-                    self.last_hovered = i
+        # Buttons live in a cached overlay; only changed ones are redrawn
+        for btn in self.buttons:
+            angle = int(btn["progress"] * 60) * 6 if 0 < btn["progress"] < 1 else 0  # 6° steps
+            self.overlay.set_state(btn["label"], (btn["hovered"], angle))
+        self.overlay.composite(frame)
+
+    def button_at(self, x, y):
+        return self.widgets.at(x, y)
+
+    def update(self, poses):
+        """
+        Hover + pinch-hold selection for every tracked hand.
+        Returns the selected label, or None.
+        """
+        return self.handle(self.gestures.update(poses, self.widgets))
+
+    def handle(self, events):
+        """
+        Apply gesture events (from self.gestures run against self.widgets).
+        Returns the selected label, or None.
+        """
+        progress = {}
+        selection = None
+        for event in events:
+            if event.kind == HOVER and event.target is not None:
+                others = [s for hand_id, s in self.gestures.hands.items()
+                          if hand_id != event.hand_id and s.target == event.target]
+                if not others:
+                    label = event.target
                     sound_file = f"assets/sounds/{label.lower().replace('&', '').replace(' ', '')}.mp3"
-                    if os.path.exists(sound_file):
-                        play_sound(sound_file)
-            else:
-                btn["select_start_time"] = None
+                    if get_assets().exists(sound_file):
+                        play_sound(sound_file, lane="hover")
+            elif event.kind == HOLD_PROGRESS:
+                progress[event.target] = max(progress.get(event.target, 0.0), event.progress)
+            elif event.kind == SELECT:
+                selection = event.target
 
-    def update_selection_timer(self, x, y):
+        hovered = {s.target for s in self.gestures.hands.values()}
         for btn in self.buttons:
-            bx, by = btn["pos"]
-            if bx < x < bx + 320 and by < y < by + 70:
-                if btn["select_start_time"] is None:
-                    btn["select_start_time"] = time.time()
-                elif time.time() - btn["select_start_time"] >= 4:
-                    return btn["label"]
-            else:
-                btn["select_start_time"] = None
-        return None
+            btn["hovered"] = btn["label"] in hovered
+            btn["progress"] = progress.get(btn["label"], 0.0)
+        return selection
+
+    def reset(self):
+        # Forget holds in progress, e.g. after returning from a lesson
+        self.gestures.reset()
+        for btn in self.buttons:
+            btn["hovered"] = False
+            btn["progress"] = 0.0
+
+
+class MenuScene(Scene):
+    """
+    A Menu as a scene. actions maps a label to a function returning the
+    scene to open; labels without an action (Back, Quit) leave the menu.
+    """
+
+    size = None  # Full camera frame
+
+    def __init__(self, items, actions, hold_time=4, log="✅ Selected"):
+        super().__init__()
+        self.items = items
+        self.actions = actions
+        self.hold_time = hold_time
+        self.log = log
+        self.menu = None
+
+    def enter(self, app):
+        super().enter(app)
+        w, h = app.frame_size
+        self.menu = Menu(self.items, w, h, self.hold_time)
+        self.gestures = self.menu.gestures
+        self.hit_test = self.menu.widgets
+
+    def resume(self):
+        # Back from a lesson: a new hold is needed to pick again
+        self.menu.reset()
+
+    def update(self, poses, events, dt):
+        selection = self.menu.handle(events)
+        if not selection:
+            return
+        print(f"{self.log}: {selection}")
+        play_sound("assets/sounds/welcome.mp3")
+        action = self.actions.get(selection)
+        if action is None:
+            self.app.pop()
+        else:
+            self.app.push(action())
+
+    def render(self, frame):
+        self.menu.draw(frame)
@@ -0,0 +1,141 @@
+import time
+import cv2
+from modules.sound_player import play_sound
+from modules.gestures import GestureEngine, boxes_hit_test, HOLD_PROGRESS, SELECT
+from modules.canvas import Canvas
+from modules.recognizer import get_recognizer
+from modules.learner import get_learner
+from modules.runtime import Scene
+
+
+class ChoiceScene(Scene):
+    """
+    A question with answer buttons and a BACK button.
+
+    hold_time > 0: pinch and hold an answer that long (progress ring shown).
+    hold_time = 0: pinching an answer picks it straight away.
+    A correct answer shows its feedback, plays well_done and pops the scene.
+
+    With a `write_area`, the answer can also be written in the air: a
+    pinch that starts inside it draws, and write_pause seconds after the
+    last stroke the digits are read and answered like a pinched option.
+    Pinches anywhere else never leave ink.
+
+    With a `lesson` and `item`, the first answer (right or wrong, and how
+    long it took) is reported to the learner model.
+    """
+
+    result_org = (220, 420)
+    result_duration = 2.0   # Seconds the feedback stays up
+    result_scale = 1.5
+    write_area = None       # (x, y, w, h) where answers can be written; None = no writing
+    write_pause = 1.2       # Seconds after the last stroke before reading it
+
+    def __init__(self, option_boxes, back_box, correct, hold_time=4, cooldown=1.0, lesson=None, item=None):
+        super().__init__()
+        self.option_boxes = option_boxes
+        self.back_box = back_box
+        self.correct = correct
+        self.gestures = GestureEngine(hold_time=hold_time, cooldown=cooldown)
+        self.hit_test = boxes_hit_test(option_boxes + [("BACK", back_box)])
+        self.result = ""
+        self.result_time = 0
+        self.holds = []  # (x, y, progress) of pinches being held this frame
+        self.ink = None
+        self.guess = None        # Number read from the ink so far
+        self.last_stroke = 0.0
+        self.lesson = lesson
+        self.item = item
+        self.shown = None        # When the question appeared; None once answered
+
+    def enter(self, app):
+        super().enter(app)
+        self.shown = time.time()
+        if self.write_area is not None:
+            w, h = self.size or app.frame_size
+            self.ink = Canvas(w, h, color=(0, 140, 255), brush=8)
+            get_recognizer()  # Built once, here rather than mid-stroke
+
+    def update(self, poses, events, dt):
+        now = time.time()
+        self.holds = [(e.x, e.y, e.progress) for e in events if e.kind == HOLD_PROGRESS]
+
+        if self.result == "Correct!" and now - self.result_time >= self.result_duration:
+            play_sound("assets/sounds/well_done.mp3")
+            self.app.pop()
+            return
+        if self.result and now - self.result_time >= self.result_duration:
+            self.result = ""
+
+        for event in events:
+            if event.kind != SELECT:
+                continue
+            if event.target == "BACK":
+                play_sound("assets/sounds/welcome.mp3")
+                self.app.pop()
+                return
+            self.answer(event.target)
+            break
+        else:
+            if self.ink is not None and not self.result:
+                self.write(poses, now)
+
+    def write(self, poses, now):
+        # Pinches starting in the write area write (until released); a pause submits
+        ax, ay, aw, ah = self.write_area
+        drawing = set()
+        for pose in poses:
+            state = self.gestures.state(pose.hand_id)
+            if not state.pinching or state.target is not None:
+                continue
+            x, y = pose[8]  # Index tip
+            if pose.hand_id in self.ink.live or (ax <= x < ax + aw and ay <= y < ay + ah):
+                self.ink.extend(pose.hand_id, (x, y))
+                drawing.add(pose.hand_id)
+        for hand_id in list(self.ink.live):
+            if hand_id not in drawing:
+                self.ink.end(hand_id)
+        if drawing:
+            self.last_stroke = now
+
+        strokes = self.ink.strokes()
+        self.guess = get_recognizer().read_number(strokes) if strokes else None
+        if not drawing and strokes and now - self.last_stroke >= self.write_pause:
+            guess = self.guess
+            self.ink.clear()
+            self.guess = None
+            if guess is not None:
+                self.answer(guess)
+
+    def answer(self, target):
+        if self.lesson is not None and self.shown is not None:
+            get_learner().record(self.lesson, self.item, target == self.correct, time.time() - self.shown)
+            self.shown = None
+        if target == self.correct:
+            play_sound("assets/sounds/correct.mp3")
+            self.result = "Correct!"
+        else:
+            play_sound("assets/sounds/wrong.mp3")
+            self.result = "Wrong!"
+        self.result_time = time.time()
+
+    def render_back(self, frame):
+        bx, by, bw, bh = self.back_box
+        cv2.rectangle(frame, (bx, by), (bx + bw, by + bh), (255, 255, 255), -1)
+        cv2.putText(frame, "BACK", (bx + 10, by + 40), cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 0, 255), 2)
+
+    def render_feedback(self, frame):
+        if self.ink is not None:
+            ax, ay, aw, ah = self.write_area
+            cv2.rectangle(frame, (ax, ay), (ax + aw, ay + ah), (0, 140, 255), 1)
+            self.ink.composite(frame)
+            if self.guess is not None and len(self.ink.store):
+                x0, y0, x1, y1 = self.ink.store.box(len(self.ink.store) - 1)
+                cv2.putText(frame, f"{self.guess}?", (x1 + 10, max(y0 + 40, 40)), cv2.FONT_HERSHEY_SIMPLEX,
+                            1.5, (0, 140, 255), 4)
+        if self.result:
+            color = (0, 255, 0) if self.result == "Correct!" else (0, 0, 255)
+            cv2.putText(frame, self.result, self.result_org, cv2.FONT_HERSHEY_SIMPLEX,
+                        self.result_scale, color, 4)
+        for x, y, progress in self.holds:
+            cv2.ellipse(frame, (x, y), (40, 40), -90, 0, progress * 360, (0, 255, 0), 5)
@@ -1,128 +1,65 @@
 import cv2
 import random
-import time
-from modules.sound_player import play_sound
+from modules.runtime import App
+from modules.numbers.choice import ChoiceScene
+from modules.numbers.problems import next_problem
+from modules.sprite_atlas import get_atlas
+from modules.text_renderer import draw_text
 
 # Some kid-friendly emojis to choose from
 EMOJI_LIST = ["🍎", "🐠", "🐶", "⭐", "🦋", "🎈", "🍓", "🧸"]
 
-def run_counting(cap, tracker):
-    w, h = 640, 480
-    font = cv2.FONT_HERSHEY_SIMPLEX
-    emoji = random.choice(EMOJI_LIST)
-    count = random.randint(1, 9)
+class CountingScene(ChoiceScene):
+    write_area = (30, 80, 580, 270)  # Over the emoji, above the options
+
+    def __init__(self):
+        w, h = self.size
+        self.emoji = random.choice(EMOJI_LIST)
+        problem = next_problem("counting")
+        count = problem.answer
 
-    # Coordinates to scatter the emojis randomly
-    emoji_positions = []
-    for _ in range(count):
-        x = random.randint(100, w - 100)
-        y = random.randint(100, h - 150)
-        emoji_positions.append((x, y))
+        # Coordinates to scatter the emojis randomly (top-left corners)
+        self.emoji_size = 60
+        self.emoji_positions = []
+        for _ in range(count):
+            x = random.randint(100, w - 100)
+            y = random.randint(100, h - 150)
+            self.emoji_positions.append((x, y - self.emoji_size))
+        self.atlas = get_atlas()
 
-    # Generate 3 incorrect options
-    options = [count]
-    while len(options) < 4:
-        opt = random.randint(1, 9)
-        if opt not in options:
-            options.append(opt)
-    random.shuffle(options)
+        # Count and 3 incorrect options
+        options = problem.options
 
-    # Layout option buttons
-    option_boxes = []
-    spacing = 120
-    for i, val in enumerate(options):
-        x = 70 + i * spacing
-        y = h - 120
-        option_boxes.append((val, (x, y, 100, 100)))
+        # Layout option buttons
+        option_boxes = []
+        spacing = 120
+        for i, val in enumerate(options):
+            x = 70 + i * spacing
+            y = h - 120
+            option_boxes.append((val, (x, y, 100, 100)))
 
-    # Back button
-    back_btn = (w - 130, 20, 100, 60)
+        # Back button
+        back_btn = (w - 130, 20, 100, 60)
 
-    result = ""
-    result_time = 0
-    hold_start = None
-    hold_target = None
+        # Pinch and hold an option (or BACK) for 4 seconds to choose it
+        super().__init__(option_boxes, back_btn, count, hold_time=4, lesson="counting", item=problem.item)
 
-    while True:
-        ret, frame = cap.read()
-        if not ret:
-            break
-        frame = cv2.flip(frame, 1)
-        frame = cv2.resize(frame, (w, h))
-        landmarks = tracker.get_landmarks(frame)
+    def render(self, frame):
+        font = cv2.FONT_HERSHEY_SIMPLEX
 
         # === UI Drawing ===
-        cv2.putText(frame, f"Count the {emoji}s", (20, 60), font, 1.2, (0, 120, 255), 4)
+        draw_text(frame, f"Count the {self.emoji}s", (20, 60), 38, (0, 120, 255), weight=1)
 
         # Draw emojis
-        for x, y in emoji_positions:
-            cv2.putText(frame, emoji, (x, y), font, 2.5, (0, 0, 0), 4)
+        self.atlas.draw(frame, self.emoji, self.emoji_size, self.emoji_positions)
 
         # Draw options
-        for val, (x, y, bw, bh) in option_boxes:
+        for val, (x, y, bw, bh) in self.option_boxes:
             cv2.rectangle(frame, (x, y), (x + bw, y + bh), (255, 230, 180), -1)
             cv2.putText(frame, str(val), (x + 20, y + 65), font, 2, (0, 0, 0), 4)
 
-        # Draw BACK
-        bx, by, bw, bh = back_btn
-        cv2.rectangle(frame, (bx, by), (bx + bw, by + bh), (255, 255, 255), -1)
-        cv2.putText(frame, "BACK", (bx + 10, by + 40), font, 1, (0, 0, 255), 2)
-
-        # Draw result
-        if result and time.time() - result_time < 2:
-            color = (0, 255, 0) if result == "Correct!" else (0, 0, 255)
-            cv2.putText(frame, result, (220, 420), font, 1.5, color, 4)
-        elif result == "Correct!" and time.time() - result_time >= 2:
-            play_sound("assets/sounds/well_done.mp3")
-            break
-
-        # === Gesture detection ===
-        if landmarks:
-            x1, y1 = landmarks[4]
-            x2, y2 = landmarks[8]
-            cx, cy = (x1 + x2) // 2, (y1 + y2) // 2
-            dist = ((x1 - x2)**2 + (y1 - y2)**2) ** 0.5
-
-            hovering = None
-            # Check over option or back
-            for val, (x, y, bw, bh) in option_boxes + [("BACK", back_btn)]:
-                if x < cx < x + bw and y < cy < y + bh:
-                    hovering = val
-                    break
+        self.render_back(frame)
+        self.render_feedback(frame)
 
-            if dist < 40 and hovering:
-                if hold_target != hovering:
-                    hold_start = time.time()
-                    hold_target = hovering
-
-                elapsed = time.time() - hold_start
-                progress = min(elapsed / 4, 1)
-                cv2.ellipse(frame, (cx, cy), (40, 40), -90, 0, progress * 360, (0, 255, 0), 5)
-
-                if progress == 1:
-                    if hovering == "BACK":
-                        play_sound("assets/sounds/welcome.mp3")
-                        return
-                    elif isinstance(hovering, int):
-                        if hovering == count:
-                            play_sound("assets/sounds/correct.mp3")
-                            result = "Correct!"
-                        else:
-                            play_sound("assets/sounds/wrong.mp3")
-                            result = "Wrong!"
-                        result_time = time.time()
-                        hold_start = None
-                        hold_target = None
-            else:
-                hold_start = None
-                hold_target = None
-
-        tracker.draw_hand(frame)
-        cv2.imshow("Counting", frame)
-        if cv2.waitKey(1) & 0xFF == ord("q"):
-            break
-
-    try:
-        cv2.destroyWindow("Counting")
-    except:
-        pass
+def run_counting(cap, tracker):
+    App(cap, tracker).run(CountingScene())
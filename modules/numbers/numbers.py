@@ -1,112 +1,97 @@
 import cv2
-import time
 from modules.sound_player import play_sound
-from modules.hand_tracker import HandTracker
+from modules.gestures import GestureEngine, boxes_hit_test, HOVER, HOLD_PROGRESS, SELECT
+from modules.overlay import Overlay, text_box, union_box
+from modules.runtime import App, Scene
 
-# Submodule runners
-from modules.numbers.addition import run_addition
-from modules.numbers.subtraction import run_subtraction
-from modules.numbers.multiplication import run_multiplication
-from modules.numbers.division import run_division
-from modules.numbers.counting import run_counting
-from modules.numbers.tracing import run_tracing
-from modules.numbers.odd_even import run_odd_even
-from modules.numbers.fill_missing import run_fill_missing
+# Submodule scenes
+from modules.numbers.addition import AdditionScene
+from modules.numbers.subtraction import SubtractionScene
+from modules.numbers.multiplication import MultiplicationScene
+from modules.numbers.division import DivisionScene
+from modules.numbers.counting import CountingScene
+from modules.numbers.tracing import TracingScene
+from modules.numbers.odd_even import OddEvenScene
+from modules.numbers.fill_missing import FillMissingScene
 
-def run_numbers(cap, tracker: HandTracker):
-    labels = [
-        "Addition", "Subtraction", "Multiplication", "Division",
-        "Counting", "Tracing", "Odd/Even", "Fill Missing", "Back"
-    ]
+LESSONS = {
+    "Addition": AdditionScene,
+    "Subtraction": SubtractionScene,
+    "Multiplication": MultiplicationScene,
+    "Division": DivisionScene,
+    "Counting": CountingScene,
+    "Tracing": TracingScene,
+    "Odd/Even": OddEvenScene,
+    "Fill Missing": FillMissingScene,
+}
 
-    h, w = 480, 640
-    last_hovered = None
-    hover_start_time = 0
+class NumbersScene(Scene):
+    def __init__(self):
+        super().__init__()
+        labels = [
+            "Addition", "Subtraction", "Multiplication", "Division",
+            "Counting", "Tracing", "Odd/Even", "Fill Missing", "Back"
+        ]
 
-    button_areas = []
-    rows = 3
-    cols = 3
-    button_width = 180
-    button_height = 80
-    padding_x = (w - cols * button_width) // (cols + 1)
-    padding_y = 40
+        w, h = self.size
+        self.button_areas = []
+        rows = 3
+        cols = 3
+        button_width = 180
+        button_height = 80
+        padding_x = (w - cols * button_width) // (cols + 1)
+        padding_y = 40
 
-    for i in range(len(labels)):
-        col = i % cols
-        row = i // cols
-        x = padding_x + col * (button_width + padding_x)
-        y = padding_y + row * (button_height + padding_y)
-        button_areas.append((labels[i], (x, y, button_width, button_height)))
+        for i in range(len(labels)):
+            col = i % cols
+            row = i // cols
+            x = padding_x + col * (button_width + padding_x)
+            y = padding_y + row * (button_height + padding_y)
+            self.button_areas.append((labels[i], (x, y, button_width, button_height)))
 
-    while True:
-        success, frame = cap.read()
-        if not success:
-            break
-        frame = cv2.flip(frame, 1)
-        frame = cv2.resize(frame, (w, h))
+        # Pinch and hold a button for 4 seconds to open it
+        self.gestures = GestureEngine(hold_time=4)
+        self.hit_test = boxes_hit_test(self.button_areas)
+        self.holds = []
 
-        landmarks = tracker.get_landmarks(frame)
+        # Buttons are drawn once into an overlay and redrawn only when their glow changes
+        def draw_button(img, glow, label, x, y, bw, bh):
+            color = (0, 255, 0) if glow else (0, 150, 255)  # Glow effect
+            cv2.rectangle(img, (x, y), (x + bw, y + bh), color, -1)
+            cv2.putText(img, label, (x + 10, y + 50), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0, 0, 0), 2)
 
-        # Draw buttons
-        for label, (x, y, bw, bh) in button_areas:
-            color = (0, 150, 255)
-            if last_hovered == label and time.time() - hover_start_time > 0.5:
-                color = (0, 255, 0)  # Glow effect
-            cv2.rectangle(frame, (x, y), (x + bw, y + bh), color, -1)
-            cv2.putText(frame, label, (x + 10, y + 50), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0, 0, 0), 2)
-
-        if landmarks:
-            x1, y1 = landmarks[4]
-            x2, y2 = landmarks[8]
-            cx, cy = (x1 + x2) // 2, (y1 + y2) // 2
-            dist = ((x1 - x2)**2 + (y1 - y2)**2)**0.5
+        self.overlay = Overlay(w, h)
+        for label, (x, y, bw, bh) in self.button_areas:
+            box = union_box((x, y, bw, bh), text_box(label, (x + 10, y + 50), cv2.FONT_HERSHEY_SIMPLEX, 0.8, 2))
+            self.overlay.add(label, box, lambda img, glow, args=(label, x, y, bw, bh): draw_button(img, glow, *args), False)
 
-            hovered = None
-            for label, (x, y, bw, bh) in button_areas:
-                if x < cx < x + bw and y < cy < y + bh:
-                    hovered = label
-                    if hovered != last_hovered:
-                        hover_start_time = time.time()
-                        play_sound(f"assets/sounds/{label.lower().replace('/', '').replace(' ', '')}.mp3")
-                        last_hovered = hovered
-                    break
+    def update(self, poses, events, dt):
+        self.holds = []
+        selection = None
+        for event in events:
+            if event.kind == HOVER and event.target is not None:
+                play_sound(f"assets/sounds/{event.target.lower().replace('/', '').replace(' ', '')}.mp3", lane="hover")
+            elif event.kind == HOLD_PROGRESS:
+                self.holds.append((event.x, event.y, event.progress))
+            elif event.kind == SELECT:
+                selection = event.target
 
-            if hovered and dist < 40:
-                held_duration = time.time() - hover_start_time
-                cv2.ellipse(frame, (cx, cy), (30, 30), -90, 0, min(360, int(held_duration / 4 * 360)), (255, 255, 255), 5)
-
-                if held_duration >= 4:
-                    play_sound("assets/sounds/welcome.mp3")
-                    if hovered == "Addition":
-                        run_addition(cap, tracker)
-                    elif hovered == "Subtraction":
-                        run_subtraction(cap, tracker)
-                    elif hovered == "Multiplication":
-                        run_multiplication(cap, tracker)
-                    elif hovered == "Division":
-                        run_division(cap, tracker)
-                    elif hovered == "Counting":
-                        run_counting(cap, tracker)
-                    elif hovered == "Tracing":
-                        run_tracing(cap, tracker)
-                    elif hovered == "Odd/Even":
-                        run_odd_even(cap, tracker)
-                    elif hovered == "Fill Missing":
-                        run_fill_missing(cap, tracker)
-                    elif hovered == "Back":
-                        return
-                    last_hovered = None
-                    hover_start_time = 0
+        if selection:
+            play_sound("assets/sounds/welcome.mp3")
+            if selection == "Back":
+                self.app.pop()
             else:
-                hover_start_time = time.time()
+                self.app.push(LESSONS[selection]())
 
-        tracker.draw_hand(frame)
-        cv2.imshow("Numbers Menu", frame)
+    def render(self, frame):
+        # Draw buttons
+        hovered = {state.target for state in self.gestures.hands.values()}
+        for label, _ in self.button_areas:
+            self.overlay.set_state(label, label in hovered)
+        self.overlay.composite(frame)
 
-        if cv2.waitKey(1) & 0xFF == ord("q"):
-            break
+        for x, y, progress in self.holds:
+            cv2.ellipse(frame, (x, y), (30, 30), -90, 0, int(progress * 360), (255, 255, 255), 5)
 
-    try:
-        cv2.destroyWindow("Numbers Menu")
-    except:
-        pass
+def run_numbers(cap, tracker):
+    App(cap, tracker).run(NumbersScene())
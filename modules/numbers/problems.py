@@ -0,0 +1,295 @@
+import functools
+import random
+from modules.learner import get_learner, register
+
+# 🧮 Problem banks for the numbers lessons. Every valid problem of a
+#    lesson at a difficulty is enumerated once, each with the same
+#    plausible wrong answers every time (off by one, the wrong operation,
+#    swapped operands, a neighbouring times-table fact ...), and a bank
+#    deals them out in random order without repeats: one swap per draw,
+#    a new round once every problem has been shown. next_problem() lets
+#    the learner model pick the problem and its difficulty instead.
+
+DIFFICULTIES = (1, 2, 3)
+DEFAULT_DIFFICULTY = 2  # The ranges the lessons always used
+
+
+class Problem:
+    __slots__ = ("lesson", "operands", "answer", "options")
+
+    def __init__(self, lesson, operands, answer, options):
+        self.lesson = lesson
+        self.operands = operands  # Tuple; what each lesson shows
+        self.answer = answer
+        self.options = options    # Answer and distractors
+
+    @property
+    def key(self):
+        return (self.lesson, self.operands)
+
+    @property
+    def item(self):
+        # The learner model's key: operands as the bank lists them
+        return tuple(sorted(self.operands)) if SPECS[self.lesson].commutative else self.operands
+
+    def __repr__(self):
+        return f"Problem({self.lesson}, {self.operands} -> {self.answer}, options={self.options})"
+
+
+# === Problem spaces: difficulty -> (operands, answer), and wrong answers ===
+
+def _addition(level):
+    top = (5, 9, 20)[level - 1]
+    for a in range(1, top + 1):
+        for b in range(a, top + 1):  # a + b and b + a are one problem
+            yield (a, b), a + b
+
+
+def _addition_wrong(operands, answer):
+    a, b = operands
+    return [answer - 1, answer + 1, abs(a - b), answer + 2, answer - 2, answer + 10]
+
+
+def _subtraction(level):
+    low, high = ((2, 5), (5, 9), (10, 20))[level - 1]
+    for a in range(low, high + 1):
+        for b in range(1, a):
+            yield (a, b), a - b
+
+
+def _subtraction_wrong(operands, answer):
+    a, b = operands
+    return [answer + 1, answer - 1, a + b, answer + 2, answer - 2]
+
+
+def _multiplication(level):
+    top = (5, 9, 12)[level - 1]
+    for a in range(2, top + 1):
+        for b in range(a, top + 1):
+            yield (a, b), a * b
+
+
+def _multiplication_wrong(operands, answer):
+    a, b = operands
+    # Neighbouring facts first: a x (b +- 1), (a +- 1) x b
+    return [answer + a, answer - b, answer + b, answer - a, a + b, answer + 1, answer - 1]
+
+
+def _division(level):
+    divisors, quotients = (((1, 3), (1, 5)), ((1, 5), (1, 5)), ((2, 6), (2, 4)))[level - 1]
+    for divisor in range(divisors[0], divisors[1] + 1):
+        for quotient in range(quotients[0], quotients[1] + 1):
+            yield (divisor * quotient, divisor), quotient
+
+
+def _division_wrong(operands, answer):
+    dividend, divisor = operands
+    # divisor: dividend / answer swapped around
+    return [answer + 1, answer - 1, divisor, answer + 2, dividend - divisor, answer - 2]
+
+
+def _counting(level):
+    low, high = ((1, 5), (1, 9), (5, 12))[level - 1]
+    for count in range(low, high + 1):
+        yield (count,), count
+
+
+def _counting_wrong(operands, answer):
+    return [answer + 1, answer - 1, answer + 2, answer - 2, answer + 3]
+
+
+def _fill_missing(level):
+    starts, steps = ((range(1, 6), (1,)), (range(1, 6), (1, 2)), (range(1, 11), (2, 3, 5)))[level - 1]
+    for start in starts:
+        for step in steps:
+            for missing in range(1, 4):
+                yield (start, step, missing), start + missing * step
+
+
+def _fill_missing_wrong(operands, answer):
+    start, step, missing = operands
+    # The neighbours in the sequence, then off by one
+    return [answer + step, answer - step, answer + 1, answer - 1, answer + 2 * step]
+
+
+def _odd_even(level):
+    low, high = ((1, 20), (1, 99), (100, 999))[level - 1]
+    for n in range(low, high + 1):
+        yield (n,), "Even" if n % 2 == 0 else "Odd"
+
+
+def _odd_even_wrong(operands, answer):
+    return ["Odd" if answer == "Even" else "Even"]
+
+
+def _tracing(level):
+    # 1: straight strokes and the plain loop, 2: every digit, 3: the curly ones
+    digits = ((0, 1, 4, 7), range(10), (2, 3, 5, 6, 8, 9))[level - 1]
+    for digit in digits:
+        yield (digit,), digit
+
+
+def _tracing_wrong(operands, answer):
+    return []  # Nothing to pick from: the digit is traced
+
+
+class ProblemSpec:
+    __slots__ = ("problems", "wrong", "options", "lowest", "commutative")
+
+    def __init__(self, problems, wrong, options=4, lowest=0, commutative=False):
+        self.problems = problems        # level -> iterable of (operands, answer)
+        self.wrong = wrong              # (operands, answer) -> wrong answers, most plausible first
+        self.options = options          # Buttons shown, answer included
+        self.lowest = lowest            # Smallest number offered
+        self.commutative = commutative  # Operands may be shown either way round
+
+
+SPECS = {
+    "addition": ProblemSpec(_addition, _addition_wrong, commutative=True),
+    "subtraction": ProblemSpec(_subtraction, _subtraction_wrong, options=3),
+    "multiplication": ProblemSpec(_multiplication, _multiplication_wrong, lowest=1, commutative=True),
+    "division": ProblemSpec(_division, _division_wrong, lowest=1),
+    "counting": ProblemSpec(_counting, _counting_wrong, lowest=1),
+    "fill_missing": ProblemSpec(_fill_missing, _fill_missing_wrong),
+    "odd_even": ProblemSpec(_odd_even, _odd_even_wrong, options=2),
+    "tracing": ProblemSpec(_tracing, _tracing_wrong, options=1),
+}
+
+
+def distractors(spec, operands, answer):
+    """
+    spec.options - 1 wrong answers: the spec's candidates in order, then
+    the nearest unused numbers above the answer if those run out. Always
+    the same for the same problem, and always terminates.
+    """
+    wanted = spec.options - 1
+    chosen = []
+    for value in spec.wrong(operands, answer):
+        if len(chosen) == wanted:
+            return chosen
+        if value != answer and value not in chosen and (isinstance(value, str) or value >= spec.lowest):
+            chosen.append(value)
+    if isinstance(answer, int):
+        value = max(answer, spec.lowest - 1)
+        while len(chosen) < wanted:
+            value += 1
+            if value != answer and value not in chosen:
+                chosen.append(value)
+    return chosen
+
+
+@functools.lru_cache(maxsize=None)
+def build_problems(lesson, difficulty=DEFAULT_DIFFICULTY):
+    """
+    Every problem of a lesson at a difficulty, deduplicated, with its
+    options (answer first). Built once and shared.
+    """
+    spec = SPECS[lesson]
+    problems, seen = [], set()
+    for operands, answer in spec.problems(difficulty):
+        if operands in seen:
+            continue
+        seen.add(operands)
+        problems.append(Problem(lesson, operands, answer, (answer,) + tuple(distractors(spec, operands, answer))))
+    return tuple(problems)
+
+
+class ProblemBank:
+    """
+    Deals a lesson's problems in random order without repeats:
+
+        problem = ProblemBank("addition", seed=1).draw()
+        a, b = problem.operands
+
+    Each draw is one step of a Fisher-Yates shuffle (O(1)); after every
+    problem has been drawn a new round starts, never opening with the
+    problem just shown. Options come shuffled, and commutative operands
+    randomly swapped. The same seed deals the same sequence.
+    """
+
+    def __init__(self, lesson, difficulty=DEFAULT_DIFFICULTY, seed=None):
+        self.lesson = lesson
+        self.difficulty = difficulty
+        self.spec = SPECS[lesson]
+        self.problems = build_problems(lesson, difficulty)
+        self.rng = random.Random(seed)
+        self._index = {p.operands: p for p in self.problems}
+        self._order = list(range(len(self.problems)))
+        self._left = len(self._order)  # Undrawn problems this round: _order[:_left]
+        self._last = None
+        self.rounds = 0
+
+    def __len__(self):
+        return len(self.problems)
+
+    def draw(self):
+        order = self._order
+        if not self._left:
+            self._left = len(order)
+            self.rounds += 1
+        j = self.rng.randrange(self._left)
+        if order[j] == self._last and self._left > 1:
+            j = (j + 1) % self._left
+        self._left -= 1
+        order[j], order[self._left] = order[self._left], order[j]
+        index = self._last = order[self._left]
+        return self._deal(self.problems[index])
+
+    def problem(self, operands):
+        """
+        The problem with these operands, dealt like draw() deals it
+        (shuffled options, maybe swapped operands); None if not in the bank.
+        """
+        base = self._index.get(tuple(operands))
+        return None if base is None else self._deal(base)
+
+    def _deal(self, base):
+        options = list(base.options)
+        self.rng.shuffle(options)
+        operands = base.operands
+        if self.spec.commutative and self.rng.random() < 0.5:
+            operands = operands[::-1]
+        return Problem(self.lesson, operands, base.answer, options)
+
+
+_banks = {}
+_seed = None
+
+
+def get_bank(lesson, difficulty=DEFAULT_DIFFICULTY):
+    """
+    The shared bank of a lesson at a difficulty, so a lesson opened again
+    does not repeat problems until all of them have been shown.
+    """
+    key = (lesson, difficulty)
+    bank = _banks.get(key)
+    if bank is None:
+        seed = None if _seed is None else f"{_seed}:{lesson}:{difficulty}"
+        bank = _banks[key] = ProblemBank(lesson, difficulty, seed)
+    return bank
+
+
+def seed_banks(seed):
+    """
+    Restart every shared bank from seed (None: unseeded), for
+    reproducible sessions and benchmarks.
+    """
+    global _seed
+    _seed = seed
+    _banks.clear()
+
+
+def next_problem(lesson):
+    """
+    The problem the learner model schedules next (its difficulty follows
+    the learner's level); report the answer with get_learner().record(
+    lesson, problem.item, ...). Falls back to the shared bank's draw().
+    """
+    operands, level = get_learner().next_item(lesson)
+    problem = None if operands is None else get_bank(lesson, level).problem(operands)
+    return problem or get_bank(lesson).draw()
+
+
+# Every lesson's items, by level, for the learner model
+for _lesson in SPECS:
+    register(_lesson, lambda level, lesson=_lesson: [p.operands for p in build_problems(lesson, level)])
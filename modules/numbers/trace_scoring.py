@@ -0,0 +1,219 @@
+import functools
+import cv2
+import numpy as np
+from modules.assets import get_assets
+
+# ✏️ Scores a traced digit against a template: coverage (how much of the
+#    digit the trail went over), precision (how much of the trail stayed
+#    on the digit) and order (whether it was traced in the usual stroke
+#    order). All three are array lookups into fields precomputed once per
+#    digit, so scoring a trail takes well under a millisecond.
+
+TEMPLATE_SIZE = (200, 300)  # (w, h), as drawn by TracingScene
+GLYPH_THICKNESS = 22        # Stroke width of generated glyphs
+TOLERANCE = 16              # px off the ink that still counts as on it
+SAMPLE_STEP = 6             # px between coverage samples along the path
+ORDER_STEP = 0.01           # Path fraction below which a move is ignored
+MARGIN = 40                 # px around the template where the trail is judged
+PASS_SCORE = 75
+MIN_COVERAGE = 0.8          # Each part must also clear its own bar, so a
+MIN_PRECISION = 0.65        # scribble over everything or a backwards
+MIN_ORDER = 0.7             # trace cannot pass on the other two
+TRAIL_CAPACITY = 512        # Frames of trail kept (~17 s at 30 fps)
+
+# Reference path of each digit in the usual stroke order, in template
+# fractions; None splits separate strokes
+DIGIT_PATHS = {
+    "0": [(0.5 + 0.3 * np.sin(t), 0.5 - 0.38 * np.cos(t)) for t in np.linspace(0, -2 * np.pi, 33)],
+    "1": [(0.32, 0.25), (0.55, 0.1), (0.55, 0.9)],
+    "2": [(0.25, 0.3), (0.32, 0.15), (0.5, 0.1), (0.68, 0.15), (0.75, 0.3), (0.68, 0.47),
+          (0.2, 0.9), (0.8, 0.9)],
+    "3": [(0.25, 0.2), (0.45, 0.1), (0.65, 0.13), (0.75, 0.28), (0.65, 0.43), (0.45, 0.48),
+          (0.68, 0.55), (0.78, 0.7), (0.68, 0.85), (0.45, 0.9), (0.22, 0.82)],
+    "4": [(0.6, 0.1), (0.2, 0.65), (0.85, 0.65), None, (0.65, 0.35), (0.65, 0.9)],
+    "5": [(0.75, 0.1), (0.3, 0.1), (0.27, 0.45), (0.5, 0.4), (0.7, 0.48), (0.78, 0.65),
+          (0.7, 0.83), (0.48, 0.9), (0.22, 0.8)],
+    "6": [(0.7, 0.12), (0.45, 0.25), (0.3, 0.45), (0.25, 0.68), (0.33, 0.85), (0.52, 0.9),
+          (0.72, 0.8), (0.75, 0.62), (0.6, 0.5), (0.4, 0.52), (0.27, 0.65)],
+    "7": [(0.2, 0.12), (0.8, 0.12), (0.4, 0.9)],
+    "8": [(0.7, 0.2), (0.5, 0.1), (0.3, 0.2), (0.35, 0.38), (0.65, 0.58), (0.72, 0.78),
+          (0.5, 0.9), (0.28, 0.78), (0.35, 0.58), (0.65, 0.38), (0.7, 0.2)],
+    "9": [(0.72, 0.28), (0.55, 0.12), (0.35, 0.15), (0.27, 0.32), (0.38, 0.47), (0.58, 0.47),
+          (0.72, 0.3), (0.72, 0.6), (0.68, 0.9)],
+}
+
+
+def _strokes(path, size):
+    # Template fractions -> list of (n, 2) float32 pixel polylines
+    w, h = size
+    strokes, current = [], []
+    for point in path + [None]:
+        if point is None:
+            if current:
+                strokes.append(np.float32(current) * (w, h))
+            current = []
+        else:
+            current.append(point)
+    return strokes
+
+
+def _resample(strokes, step):
+    # Points every `step` px along the strokes, with their path fraction
+    lengths = [np.linalg.norm(np.diff(s, axis=0), axis=1) for s in strokes]
+    total = sum(float(l.sum()) for l in lengths) or 1.0
+    points, fractions, done = [], [], 0.0
+    for stroke, seg in zip(strokes, lengths):
+        cumulative = np.concatenate(([0.0], np.cumsum(seg)))
+        at = np.arange(0.0, cumulative[-1] + 1e-6, step)
+        points.append(np.stack([np.interp(at, cumulative, stroke[:, 0]),
+                                np.interp(at, cumulative, stroke[:, 1])], axis=1))
+        fractions.append((done + at) / total)
+        done += cumulative[-1]
+    return np.concatenate(points).astype(np.float32), np.concatenate(fractions).astype(np.float32)
+
+
+class TraceTemplate:
+    """
+    Precomputed fields for one digit at one size:
+      distance  px from every pixel to the nearest ink (precision)
+      order     path fraction (0..1) of the nearest point on the
+                reference path (stroke order)
+      samples   points along the reference path (coverage)
+    """
+
+    def __init__(self, mask, strokes):
+        self.mask = mask
+        h, w = mask.shape
+        self.size = (w, h)
+        self.distance = cv2.distanceTransform(cv2.bitwise_not(mask), cv2.DIST_L2, 3)
+
+        self.samples, fractions = _resample(strokes, 1.0)
+        path = np.full((h, w), 255, np.uint8)
+        fraction_at = np.zeros((h, w), np.float32)
+        xs = np.clip(np.round(self.samples[:, 0]).astype(int), 0, w - 1)
+        ys = np.clip(np.round(self.samples[:, 1]).astype(int), 0, h - 1)
+        path[ys, xs] = 0
+        fraction_at[ys, xs] = fractions
+        # Labels number the zero pixels in row-major order, starting at 1
+        _, labels = cv2.distanceTransformWithLabels(path, cv2.DIST_L2, 3, labelType=cv2.DIST_LABEL_PIXEL)
+        lookup = np.concatenate(([0.0], fraction_at[path == 0])).astype(np.float32)
+        self.order = lookup[labels]
+        self.samples, _ = _resample(strokes, SAMPLE_STEP)
+
+    @classmethod
+    def for_digit(cls, digit, size=TEMPLATE_SIZE):
+        """
+        Template from assets/numbers/{digit}.png (dark or opaque pixels
+        are ink) or, without one, a glyph drawn along the reference path.
+        """
+        strokes = _strokes(DIGIT_PATHS[digit], size)
+        path = f"assets/numbers/{digit}.png"
+        image = cv2.imread(path, cv2.IMREAD_UNCHANGED) if get_assets().exists(path) else None
+        if image is None:
+            return cls(glyph_mask(strokes, size), strokes)
+        image = cv2.resize(image, size)
+        if image.ndim == 2:
+            image = cv2.cvtColor(image, cv2.COLOR_GRAY2BGR)
+        ink = cv2.cvtColor(image[:, :, :3], cv2.COLOR_BGR2GRAY) < 128
+        if image.shape[2] == 4:
+            ink &= image[:, :, 3] > 0
+        return cls(ink.astype(np.uint8) * 255, strokes)
+
+    def sprite_image(self, color=(255, 255, 255)):
+        # BGRA image of the ink, for a binary Sprite
+        image = np.zeros(self.mask.shape + (4,), np.uint8)
+        image[:, :, :3] = color
+        image[:, :, 3] = self.mask
+        return image
+
+
+def glyph_mask(strokes, size=TEMPLATE_SIZE, thickness=GLYPH_THICKNESS):
+    w, h = size
+    mask = np.zeros((h, w), np.uint8)
+    cv2.polylines(mask, [np.round(s).astype(np.int32) for s in strokes], False, 255, thickness, cv2.LINE_AA)
+    return cv2.threshold(mask, 127, 255, cv2.THRESH_BINARY)[1]
+
+
+@functools.lru_cache(maxsize=32)
+def get_template(digit, size=TEMPLATE_SIZE):
+    return TraceTemplate.for_digit(str(digit), size)
+
+
+class TraceScore:
+    __slots__ = ("coverage", "precision", "order", "score", "passed")
+
+    def __init__(self, coverage, precision, order):
+        self.coverage = coverage
+        self.precision = precision
+        self.order = order
+        self.score = round(100 * (0.5 * coverage + 0.3 * precision + 0.2 * order))
+        self.passed = (self.score >= PASS_SCORE and coverage >= MIN_COVERAGE
+                       and precision >= MIN_PRECISION and order >= MIN_ORDER)
+
+    def __repr__(self):
+        return (f"TraceScore({self.score}, coverage={self.coverage:.2f}, "
+                f"precision={self.precision:.2f}, order={self.order:.2f})")
+
+
+def score_trace(template, points, origin=(0, 0)):
+    """
+    Score an (n, 2) trail given in frame pixels, with the template's
+    top-left corner at origin. Trail points further than MARGIN from the
+    template (walking the finger in) are ignored.
+    """
+    w, h = template.size
+    points = np.asarray(points, np.float32) - origin
+    inside = ((points[:, 0] >= -MARGIN) & (points[:, 0] < w + MARGIN) &
+              (points[:, 1] >= -MARGIN) & (points[:, 1] < h + MARGIN))
+    points = points[inside]
+    if len(points) < 2:
+        return TraceScore(0.0, 0.0, 0.0)
+
+    xs = np.clip(np.round(points[:, 0]).astype(np.intp), 0, w - 1)
+    ys = np.clip(np.round(points[:, 1]).astype(np.intp), 0, h - 1)
+    clipped = (xs != np.round(points[:, 0])) | (ys != np.round(points[:, 1]))
+    on_ink = (template.distance[ys, xs] <= TOLERANCE) & ~clipped
+    precision = float(on_ink.mean())
+
+    # Coverage: reference samples under the trail, drawn as a thick line
+    trail = np.zeros((h, w), np.uint8)
+    cv2.polylines(trail, [np.round(points).astype(np.int32)], False, 255, 2 * TOLERANCE)
+    sx = np.clip(np.round(template.samples[:, 0]).astype(np.intp), 0, w - 1)
+    sy = np.clip(np.round(template.samples[:, 1]).astype(np.intp), 0, h - 1)
+    coverage = float((trail[sy, sx] > 0).mean())
+
+    # Order: the path fraction under the finger should mostly go up
+    fractions = template.order[ys[on_ink], xs[on_ink]]
+    steps = np.diff(fractions)
+    forward = int((steps > ORDER_STEP).sum())
+    backward = int((steps < -ORDER_STEP).sum())
+    order = forward / (forward + backward) if forward + backward else 0.0
+    return TraceScore(coverage, precision, order)
+
+
+class TrailBuffer:
+    """
+    The last `capacity` trail points in a fixed ring buffer: append() is
+    O(1) and points() returns them oldest first as one (n, 2) array.
+    """
+
+    def __init__(self, capacity=TRAIL_CAPACITY):
+        self.buffer = np.zeros((capacity, 2), np.float32)
+        self.capacity = capacity
+        self.count = 0   # Points ever appended
+
+    def __len__(self):
+        return min(self.count, self.capacity)
+
+    def append(self, point):
+        self.buffer[self.count % self.capacity] = point
+        self.count += 1
+
+    def clear(self):
+        self.count = 0
+
+    def points(self):
+        if self.count <= self.capacity:
+            return self.buffer[:self.count]
+        head = self.count % self.capacity
+        return np.concatenate((self.buffer[head:], self.buffer[:head]))
@@ -0,0 +1,232 @@
+import cv2
+import numpy as np
+
+TILE_STATES = 4  # Rendered states kept per widget, so toggling (hover, glow) is a copy
+
+
+def text_box(text, org, font, scale, thickness):
+    """
+    Box around what cv2.putText draws at org (baseline-left), with a
+    little slack for anti-aliasing.
+    """
+    (tw, th), baseline = cv2.getTextSize(text, font, scale, thickness)
+    x, y = org
+    pad = thickness + 2
+    return x - pad, y - th - pad, tw + 2 * pad, th + baseline + 2 * pad
+
+
+def union_box(a, b):
+    ax, ay, aw, ah = a
+    bx, by, bw, bh = b
+    x0, y0 = min(ax, bx), min(ay, by)
+    x1, y1 = max(ax + aw, bx + bw), max(ay + ah, by + bh)
+    return x0, y0, x1 - x0, y1 - y0
+
+
+def _intersect(a, b):
+    ax, ay, aw, ah = a
+    bx, by, bw, bh = b
+    return ax < bx + bw and bx < ax + aw and ay < by + bh and by < ay + ah
+
+
+class OverlayWidget:
+    __slots__ = ("box", "draw", "state", "tiles")
+
+    def __init__(self, box, draw, state=None):
+        self.box = box
+        self.draw = draw
+        self.state = state
+        self.tiles = {}  # state -> rendered (colour, inverse, opaque, blend)
+
+
+class Overlay:
+    """
+    🖼 Retained-mode UI layer.
+
+    Widgets are registered once with a box and a draw(img, state) function
+    made of ordinary cv2 calls; they are rasterized into a cached overlay
+    (premultiplied colour + alpha). Each frame, opaque overlay pixels are
+    copied under a mask and only the few semi-transparent ones (anti-aliased
+    edges) are blended, inside the widgets' areas only. Changing a widget's
+    state only re-renders the widgets overlapping its box, and only the
+    masks of the areas it touches are rebuilt; a widget that overlaps no
+    other keeps its last few rendered states, so a hover toggle is a copy.
+    draw() should therefore depend on nothing but its state.
+
+    A widget must not draw outside its box (cv2 shapes may touch its right
+    and bottom edge). Drawing each dirty region on a black and a white
+    background gives both the premultiplied colour and the coverage, so
+    anti-aliased text keeps its soft edges.
+    """
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.widgets = {}  # name -> OverlayWidget, in draw order
+        self.color = np.zeros((height, width, 3), np.uint8)      # premultiplied
+        self.inverse = np.full((height, width), 255, np.uint8)   # 255 - alpha
+        self._black = np.zeros((height, width, 3), np.uint8)
+        self._white = np.zeros((height, width, 3), np.uint8)
+        self._opaque = np.zeros((height, width), np.uint8)      # inverse == 0, kept per area
+        self.dirty = []
+        self.areas = []        # Disjoint boxes covering every widget; only these are composited
+        self._areas_stale = False
+        self._blends = {}      # area -> (rows, cols, colour, inverse) of its semi-transparent pixels
+        self._partial = None   # All areas' blends, concatenated
+        self._alone = {}       # area -> its widget, for areas holding just that one
+
+    def _clip(self, box):
+        x, y, w, h = box
+        x0, y0 = max(0, x), max(0, y)
+        x1, y1 = min(self.width, x + w), min(self.height, y + h)
+        if x1 <= x0 or y1 <= y0:
+            return None
+        return x0, y0, x1 - x0, y1 - y0
+
+    def add(self, name, box, draw, state=None):
+        x, y, w, h = box
+        box = self._clip((x, y, w + 1, h + 1))  # cv2 shapes include their end point
+        if box is None:
+            return
+        if name in self.widgets:
+            self.remove(name)
+        self.widgets[name] = OverlayWidget(box, draw, state)
+        self.dirty.append(box)
+        self._areas_stale = True
+
+    def add_text(self, name, text, org, font, scale, color, thickness=1):
+        def draw(img, state):
+            cv2.putText(img, text, org, font, scale, color, thickness, cv2.LINE_AA)
+        self.add(name, text_box(text, org, font, scale, thickness), draw)
+
+    def remove(self, name):
+        widget = self.widgets.pop(name, None)
+        if widget is not None:
+            self.dirty.append(widget.box)
+            self._areas_stale = True
+
+    def clear(self):
+        self.widgets = {}
+        self.color[:] = 0
+        self.inverse[:] = 255
+        self._opaque[:] = 0
+        self.dirty = []
+        self.areas = []
+        self._areas_stale = False
+        self._blends = {}
+        self._partial = None
+        self._alone = {}
+
+    def set_state(self, name, state):
+        widget = self.widgets[name]
+        if widget.state != state:
+            widget.state = state
+            self.dirty.append(widget.box)
+
+    def _merge_areas(self):
+        # Widget boxes, with overlapping ones merged, so no pixel is composited twice
+        areas = []
+        for box in (widget.box for widget in self.widgets.values()):
+            while True:
+                hit = next((area for area in areas if _intersect(area, box)), None)
+                if hit is None:
+                    break
+                areas.remove(hit)
+                box = union_box(box, hit)
+            areas.append(box)
+        return areas
+
+    def _tile_key(self, widget):
+        # A widget alone in its area can be cached per state (if the state is hashable)
+        if self._alone.get(widget.box) is not widget:
+            return None
+        try:
+            hash(widget.state)
+        except TypeError:
+            return None
+        return (widget.state,)  # Wrapped, so None / False states are keys too
+
+    def _rasterize(self, region):
+        x, y, w, h = region
+        black = self._black[y:y + h, x:x + w]
+        white = self._white[y:y + h, x:x + w]
+        black[:] = 0
+        white[:] = 255
+        for widget in self.widgets.values():
+            if _intersect(widget.box, region):
+                widget.draw(self._black, widget.state)
+                widget.draw(self._white, widget.state)
+        # On black the result is colour * alpha; white - black = 255 - alpha
+        # in every channel, whatever the colour
+        self.color[y:y + h, x:x + w] = black
+        self.inverse[y:y + h, x:x + w] = cv2.subtract(white[:, :, 0], black[:, :, 0])
+
+    def _rebuild(self, area):
+        # Opaque mask and semi-transparent pixels of one area
+        x, y, w, h = area
+        inverse = self.inverse[y:y + h, x:x + w]
+        cv2.compare(inverse, 0, cv2.CMP_EQ, dst=self._opaque[y:y + h, x:x + w])
+        points = cv2.findNonZero(cv2.inRange(inverse, 1, 254))
+        points = np.empty((0, 2), np.intp) if points is None else points.reshape(-1, 2)
+        rows, cols = points[:, 1], points[:, 0]
+        self._blends[area] = (rows + y, cols + x,
+                              self.color[y:y + h, x:x + w][rows, cols].astype(np.uint16),
+                              inverse[rows, cols].astype(np.uint16)[:, None])
+
+    def render(self):
+        # Re-rasterize only the dirty regions, and rebuild only their areas' masks
+        dirty, self.dirty = self.dirty, []
+        if not dirty:
+            return
+        if self._areas_stale:
+            self.areas = self._merge_areas()
+            self._areas_stale = False
+            self._blends = {area: blend for area, blend in self._blends.items() if area in self.areas}
+            # Areas that are exactly one widget's box with no other widget in them
+            members = {area: [w for w in self.widgets.values() if _intersect(w.box, area)] for area in self.areas}
+            self._alone = {area: found[0] for area, found in members.items()
+                           if len(found) == 1 and found[0].box == area}
+
+        done = set()
+        for region in dirty:
+            widget = self._alone.get(region)
+            key = self._tile_key(widget) if widget else None
+            tile = widget.tiles.get(key) if key else None
+            if tile is not None:
+                x, y, w, h = region
+                color, inverse, opaque, self._blends[region] = tile
+                self.color[y:y + h, x:x + w] = color
+                self.inverse[y:y + h, x:x + w] = inverse
+                self._opaque[y:y + h, x:x + w] = opaque
+                done.add(region)
+            else:
+                self._rasterize(region)
+
+        for area in self.areas:
+            if area in done or (area in self._blends and not any(_intersect(area, region) for region in dirty)):
+                continue
+            self._rebuild(area)
+            widget = self._alone.get(area)
+            key = self._tile_key(widget) if widget else None
+            if key:
+                if len(widget.tiles) >= TILE_STATES:
+                    widget.tiles.pop(next(iter(widget.tiles)))
+                x, y, w, h = area
+                widget.tiles[key] = (self.color[y:y + h, x:x + w].copy(), self.inverse[y:y + h, x:x + w].copy(),
+                                     self._opaque[y:y + h, x:x + w].copy(), self._blends[area])
+        blends = [self._blends[area] for area in self.areas]
+        self._partial = tuple(np.concatenate(parts) for parts in zip(*blends)) if blends else None
+
+    def composite(self, frame):
+        """
+        Draw the overlay onto frame in place: frame * (1 - alpha) + colour.
+        """
+        self.render()
+        for x, y, w, h in self.areas:
+            cv2.copyTo(self.color[y:y + h, x:x + w], self._opaque[y:y + h, x:x + w], frame[y:y + h, x:x + w])
+        if self._partial is not None:
+            rows, cols, color, inverse = self._partial
+            if len(rows):
+                blended = (frame[rows, cols] * inverse + 127) // 255 + color
+                frame[rows, cols] = np.minimum(blended, 255)
+        return frame
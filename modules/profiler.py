@@ -0,0 +1,205 @@
+import json
+import threading
+import time
+import cv2
+import numpy as np
+
+# ⏱ Named timing spans in a fixed-size ring buffer, an FPS / latency HUD
+#    and Chrome trace export (open the JSON in chrome://tracing or Perfetto).
+#    Disabled, span() hands back one shared no-op context manager, so the
+#    instrumented code pays a function call and an attribute check.
+
+CAPACITY = 16384       # Spans kept; the oldest are overwritten
+FRAME_CAPACITY = 512   # Frame times kept for FPS / latency
+HUD_REFRESH = 0.5      # Seconds between HUD recomputes
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler.add(self.name, self.start, time.perf_counter())
+        return False
+
+
+class Profiler:
+    """
+    Collects (name, thread, start, end) spans from any thread.
+
+        with get_profiler().span("tracking"):
+            poses = tracker.get_poses(frame)
+
+    add() records a span measured elsewhere; frame() marks the end of a
+    displayed frame for the HUD's FPS and frame time.
+    """
+
+    def __init__(self, capacity=CAPACITY, enabled=False):
+        self.capacity = capacity
+        self.enabled = enabled
+        self.hud = False
+        self.names = []      # id -> name
+        self._ids = {}       # name -> id
+        self._name = np.zeros(capacity, np.int32)
+        self._thread = np.zeros(capacity, np.int64)
+        self._start = np.zeros(capacity, np.float64)
+        self._end = np.zeros(capacity, np.float64)
+        self._frames = np.zeros((FRAME_CAPACITY, 2), np.float64)  # (start, end)
+        self.count = 0
+        self.frame_count = 0
+        self.origin = time.perf_counter()
+        self._threads = {}   # ident -> name
+        self._hud_lines = []
+        self._hud_time = float("-inf")
+        self._lock = threading.Lock()
+
+    def span(self, name):
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name)
+
+    def add(self, name, start, end):
+        if not self.enabled:
+            return
+        thread = threading.get_ident()
+        with self._lock:
+            name_id = self._ids.get(name)
+            if name_id is None:
+                name_id = self._ids[name] = len(self.names)
+                self.names.append(name)
+            if thread not in self._threads:
+                self._threads[thread] = threading.current_thread().name
+            i = self.count % self.capacity
+            self._name[i] = name_id
+            self._thread[i] = thread
+            self._start[i] = start
+            self._end[i] = end
+            self.count += 1
+
+    def frame(self, start, end):
+        if not self.enabled:
+            return
+        self._frames[self.frame_count % FRAME_CAPACITY] = (start, end)
+        self.frame_count += 1
+
+    def clear(self):
+        with self._lock:
+            self.count = 0
+            self.frame_count = 0
+
+    def _valid(self):
+        return min(self.count, self.capacity)
+
+    # === Reports ===
+
+    def stats(self, name=None):
+        """
+        {name: {count, mean_ms, p50_ms, p95_ms, max_ms}} over the spans
+        still in the buffer (or just the one name).
+        """
+        with self._lock:
+            n = self._valid()
+            ids = self._name[:n].copy()
+            durations = (self._end[:n] - self._start[:n]) * 1000
+            names = list(self.names)
+        report = {}
+        for name_id, span_name in enumerate(names):
+            if name is not None and span_name != name:
+                continue
+            values = durations[ids == name_id]
+            if not len(values):
+                continue
+            p50, p95 = np.percentile(values, (50, 95))
+            report[span_name] = {"count": len(values), "mean_ms": float(values.mean()),
+                                 "p50_ms": float(p50), "p95_ms": float(p95),
+                                 "max_ms": float(values.max())}
+        return report
+
+    def frame_stats(self):
+        """
+        FPS over the kept frames and frame time (capture to display) in ms.
+        """
+        n = min(self.frame_count, FRAME_CAPACITY)
+        if n < 2:
+            return {"fps": 0.0, "p50_ms": 0.0, "p95_ms": 0.0}
+        frames = self._frames[:n]
+        durations = (frames[:, 1] - frames[:, 0]) * 1000
+        span = frames[:, 1].max() - frames[:, 1].min()
+        p50, p95 = np.percentile(durations, (50, 95))
+        return {"fps": (n - 1) / span if span > 0 else 0.0, "p50_ms": float(p50), "p95_ms": float(p95)}
+
+    def export_chrome_trace(self, path):
+        """
+        Write the buffered spans as Chrome trace JSON ("X" events, one
+        track per thread). Returns the number of spans written.
+        """
+        with self._lock:
+            n = self._valid()
+            order = np.argsort(self._start[:n], kind="stable")
+            ids, threads = self._name[:n][order], self._thread[:n][order]
+            starts, ends = self._start[:n][order], self._end[:n][order]
+            names, thread_names = list(self.names), dict(self._threads)
+
+        tids = {ident: i for i, ident in enumerate(thread_names)}
+        events = [{"name": "thread_name", "ph": "M", "pid": 0, "tid": tids[ident],
+                   "args": {"name": thread_name}} for ident, thread_name in thread_names.items()]
+        for name_id, thread, start, end in zip(ids.tolist(), threads.tolist(), starts.tolist(), ends.tolist()):
+            events.append({"name": names[name_id], "ph": "X", "pid": 0, "tid": tids.get(thread, 0),
+                           "ts": (start - self.origin) * 1e6, "dur": (end - start) * 1e6})
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+        return n
+
+    def draw_hud(self, frame, spans=6):
+        """
+        FPS, frame time and the slowest spans (p50 / p95 ms) in the top-left
+        corner. The numbers are recomputed every HUD_REFRESH seconds.
+        """
+        now = time.perf_counter()
+        if now - self._hud_time >= HUD_REFRESH:
+            frames = self.frame_stats()
+            lines = [f"{frames['fps']:5.1f} fps  frame {frames['p50_ms']:.1f}/{frames['p95_ms']:.1f} ms"]
+            slowest = sorted(self.stats().items(), key=lambda item: -item[1]["p50_ms"])[:spans]
+            lines += [f"{name:<16}{s['p50_ms']:6.2f} {s['p95_ms']:6.2f}" for name, s in slowest]
+            self._hud_lines, self._hud_time = lines, now
+        lines = self._hud_lines
+
+        font, scale = cv2.FONT_HERSHEY_PLAIN, 1.0
+        height = 16 * len(lines) + 8
+        roi = frame[:height, :320]
+        roi //= 3  # Darken for contrast, in place
+        for i, line in enumerate(lines):
+            cv2.putText(frame, line, (6, 16 + 16 * i), font, scale, (0, 255, 0), 1)
+        return frame
+
+
+_profiler = None
+_profiler_lock = threading.Lock()
+
+
+def get_profiler():
+    global _profiler
+    with _profiler_lock:
+        if _profiler is None:
+            _profiler = Profiler()
+    return _profiler
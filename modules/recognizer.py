@@ -0,0 +1,189 @@
+import functools
+import math
+import cv2
+import numpy as np
+
+# 🔤 Recognizes a digit or capital letter written in the air, from the
+#    strokes of a Canvas (or any list of (n, 2) point arrays). Strokes are
+#    drawn into a small square image, shrunk to a 16 x 16 feature and
+#    matched (k nearest neighbours, cosine similarity) against glyphs
+#    rendered from OpenCV's Hershey stroke fonts plus the tracing paths,
+#    each distorted a few ways. No training step, no extra dependency;
+#    one recognition is a 256-wide matrix-vector product.
+
+DIGITS = "0123456789"
+LETTERS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+CANVAS = 64          # Glyphs are drawn on a CANVAS x CANVAS image
+BOX = 52             # Longest side of a glyph on that image
+LINE = 5             # Stroke width on that image
+FEATURE = 16         # Feature image side
+NEIGHBOURS = 3
+MIN_CONFIDENCE = 0.6  # Below this cosine similarity, no answer
+FONTS = [cv2.FONT_HERSHEY_SIMPLEX, cv2.FONT_HERSHEY_PLAIN, cv2.FONT_HERSHEY_DUPLEX,
+         cv2.FONT_HERSHEY_COMPLEX, cv2.FONT_HERSHEY_TRIPLEX,
+         cv2.FONT_HERSHEY_SIMPLEX | cv2.FONT_ITALIC, cv2.FONT_HERSHEY_PLAIN | cv2.FONT_ITALIC]
+# (rotation degrees, shear, x scale) applied to every template glyph
+DISTORTIONS = [(0, 0, 1.0), (-10, 0, 1.0), (10, 0, 1.0), (0, 0.25, 1.0), (0, -0.2, 1.0),
+               (0, 0, 0.75), (0, 0, 1.25), (6, 0.15, 0.9)]
+
+
+def rasterize(strokes):
+    """
+    Strokes (a list of (n, 2) arrays in any units) drawn on a CANVAS
+    image, scaled so the longest side is BOX and centred; None if there
+    are no points.
+    """
+    strokes = [np.asarray(s, np.float32).reshape(-1, 2) for s in strokes if len(s)]
+    if not strokes:
+        return None
+    points = np.concatenate(strokes)
+    low, high = points.min(axis=0), points.max(axis=0)
+    scale = BOX / max(float((high - low).max()), 1.0)
+    offset = (CANVAS - (high - low) * scale) / 2 - low * scale
+    image = np.zeros((CANVAS, CANVAS), np.uint8)
+    for stroke in strokes:
+        pts = np.round((stroke * scale + offset) * 16).astype(np.int32)  # 4 fractional bits
+        if len(pts) == 1:
+            cv2.circle(image, tuple(int(v) for v in pts[0]), LINE * 8, 255, -1, cv2.LINE_AA, 4)
+        else:
+            cv2.polylines(image, [pts], False, 255, LINE, cv2.LINE_AA, 4)
+    return image
+
+
+def features(image):
+    """
+    Unit-length FEATURE x FEATURE vector of a glyph image: the ink is
+    cropped, padded to a square (keeping its aspect) and shrunk.
+    """
+    ys, xs = np.nonzero(image)
+    if not len(xs):
+        return np.zeros(FEATURE * FEATURE, np.float32)
+    x0, x1, y0, y1 = xs.min(), xs.max() + 1, ys.min(), ys.max() + 1
+    side = max(x1 - x0, y1 - y0)
+    square = np.zeros((side, side), np.uint8)
+    dx, dy = (side - (x1 - x0)) // 2, (side - (y1 - y0)) // 2
+    square[dy:dy + y1 - y0, dx:dx + x1 - x0] = image[y0:y1, x0:x1]
+    vector = cv2.resize(square, (FEATURE, FEATURE), interpolation=cv2.INTER_AREA).astype(np.float32).ravel()
+    vector -= vector.mean()
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
+
+def render_glyph(char, font):
+    # A font glyph drawn like rasterize() draws strokes: BOX tall, LINE wide
+    probe = np.zeros((120, 120), np.uint8)
+    cv2.putText(probe, char, (20, 90), font, 2, 255, 1)
+    ys, xs = np.nonzero(probe)
+    if not len(xs):
+        return None
+    scale = BOX / max(xs.max() - xs.min() + 1, ys.max() - ys.min() + 1)
+    cx, cy = (xs.min() + xs.max()) / 2 - 20, (ys.min() + ys.max()) / 2 - 90
+    origin = (int(round(CANVAS / 2 - cx * scale)), int(round(CANVAS / 2 - cy * scale)))
+    image = np.zeros((CANVAS, CANVAS), np.uint8)
+    cv2.putText(image, char, origin, font, 2 * scale, 255, LINE, cv2.LINE_AA)
+    return image
+
+
+def distort(image, rotation, shear, x_scale):
+    # Rotate, shear and stretch about the centre, shrunk a little so
+    # nothing is pushed off the canvas (features() crops it again)
+    c = CANVAS / 2
+    r = math.radians(rotation)
+    rotate = np.float32([[math.cos(r), -math.sin(r)], [math.sin(r), math.cos(r)]])
+    linear = 0.8 * rotate @ np.float32([[x_scale, shear], [0, 1]])
+    matrix = np.hstack([linear, ((c, c) - linear @ (c, c)).reshape(2, 1)])
+    return cv2.warpAffine(image, matrix, (CANVAS, CANVAS))
+
+
+def template_images(labels=DIGITS + LETTERS, fonts=FONTS, paths=True):
+    """
+    (label, image) pairs: every label in every font, plus the tracing
+    lesson's digit paths, each with every DISTORTIONS entry.
+    """
+    glyphs = [(char, render_glyph(char, font)) for char in labels for font in fonts]
+    if paths:
+        from modules.numbers.trace_scoring import DIGIT_PATHS, _strokes
+        glyphs += [(digit, rasterize(_strokes(path, (200, 300))))
+                   for digit, path in DIGIT_PATHS.items() if digit in labels]
+    return [(char, distort(image, *d)) for char, image in glyphs if image is not None for d in DISTORTIONS]
+
+
+class GlyphRecognizer:
+    """
+    k-nearest-neighbour glyph classifier over template features.
+
+        label, confidence = get_recognizer().recognize(strokes, DIGITS)
+
+    `labels` narrows the answer to a subset (e.g. digits only in the
+    numbers lessons); the template rows of each subset are cached.
+    """
+
+    def __init__(self, templates=None, k=NEIGHBOURS):
+        templates = template_images() if templates is None else templates
+        self.k = k
+        self.labels = np.array([label for label, _ in templates])
+        self.matrix = np.stack([features(image) for _, image in templates])
+        self._subsets = {}
+
+    def _subset(self, labels):
+        subset = self._subsets.get(labels)
+        if subset is None:
+            rows = np.flatnonzero(np.isin(self.labels, list(labels)))
+            subset = self._subsets[labels] = (np.ascontiguousarray(self.matrix[rows]), self.labels[rows])
+        return subset
+
+    def classify(self, vector, labels=None):
+        matrix, names = (self.matrix, self.labels) if labels is None else self._subset(labels)
+        similarity = matrix @ vector
+        k = min(self.k, len(similarity))
+        best = np.argpartition(-similarity, k - 1)[:k]
+        votes = {}
+        for i in best.tolist():
+            votes[names[i]] = votes.get(names[i], 0.0) + float(similarity[i])
+        label = max(votes, key=votes.get)
+        confidence = max(float(similarity[i]) for i in best.tolist() if names[i] == label)
+        return str(label), confidence
+
+    def recognize(self, strokes, labels=None):
+        """
+        (label, confidence) for the strokes; label is None when there is
+        nothing to read or the best match is below MIN_CONFIDENCE.
+        """
+        image = rasterize(strokes)
+        if image is None:
+            return None, 0.0
+        label, confidence = self.classify(features(image), labels)
+        return (label, confidence) if confidence >= MIN_CONFIDENCE else (None, confidence)
+
+    def read_number(self, strokes):
+        """
+        Digits written left to right -> int, or None. Strokes whose
+        x ranges overlap belong to the same digit.
+        """
+        digits = []
+        for group in group_glyphs(strokes):
+            label, _ = self.recognize(group, DIGITS)
+            if label is None:
+                return None
+            digits.append(label)
+        return int("".join(digits)) if digits else None
+
+
+def group_glyphs(strokes):
+    # Strokes sorted by left edge and merged while their x ranges overlap
+    spans = sorted(((float(np.min(s[:, 0])), float(np.max(s[:, 0])), s)
+                    for s in (np.asarray(s, np.float32).reshape(-1, 2) for s in strokes) if len(s)),
+                   key=lambda span: span[0])
+    groups = []
+    for x0, x1, stroke in spans:
+        if groups and x0 <= groups[-1][1]:
+            groups[-1][1] = max(groups[-1][1], x1)
+            groups[-1][2].append(stroke)
+        else:
+            groups.append([x0, x1, [stroke]])
+    return [group for _, _, group in groups]
+
+
+@functools.lru_cache(maxsize=1)
+def get_recognizer():
+    return GlyphRecognizer()
@@ -0,0 +1,260 @@
+import queue
+import struct
+import sys
+import threading
+import time
+import cv2
+import numpy as np
+from modules.hand_pose import HandPose, draw_poses
+
+# 🎞 Session recordings: the landmarks every lesson saw, frame by frame,
+#    optionally with the (JPEG) frames. Replaying one needs no camera and
+#    no MediaPipe, and hands the lessons exactly the same poses again.
+#
+# File layout (little endian):
+#   MAGIC
+#   per frame:  RECORD  timestamp (f64, monotonic seconds), width, height (u16),
+#                       hand count (u8), image bytes (u32)
+#   per hand:   HAND    hand_id (i32), side (u8, see SIDES), score (f32)
+#               then 21 x 3 float32 normalized landmarks (x, y, z)
+#   then the JPEG image, if any, flipped back to camera orientation so
+#   the App's mirror flip on replay shows it the way the lesson saw it
+
+MAGIC = b"AIRREC1\n"
+RECORD = struct.Struct("<dHHBI")
+HAND = struct.Struct("<iBf")
+POINTS_BYTES = 21 * 3 * 4
+SIDES = [None, "Left", "Right"]
+
+
+class FrameRecord:
+    __slots__ = ("timestamp", "size", "poses", "image")
+
+    def __init__(self, timestamp, size, poses, image=None):
+        self.timestamp = timestamp
+        self.size = size      # (width, height) of the frame the lesson saw
+        self.poses = poses    # [(hand_id, side, score, (21, 3) float32 points)]
+        self.image = image    # Encoded JPEG bytes or None
+
+    def hand_poses(self, frame_size=None):
+        size = frame_size or self.size
+        return [HandPose(points, size, side, score, self.timestamp, hand_id)
+                for hand_id, side, score, points in self.poses]
+
+    def decode_image(self):
+        if not self.image:
+            return None
+        return cv2.imdecode(np.frombuffer(self.image, np.uint8), cv2.IMREAD_COLOR)
+
+
+def write_record(stream, record):
+    stream.write(RECORD.pack(record.timestamp, record.size[0], record.size[1],
+                             len(record.poses), len(record.image or b"")))
+    for hand_id, side, score, points in record.poses:
+        stream.write(HAND.pack(hand_id, SIDES.index(side) if side in SIDES else 0, score))
+        stream.write(np.ascontiguousarray(points, dtype="<f4").tobytes())
+    if record.image:
+        stream.write(record.image)
+
+
+def read_records(path):
+    """
+    Yields the FrameRecords of a recording, in order.
+    """
+    with open(path, "rb") as stream:
+        if stream.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} is not a session recording")
+        while True:
+            header = stream.read(RECORD.size)
+            if len(header) < RECORD.size:
+                return
+            timestamp, width, height, hands, image_bytes = RECORD.unpack(header)
+            poses = []
+            for _ in range(hands):
+                hand_id, side, score = HAND.unpack(stream.read(HAND.size))
+                points = np.frombuffer(stream.read(POINTS_BYTES), "<f4").reshape(21, 3).astype(np.float32)
+                poses.append((hand_id, SIDES[side] if side < len(SIDES) else None, score, points))
+            image = stream.read(image_bytes) if image_bytes else None
+            yield FrameRecord(timestamp, (width, height), poses, image)
+
+
+class Recorder:
+    """
+    Writes FrameRecords on a background thread. record() only copies the
+    landmarks (and the frame, if frames are kept) into a queue; packing,
+    JPEG encoding and disk writes happen on the worker. When the worker
+    falls behind, frames are dropped and counted rather than stalling
+    the lesson.
+    """
+
+    def __init__(self, path, save_frames=False, jpeg_quality=80, queue_size=64):
+        self.path = path
+        self.save_frames = save_frames
+        self.jpeg_quality = jpeg_quality
+        self.frames = 0
+        self.dropped = 0
+        self._queue = queue.Queue(queue_size)
+        self._stream = open(path, "wb")
+        self._stream.write(MAGIC)
+        self._thread = threading.Thread(target=self._run, name="Recorder", daemon=True)
+        self._thread.start()
+
+    def record(self, frame, poses, timestamp=None):
+        timestamp = time.monotonic() if timestamp is None else timestamp
+        hands = [(pose.hand_id, pose.handedness, pose.score, pose.points.copy()) for pose in poses]
+        image = frame.copy() if self.save_frames else None
+        try:
+            self._queue.put_nowait((timestamp, (frame.shape[1], frame.shape[0]), hands, image))
+        except queue.Full:
+            self.dropped += 1
+
+    def _run(self):
+        params = [cv2.IMWRITE_JPEG_QUALITY, self.jpeg_quality]
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+            timestamp, size, hands, image = item
+            if image is not None:
+                ok, encoded = cv2.imencode(".jpg", cv2.flip(image, 1), params)
+                image = encoded.tobytes() if ok else None
+            write_record(self._stream, FrameRecord(timestamp, size, hands, image))
+            self.frames += 1
+        self._stream.close()
+
+    def close(self):
+        if self._thread is None:
+            return
+        self._queue.put(None)
+        self._thread.join()
+        self._thread = None
+
+
+class RecordingTracker:
+    """
+    Wraps a tracker (HandTracker, PipelineTracker, ...) and records the
+    poses it hands out, exactly as the lesson receives them.
+    """
+
+    def __init__(self, tracker, recorder):
+        self.tracker = tracker
+        self.recorder = recorder
+
+    def get_poses(self, frame):
+        poses = self.tracker.get_poses(frame)
+        self.recorder.record(frame, poses)
+        return poses
+
+    def get_landmarks(self, frame):
+        poses = self.get_poses(frame)
+        return poses[0] if poses else None
+
+    def set_filter(self, preset):
+        return self.tracker.set_filter(preset)
+
+    def draw_hand(self, frame):
+        self.tracker.draw_hand(frame)
+
+
+class ReplaySource:
+    """
+    A recording played back as a capture: read() returns the recorded
+    frame (or a blank one when frames were not kept) and .tracker returns
+    the poses recorded for it, so both drop in where cap / tracker go:
+
+        source = ReplaySource("session.rec")
+        App(source, source.tracker).run(AdditionScene())
+
+    Filters are not applied again; the recorded poses are already what the
+    lesson saw. realtime=True paces reads like the original session, which
+    hold-to-select gestures need (they time holds on the wall clock).
+    """
+
+    def __init__(self, path, realtime=False, loop=False):
+        self.path = path
+        self.realtime = realtime
+        self.loop = loop
+        self.tracker = ReplayTracker(self)
+        self.current = None
+        self._records = read_records(path)
+        self._start = None  # (recorded, wall) time of the first frame
+
+    def isOpened(self):
+        return True
+
+    def _next(self):
+        record = next(self._records, None)
+        if record is None and self.loop:
+            self._records = read_records(self.path)
+            self._start = None
+            record = next(self._records, None)
+        return record
+
+    def read(self, image=None):
+        record = self._next()
+        if record is None:
+            return False, None
+        if self.realtime:
+            now = time.monotonic()
+            if self._start is None:
+                self._start = (record.timestamp, now)
+            delay = record.timestamp - self._start[0] - (now - self._start[1])
+            if delay > 0:
+                time.sleep(delay)
+        self.current = record
+        frame = record.decode_image()
+        if frame is None:
+            width, height = record.size
+            frame = np.zeros((height, width, 3), np.uint8)
+        return True, frame
+
+    def release(self):
+        self._records.close()
+
+
+class ReplayTracker:
+    """
+    Tracker side of a ReplaySource: the poses recorded for the frame that
+    was read last, mapped onto whatever frame the lesson passes in.
+    """
+
+    def __init__(self, source):
+        self.source = source
+        self.poses = []
+
+    def get_poses(self, frame):
+        record = self.source.current
+        self.poses = record.hand_poses((frame.shape[1], frame.shape[0])) if record else []
+        return self.poses
+
+    def get_landmarks(self, frame):
+        poses = self.get_poses(frame)
+        return poses[0] if poses else None
+
+    def set_filter(self, preset):
+        return None  # Recorded poses are already filtered
+
+    def draw_hand(self, frame):
+        draw_poses(frame, self.poses)
+
+
+def main():
+    # Summary of a recording
+    if len(sys.argv) < 2:
+        print("python -m modules.recording session.rec")
+        return
+    frames = hands = image_bytes = 0
+    first = last = None
+    for record in read_records(sys.argv[1]):
+        frames += 1
+        hands += len(record.poses)
+        image_bytes += len(record.image or b"")
+        first = record.timestamp if first is None else first
+        last = record.timestamp
+    duration = (last - first) if frames > 1 else 0.0
+    print(f"🎞 {frames} frames, {duration:.1f}s, {hands / max(frames, 1):.2f} hands per frame, "
+          f"{image_bytes / 1024:.0f} KiB of images")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,218 @@
+import time
+import cv2
+from modules.profiler import get_profiler
+from modules.frame_pool import FramePool
+
+WINDOW = "🟦 Touchless Tutor"
+LESSON_SIZE = (640, 480)
+
+
+class Scene:
+    """
+    🎬 One screen of the app (a menu or a lesson).
+
+    The App owns the loop: each frame it captures, flips and resizes the
+    image to `size`, tracks hands, runs the scene's gesture engine (if it
+    has one) against its hit test, then calls update() and render().
+    Scenes move between each other with self.app.push/pop/replace instead
+    of calling each other's loops.
+    """
+
+    size = LESSON_SIZE       # Frame size for this scene; None keeps the camera's
+    tracking_filter = "menu"  # Landmark smoothing preset while on top
+
+    def __init__(self):
+        self.app = None
+        self.gestures = None   # GestureEngine, run by the App
+        self.hit_test = None   # Callable (x, y) -> target for the gestures
+
+    def enter(self, app):
+        self.app = app
+
+    def resume(self):
+        # The scene above this one was popped
+        if self.gestures is not None:
+            self.gestures.reset()
+
+    def exit(self):
+        pass
+
+    def update(self, poses, events, dt):
+        pass
+
+    def render(self, frame):
+        pass
+
+
+class WindowDisplay:
+    """
+    Shows frames in an OpenCV window. show() returns the key pressed
+    (or None); headless runs swap in a display that never opens a window.
+    """
+
+    def __init__(self, window=WINDOW):
+        self.window = window
+
+    def show(self, frame):
+        cv2.imshow(self.window, frame)
+        return cv2.waitKey(1) & 0xFF
+
+    def close(self):
+        try:
+            cv2.destroyWindow(self.window)
+        except cv2.error:
+            pass
+
+
+class App:
+    """
+    Single main loop with a scene stack. Capture, tracking, gestures and
+    display happen once per frame here, in one window.
+
+    Each stage of a frame is timed as a profiler span ("capture.read",
+    "capture.flip", "capture.resize", "tracking", "logic.gestures",
+    "logic.update", "render.scene", "render.hands", "render.hud",
+    "display"). on_stage, when set, is also called as on_stage(stage,
+    seconds) with the part before the dot ("capture", "tracking", ...).
+    The "p" key toggles the profiler HUD.
+    """
+
+    def __init__(self, cap, tracker, window=WINDOW, display=None):
+        self.cap = cap
+        self.tracker = tracker
+        self.display = display or WindowDisplay(window)
+        self.stack = []
+        self.frame_size = None
+        self.on_stage = None
+        self.profiler = get_profiler()
+        self.pool = FramePool()   # Flip / resize outputs, reused every frame
+        self._capture = None      # Last captured array, read into again
+        self._first_frame = None
+        self._filter = None
+        self._last_time = None
+
+    @property
+    def scene(self):
+        return self.stack[-1] if self.stack else None
+
+    def push(self, scene):
+        self.stack.append(scene)
+        scene.enter(self)
+        self._apply_filter()
+
+    def pop(self):
+        if self.stack:
+            self.stack.pop().exit()
+        if self.stack:
+            self.stack[-1].resume()
+            self._apply_filter()
+
+    def replace(self, scene):
+        if self.stack:
+            self.stack.pop().exit()
+        self.push(scene)
+
+    def quit(self):
+        while self.stack:
+            self.stack.pop().exit()
+
+    def _apply_filter(self):
+        preset = self.scene.tracking_filter
+        if preset != self._filter:
+            self.tracker.set_filter(preset)
+            self._filter = preset
+
+    def _lap(self, name, start):
+        now = time.perf_counter()
+        if self.profiler.enabled:
+            self.profiler.add(name, start, now)
+        if self.on_stage is not None:
+            self.on_stage(name.partition(".")[0], now - start)
+        return now
+
+    def step(self, frame, now=None):
+        """
+        Run one frame through the top scene. Returns the frame to show, or
+        None when the scene changed (nothing of the old scene is shown).
+        """
+        lap = time.perf_counter()
+        now = time.monotonic() if now is None else now
+        scene = self.scene
+        if scene.size is not None and (frame.shape[1], frame.shape[0]) != scene.size:
+            w, h = scene.size
+            frame = cv2.resize(frame, scene.size, dst=self.pool.get("resize", (h, w, frame.shape[2])))
+        lap = self._lap("capture.resize", lap)
+
+        poses = self.tracker.get_poses(frame)
+        lap = self._lap("tracking", lap)
+
+        dt = now - self._last_time if self._last_time is not None else 0.0
+        self._last_time = now
+        events = []
+        if scene.gestures is not None:
+            events = scene.gestures.update(poses, scene.hit_test)
+        lap = self._lap("logic.gestures", lap)
+        scene.update(poses, events, dt)
+        lap = self._lap("logic.update", lap)
+        if scene is not self.scene:
+            return None
+
+        scene.render(frame)
+        lap = self._lap("render.scene", lap)
+        self.tracker.draw_hand(frame)
+        lap = self._lap("render.hands", lap)
+        if self.profiler.hud:
+            self.profiler.draw_hud(frame)
+            self._lap("render.hud", lap)
+        return frame
+
+    def start(self, scene):
+        """
+        Read a first frame for the camera size, then open the scene.
+        """
+        success, frame = self.cap.read()
+        if not success:
+            print("❌ Failed to grab frame on startup.")
+            return False
+        self.frame_size = (frame.shape[1], frame.shape[0])
+        self._first_frame = frame  # Shown by the first tick, not dropped
+        self.push(scene)
+        return True
+
+    def tick(self):
+        """
+        One frame: capture, step, display. False when capture failed.
+        """
+        frame_start = lap = time.perf_counter()
+        success, frame = True, self._first_frame
+        self._first_frame = None
+        if frame is None:
+            success, frame = self.cap.read(self._capture)
+        if not success:
+            print("❌ Failed to grab frame")
+            return False
+        self._capture = frame
+        lap = self._lap("capture.read", lap)
+        frame = cv2.flip(frame, 1, dst=self.pool.like("flip", frame))
+        self._lap("capture.flip", lap)
+
+        frame = self.step(frame)
+        if frame is not None:
+            lap = time.perf_counter()
+            key = self.display.show(frame)
+            if key == ord("q") or key == 27:
+                self.pop()  # Leave the current scene, like BACK
+            elif key == ord("p"):
+                self.profiler.hud = not self.profiler.hud
+                self.profiler.enabled = self.profiler.enabled or self.profiler.hud
+            self.profiler.frame(frame_start, self._lap("display", lap))
+        return True
+
+    def run(self, scene):
+        if not self.start(scene):
+            return
+        while self.stack and self.tick():
+            pass
+        self.quit()
+        self.display.close()
+
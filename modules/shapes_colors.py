@@ -3,6 +3,9 @@ import random
 import numpy as np
 import time
 from modules.sound_player import play_sound
+from modules.gestures import GestureEngine, SELECT
+from modules.widgets import WidgetRegistry
+from modules.runtime import App, Scene
 
 # Define shape types and colors
 shapes = [("Square", (0, 0, 255)), ("Circle", (0, 255, 0)), ("Triangle", (255, 0, 0))]
@@ -28,23 +31,26 @@ def draw_shape(frame, shape, color, pos, size=80, deform=False):
             pts = np.array([[x + size // 2, y + 10], [x + 10, y + size], [x + size - 10, y + size]], np.int32)
         cv2.drawContours(frame, [pts], 0, color, -1)
 
-def run_shapes_colors(cap, tracker):
-    # Get frame dimensions
-    success, frame = cap.read()
-    if not success:
-        print("❌ Failed to read from camera.")
-        return
-    h, w, _ = frame.shape
-
-    last_click = 0
-    last_shuffle_time = 0
-    feedback_time = 0
-    feedback_text = ""
-    feedback_color = (0, 255, 0)
-
-    back_button = (w - 150, 30, 110, 60)  # Top-right corner
-
-    def generate_scene():
+class ShapesColorsScene(Scene):
+    size = None  # Full camera frame
+
+    def __init__(self):
+        super().__init__()
+        self.last_shuffle_time = 0
+        self.feedback_time = 0
+        self.feedback_text = ""
+        self.feedback_color = (0, 255, 0)
+        self.gestures = GestureEngine(cooldown=1)  # Pinch a shape (or BACK) to choose it
+
+    def enter(self, app):
+        super().enter(app)
+        self.w, self.h = app.frame_size
+        self.back_button = (self.w - 150, 30, 110, 60)  # Top-right corner
+
+        # First scene
+        self.new_scene()
+
+    def new_scene(self):
         # Select target
         target_shape, target_color = random.choice(shapes)
         correct = ((target_shape, target_color), False)  # False: no deform
@@ -60,91 +66,66 @@ def run_shapes_colors(cap, tracker):
         random.shuffle(items)
 
         positions = []
-        spacing = w // (len(items) + 1)
-        y_pos = h // 2
+        spacing = self.w // (len(items) + 1)
+        y_pos = self.h // 2
         for i, ((shape, color), deform) in enumerate(items):
             x_pos = spacing * (i + 1) - 40
             positions.append(((shape, color), (x_pos, y_pos), deform))
-        return (target_shape, target_color), positions
+        self.target, self.placed_shapes = (target_shape, target_color), positions
 
-    # First scene
-    target, placed_shapes = generate_scene()
+        # Shapes are targeted by their index in the scene
+        self.hit_test = WidgetRegistry([("BACK", self.back_button)])
+        for i, (_, (x, y), _) in enumerate(positions):
+            self.hit_test.add(i, (x, y, 80, 80))
+        self.last_shuffle_time = time.time()
 
-    while True:
-        success, frame = cap.read()
-        if not success:
-            print("❌ Frame capture failed.")
-            break
-
-        frame = cv2.flip(frame, 1)
-        frame = cv2.resize(frame, (w, h))
-        landmarks = tracker.get_landmarks(frame)
+    def update(self, poses, events, dt):
+        now = time.time()
 
         # Reshuffle every 5s if no correct answer
-        if time.time() - last_shuffle_time > 5 and feedback_text == "":
-            target, placed_shapes = generate_scene()
-            last_shuffle_time = time.time()
+        if now - self.last_shuffle_time > 5 and self.feedback_text == "":
+            self.new_scene()
+        if self.feedback_text and now - self.feedback_time >= 1.5:
+            self.feedback_text = ""
+
+        # Gesture detection
+        selected = [e.target for e in events if e.kind == SELECT]
+        if "BACK" in selected:
+            play_sound("assets/sounds/welcome.mp3")
+            self.app.pop()
+            return
+        for i in selected[:1]:
+            (shape, color), _, deform = self.placed_shapes[i]
+            if (shape, color) == self.target and not deform:
+                play_sound("assets/sounds/well_done.mp3")
+                self.feedback_text = "Well Done!"
+                self.feedback_color = (0, 200, 0)
+                self.new_scene()
+            else:
+                play_sound("assets/sounds/wrong.mp3")
+                self.feedback_text = "Wrong!"
+                self.feedback_color = (0, 0, 255)
+            self.feedback_time = now
+
+    def render(self, frame):
+        target = self.target
 
         # Display instruction
         target_name = f"{['Red','Green','Blue'][[s[1] for s in shapes].index(target[1])]} {target[0]}"
         cv2.putText(frame, f"Point to the {target_name}", (30, 50), cv2.FONT_HERSHEY_SIMPLEX, 0.9, (0, 0, 0), 2)
 
         # Draw shapes
-        shape_boxes = []
-        for (shape, color), (x, y), deform in placed_shapes:
+        for (shape, color), (x, y), deform in self.placed_shapes:
             draw_shape(frame, shape, color, (x, y), size=80, deform=deform)
-            shape_boxes.append(((shape, color), (x, y, 80, 80), deform))
 
         # Draw BACK button (top right)
-        bx, by, bw, bh = back_button
+        bx, by, bw, bh = self.back_button
         cv2.rectangle(frame, (bx, by), (bx + bw, by + bh), (255, 255, 255), -1)
         cv2.putText(frame, "BACK", (bx + 10, by + 40), cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 0, 255), 2)
 
         # Feedback
-        if feedback_text and time.time() - feedback_time < 1.5:
-            cv2.putText(frame, feedback_text, (w // 2 - 100, 100), cv2.FONT_HERSHEY_SIMPLEX, 1.4, feedback_color, 3)
-        elif feedback_text:
-            feedback_text = ""
+        if self.feedback_text:
+            cv2.putText(frame, self.feedback_text, (self.w // 2 - 100, 100), cv2.FONT_HERSHEY_SIMPLEX, 1.4, self.feedback_color, 3)
 
-        # Gesture detection
-        if landmarks:
-            x1, y1 = landmarks[4]  # Thumb
-            x2, y2 = landmarks[8]  # Index
-            cx, cy = (x1 + x2) // 2, (y1 + y2) // 2
-            dist = ((x1 - x2) ** 2 + (y1 - y2) ** 2) ** 0.5
-
-            if dist < 40 and time.time() - last_click > 1:
-                # Check BACK
-                if bx < cx < bx + bw and by < cy < by + bh:
-                    play_sound("assets/sounds/welcome.mp3")
-                    break
-
-                # Check selection
-                for (shape, color), (sx, sy, sw, sh), deform in shape_boxes:
-                    if sx < cx < sx + sw and sy < cy < sy + sh:
-                        if (shape, color) == target and not deform:
-                            play_sound("assets/sounds/well_done.mp3")
-                            feedback_text = "Well Done!"
-                            feedback_color = (0, 200, 0)
-                            feedback_time = time.time()
-                            target, placed_shapes = generate_scene()
-                            last_shuffle_time = time.time()
-                        else:
-                            play_sound("assets/sounds/wrong.mp3")
-                            feedback_text = "Wrong!"
-                            feedback_color = (0, 0, 255)
-                            feedback_time = time.time()
-                        last_click = time.time()
-                        break
-
-        tracker.draw_hand(frame)
-        cv2.imshow("Shapes & Colors", frame)
-
-        key = cv2.waitKey(1) & 0xFF
-        if key == ord("q") or key == 27:
-            break
-
-    try:
-        cv2.destroyWindow("Shapes & Colors")
-    except:
-        pass
+def run_shapes_colors(cap, tracker):
+    App(cap, tracker).run(ShapesColorsScene())
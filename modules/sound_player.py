@@ -1,40 +1,41 @@
-import pygame
-import tempfile
-import time
-from gtts import gTTS
-import os
+from modules.assets import get_assets
+from modules.audio_engine import get_engine
+from modules.tts import get_speaker
+from modules.profiler import get_profiler
 
-# Initialize pygame mixer once
-pygame.mixer.init()
-
-def play_sound(file_path):
+def play_sound(file_path, wait=False, lane="feedback", after=None):
     """
-    Plays a given .mp3 or .wav file using pygame.
+    Plays a given .mp3 or .wav file on the background audio engine.
+    Returns immediately with a PlaybackHandle unless wait=True.
     """
-    try:
-        if not os.path.exists(file_path):
-            print(f"❌ Sound file not found: {file_path}")
-            return
+    with get_profiler().span("audio.play"):
+        try:
+            if not get_assets().exists(file_path):
+                print(f"❌ Sound file not found: {file_path}")
+                return None
+
+            handle = get_engine().play(file_path, lane=lane, after=after)
+            if wait:
+                handle.wait()
+            return handle
+        except Exception as e:
+            print("❌ Error playing sound:", e)
+            return None
 
-        pygame.mixer.music.load(file_path)
-        pygame.mixer.music.play()
-        while pygame.mixer.music.get_busy():
-            time.sleep(0.1)
-    except Exception as e:
-        print("❌ Error playing sound:", e)
+def preload_sounds(file_paths):
+    """
+    Decodes sounds in the background so their first play starts instantly.
+    """
+    get_assets().preload_sounds(file_paths)
 
-def speak_word(word, lang="en"):
+def speak_word(word, lang="en", voice=None, after=None):
     """
-    Speaks the given word using gTTS and pygame.
+    Speaks the given word from the offline TTS cache without blocking.
+    Uncached words are synthesized in the background first.
     """
-    try:
-        tts = gTTS(text=word, lang=lang)
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".mp3") as fp:
-            tts.save(fp.name)
-            pygame.mixer.music.load(fp.name)
-            pygame.mixer.music.play()
-            while pygame.mixer.music.get_busy():
-                time.sleep(0.1)
-            os.remove(fp.name)
-    except Exception as e:
-        print("❌ Error speaking word:", e)
+    with get_profiler().span("audio.speak"):
+        try:
+            return get_speaker().speak(word, lang=lang, voice=voice, after=after)
+        except Exception as e:
+            print("❌ Error speaking word:", e)
+            return None
@@ -1,7 +1,12 @@
 import cv2
 import random
 import time
-from modules.sound_player import play_sound, speak_word  # speak_word uses gTTS
+from modules.sound_player import play_sound, speak_word  # speak_word uses the offline TTS cache
+from modules.gestures import GestureEngine, SELECT
+from modules.widgets import WidgetRegistry
+from modules.text_renderer import draw_text
+from modules.runtime import App, Scene
+from modules.learner import get_learner, register
 
 words = [
     "apple", "planet", "forest", "grapes", "clouds", "school", "window", "garden",
@@ -13,58 +18,125 @@ words = [
     "planetary", "structure", "elephant", "sunrise", "mountain", "activity"
 ]
 
-def run_spellings(cap, tracker):
-    h, w = 480, 640
-    score = 0
-    lives = 3
-    last_click = 0
-
-    def new_word():
-        word = random.choice(words).upper()
-        shuffled = list(word)
+GAME_OVER_TIME = 2.5   # Seconds "Game Over!" stays up before leaving
+WELL_DONE_TIME = 1.8   # Seconds "Well Done!" stays up before the next word
+
+
+def word_level(word):
+    # 1: short words without a repeated letter, 2: repeated letters, 3: long words
+    if len(word) > 6:
+        return 3
+    return 1 if len(set(word)) == len(word) else 2
+
+
+register("spellings", lambda level: [w for w in words if word_level(w) == level])
+
+class SpellingsScene(Scene):
+    def __init__(self):
+        super().__init__()
+        self.score = 0
+        self.lives = 3
+        self.back_button = (self.size[0] - 130, 30, 100, 60)
+        self.gestures = GestureEngine(cooldown=1.8)  # Pinch a letter (or BACK) to choose it
+        self.wrong_message = ""
+        self.wrong_time = 0
+        self.pause_until = None  # Game over / well done pauses; gestures are ignored meanwhile
+        self.new_word()
+
+    def new_word(self):
+        w, h = self.size
+        word, _ = get_learner().next_item("spellings")
+        self.item = word or random.choice(words)
+        self.word = self.item.upper()
+        self.shown = time.time()  # None once the word's result is reported
+        shuffled = list(self.word)
         random.shuffle(shuffled)
-        boxes = []
+        self.letter_boxes = []
         spacing = min(80, max(50, int((w - 160) / len(shuffled))))
         for i, letter in enumerate(shuffled):
             x = 80 + i * spacing
             y = h // 2
-            boxes.append((letter, (x, y, 80, 80)))
-        return word, shuffled, boxes
-
-    word, shuffled_letters, letter_boxes = new_word()
-    selected_indices = set()
-    selected_letters = []
-    back_button = (w - 130, 30, 100, 60)
-    wrong_message = ""
-    wrong_time = 0
-    current_index = 0
-
-    while True:
-        success, frame = cap.read()
-        if not success:
-            break
-
-        frame = cv2.flip(frame, 1)
-        frame = cv2.resize(frame, (w, h))
-        landmarks = tracker.get_landmarks(frame)
+            self.letter_boxes.append((letter, (x, y, 80, 80)))
+
+        # Letters are targeted by index, since a word can repeat a letter
+        self.hit_test = WidgetRegistry([("BACK", self.back_button)] +
+                                       [(i, box) for i, (_, box) in enumerate(self.letter_boxes)])
+        self.selected_indices = set()
+        self.selected_letters = []
+        self.current_index = 0
+
+    def update(self, poses, events, dt):
+        now = time.time()
+        if self.wrong_message and now - self.wrong_time >= 1.5:
+            self.wrong_message = ""
+
+        if self.pause_until is not None:
+            if now < self.pause_until:
+                return
+            self.pause_until = None
+            if self.lives <= 0:
+                self.app.pop()
+                return
+            self.new_word()
+
+        # Gesture detection
+        selected = [e.target for e in events if e.kind == SELECT]
+        if "BACK" in selected:
+            play_sound("assets/sounds/welcome.mp3")
+            self.app.pop()
+            return
+
+        for i in selected[:1]:
+            letter = self.letter_boxes[i][0]
+            right = letter == self.word[self.current_index]
+            if self.shown is not None and (not right or self.current_index == len(self.word) - 1):
+                # A word counts as known when spelled without a mistake; time per letter
+                get_learner().record("spellings", self.item, right, (now - self.shown) / len(self.word))
+                self.shown = None
+            if right:
+                play_sound("assets/sounds/correct.mp3")
+                self.selected_letters.append(letter)
+                self.selected_indices.add(i)
+                self.hit_test.remove(i)  # Letters already used are not targets any more
+                self.current_index += 1
+            else:
+                play_sound("assets/sounds/wrong.mp3")
+                self.wrong_message = "Wrong! Try Again"
+                self.wrong_time = now
+                self.lives -= 1
+
+            # Game over
+            if self.lives <= 0:
+                play_sound("assets/sounds/wrong.mp3")
+                self.pause_until = now + GAME_OVER_TIME
+
+            # Word complete
+            elif ''.join(self.selected_letters) == self.word:
+                cheer = play_sound("assets/sounds/well_done.mp3")
+                speak_word(self.word.lower(), after=cheer)  # Say the word once the cheer ends
+                self.pause_until = now + WELL_DONE_TIME
+
+    def render(self, frame):
+        h = frame.shape[0]
+        word = self.word
 
         # UI Headers
-        cv2.putText(frame, f"Score: {score}  Lives: {lives}", (20, 40), cv2.FONT_HERSHEY_SIMPLEX, 1, (50, 50, 255), 2)
+        cv2.putText(frame, f"Score: {self.score}  Lives: {self.lives}", (20, 40), cv2.FONT_HERSHEY_SIMPLEX, 1, (50, 50, 255), 2)
         cv2.putText(frame, f"Spell: {word}", (20, 80), cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 100, 0), 2)
-        if current_index < len(word):
-            cv2.putText(frame, f"Select: {word[current_index]}", (20, 120), cv2.FONT_HERSHEY_SIMPLEX, 1, (255, 100, 0), 2)
+        if self.current_index < len(word):
+            cv2.putText(frame, f"Select: {word[self.current_index]}", (20, 120), cv2.FONT_HERSHEY_SIMPLEX, 1, (255, 100, 0), 2)
 
         # User guidance
-        cv2.putText(frame, "👉 Pinch to select a letter", (20, h - 60), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (90, 90, 90), 2)
+        draw_text(frame, "👉 Pinch to select a letter", (20, h - 60), 22, (90, 90, 90), weight=1)
 
         # BACK button
-        bx, by, bw, bh = back_button
+        bx, by, bw, bh = self.back_button
         cv2.rectangle(frame, (bx, by), (bx + bw, by + bh), (0, 0, 0), 2)
         cv2.putText(frame, "BACK", (bx + 10, by + 40), cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 0, 0), 2)
 
         # Draw letter boxes
-        for i, (letter, (x, y, bw, bh)) in enumerate(letter_boxes):
-            if i in selected_indices:
+        for i, (letter, (x, y, bw, bh)) in enumerate(self.letter_boxes):
+            if i in self.selected_indices:
                 color = (100, 255, 100)
             else:
                 color = (220, 220, 220)
@@ -72,65 +144,15 @@ def run_spellings(cap, tracker):
             cv2.putText(frame, letter, (x + 15, y + 60), cv2.FONT_HERSHEY_SIMPLEX, 2, (0, 0, 0), 3)
 
         # Display current progress
-        cv2.putText(frame, "Selected: " + ''.join(selected_letters), (20, h - 25), cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 50, 200), 2)
-        if wrong_message and time.time() - wrong_time < 1.5:
-            cv2.putText(frame, wrong_message, (180, 430), cv2.FONT_HERSHEY_SIMPLEX, 1.5, (0, 0, 255), 3)
-        else:
-            wrong_message = ""
-
-        # Game over logic
-        if lives <= 0:
-            cv2.putText(frame, "Game Over!", (180, 280), cv2.FONT_HERSHEY_SIMPLEX, 2, (0, 0, 255), 4)
-            play_sound("assets/sounds/wrong.mp3")
-            cv2.imshow("Spellings", frame)
-            cv2.waitKey(2500)
-            break
+        cv2.putText(frame, "Selected: " + ''.join(self.selected_letters), (20, h - 25), cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 50, 200), 2)
+        if self.wrong_message:
+            cv2.putText(frame, self.wrong_message, (180, 430), cv2.FONT_HERSHEY_SIMPLEX, 1.5, (0, 0, 255), 3)
 
-        # Gesture detection
-        if landmarks:
-            x1, y1 = landmarks[4]
-            x2, y2 = landmarks[8]
-            cx, cy = (x1 + x2) // 2, (y1 + y2) // 2
-            dist = ((x1 - x2)**2 + (y1 - y2)**2)**0.5
-
-            if dist < 40 and time.time() - last_click > 1.8:
-                # Check back button
-                if bx < cx < bx + bw and by < cy < by + bh:
-                    play_sound("assets/sounds/welcome.mp3")
-                    break
-
-                # Check letter boxes
-                for i, (letter, (lx, ly, lw, lh)) in enumerate(letter_boxes):
-                    if i not in selected_indices and lx < cx < lx + lw and ly < cy < ly + lh:
-                        if letter == word[current_index]:
-                            play_sound("assets/sounds/correct.mp3")
-                            selected_letters.append(letter)
-                            selected_indices.add(i)
-                            current_index += 1
-                        else:
-                            play_sound("assets/sounds/wrong.mp3")
-                            wrong_message = "Wrong! Try Again"
-                            wrong_time = time.time()
-                            lives -= 1
-                        last_click = time.time()
-                        break
-
-                # Word complete
-                if ''.join(selected_letters) == word:
-                    play_sound("assets/sounds/well_done.mp3")
-                    speak_word(word.lower())  # Say the word
-                    cv2.putText(frame, "🎉 Well Done!", (150, 400), cv2.FONT_HERSHEY_SIMPLEX, 2, (0, 255, 0), 4)
-                    cv2.imshow("Spellings", frame)
-                    cv2.waitKey(1800)
-                    word, shuffled_letters, letter_boxes = new_word()
-                    selected_letters = []
-                    selected_indices = set()
-                    current_index = 0
-                    last_click = time.time()
-
-        tracker.draw_hand(frame)
-        cv2.imshow("Spellings", frame)
-        if cv2.waitKey(1) & 0xFF == ord('q'):
-            break
-
-    cv2.destroyWindow("Spellings")
+        if self.pause_until is not None:
+            if self.lives <= 0:
+                cv2.putText(frame, "Game Over!", (180, 280), cv2.FONT_HERSHEY_SIMPLEX, 2, (0, 0, 255), 4)
+            else:
+                draw_text(frame, "🎉 Well Done!", (150, 400), 62, (0, 255, 0), weight=2)
+
+def run_spellings(cap, tracker):
+    App(cap, tracker).run(SpellingsScene())
@@ -0,0 +1,169 @@
+import hashlib
+import os
+import threading
+import cv2
+import numpy as np
+from modules.compositing import Sprite, blend
+
+# 🔤 Fonts tried in order; the first one that exists is used.
+# A font dropped into assets/fonts/ wins over the system ones.
+EMOJI_FONTS = [
+    "assets/fonts/emoji.ttf",
+    "C:/Windows/Fonts/seguiemj.ttf",
+    "/System/Library/Fonts/Apple Color Emoji.ttc",
+    "/usr/share/fonts/truetype/noto/NotoColorEmoji.ttf",
+    "/usr/share/fonts/noto/NotoColorEmoji.ttf",
+]
+TEXT_FONTS = [
+    "assets/fonts/text.ttf",
+    "C:/Windows/Fonts/arial.ttf",
+    "/System/Library/Fonts/Supplemental/Arial.ttf",
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+]
+
+# Glyphs are rasterized at this size and scaled down; Noto Color Emoji
+# only ships 109px bitmaps, scalable fonts don't mind.
+RENDER_SIZE = 109
+ATLAS_WIDTH = 1024
+PADDING = 1
+
+
+def is_emoji(char):
+    code = ord(char)
+    return code >= 0x1F000 or 0x2600 <= code <= 0x27BF or 0x2B00 <= code <= 0x2BFF
+
+
+def find_font(candidates):
+    for path in candidates:
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def _placeholder(text, height):
+    # A coloured disc per glyph, so counting scenes stay countable without an emoji font
+    hue = hashlib.md5(text.encode("utf-8")).digest()[0] * 180 // 256
+    bgr = cv2.cvtColor(np.uint8([[[hue, 200, 230]]]), cv2.COLOR_HSV2BGR)[0, 0].tolist()
+    image = np.zeros((height, height, 4), np.uint8)
+    center, radius = (height // 2, height // 2), max(1, height // 2 - 1)
+    cv2.circle(image, center, radius, (*bgr, 255), -1, cv2.LINE_AA)
+    return image
+
+
+def render_glyph(text, height, color=(0, 0, 0)):
+    """
+    Rasterize text (usually one emoji or symbol) with Pillow into a BGRA
+    image `height` pixels tall. Emoji keep their own colours; other glyphs
+    use color (BGR). Falls back to a placeholder disc without a font.
+    """
+    from PIL import Image, ImageDraw, ImageFont
+
+    emoji = any(is_emoji(c) for c in text)
+    path = find_font(EMOJI_FONTS if emoji else TEXT_FONTS)
+    if path is None and emoji:
+        return _placeholder(text, height)
+    try:
+        if path is None:
+            font = ImageFont.load_default(RENDER_SIZE)  # Pillow's built-in scalable font
+        else:
+            font = ImageFont.truetype(path, RENDER_SIZE)
+        x0, y0, x1, y1 = ImageDraw.Draw(Image.new("RGBA", (1, 1))).textbbox(
+            (0, 0), text, font=font, embedded_color=emoji)
+        if not emoji:
+            # Keep the line's full height so symbols are not stretched
+            ascent, descent = font.getmetrics()
+            y0, y1 = 0, ascent + descent
+        canvas = Image.new("RGBA", (max(1, x1 - x0), max(1, y1 - y0)), (0, 0, 0, 0))
+        ImageDraw.Draw(canvas).text((-x0, -y0), text, font=font, embedded_color=emoji,
+                                    fill=(color[2], color[1], color[0], 255))
+    except (OSError, TypeError) as e:
+        print(f"❌ Could not render {text!r} with {path}:", e)
+        return _placeholder(text, height)
+
+    rgba = np.asarray(canvas)
+    if not rgba[:, :, 3].any():
+        return _placeholder(text, height)
+    width = max(1, round(rgba.shape[1] * height / rgba.shape[0]))
+    rgba = cv2.resize(rgba, (width, height), interpolation=cv2.INTER_AREA)
+    return cv2.cvtColor(rgba, cv2.COLOR_RGBA2BGRA)
+
+
+class SpriteAtlas:
+    """
+    🗂 Glyphs packed into one premultiplied texture.
+
+    Each (text, height, color) is rasterized once, packed on shelves into
+    a shared texture, and handed out as a Sprite viewing its rectangle, so
+    drawing N objects is N cv2 blends with no per-frame text rendering.
+    """
+
+    def __init__(self, width=ATLAS_WIDTH):
+        self.width = width
+        self.color = np.zeros((0, width, 3), np.uint8)
+        self.inverse = np.full((0, width, 3), 255, np.uint8)
+        self.rects = {}    # key -> (x, y, w, h) in the texture
+        self.sprites = {}  # key -> Sprite view
+        self._shelf_x = self._shelf_y = self._shelf_h = 0
+        self._lock = threading.Lock()
+
+    def _grow(self, height):
+        rows = max(height, self.color.shape[0])  # double, at least enough
+        self.color = np.vstack([self.color, np.zeros((rows, self.width, 3), np.uint8)])
+        self.inverse = np.vstack([self.inverse, np.full((rows, self.width, 3), 255, np.uint8)])
+        # Old views point at the old arrays
+        self.sprites = {key: self._view(rect) for key, rect in self.rects.items()}
+
+    def _view(self, rect):
+        x, y, w, h = rect
+        return Sprite.premultiplied(self.color[y:y + h, x:x + w], self.inverse[y:y + h, x:x + w])
+
+    def add(self, key, image):
+        h, w = image.shape[:2]
+        w = min(w, self.width - 2 * PADDING)
+        if self._shelf_x + w + PADDING > self.width:
+            self._shelf_x, self._shelf_y = 0, self._shelf_y + self._shelf_h + PADDING
+            self._shelf_h = 0
+        x, y = self._shelf_x + PADDING, self._shelf_y + PADDING
+        if y + h > self.color.shape[0]:
+            self._grow(y + h - self.color.shape[0])
+        self._shelf_x = x + w
+        self._shelf_h = max(self._shelf_h, h)
+
+        sprite = Sprite(image[:, :w])
+        self.color[y:y + h, x:x + w] = sprite.color
+        if sprite.inverse is not None:
+            self.inverse[y:y + h, x:x + w] = sprite.inverse
+        else:
+            self.inverse[y:y + h, x:x + w] = 0
+        self.rects[key] = (x, y, w, h)
+        self.sprites[key] = self._view(self.rects[key])
+        return self.sprites[key]
+
+    def glyph(self, text, height, color=(0, 0, 0)):
+        key = (text, height, tuple(color))
+        with self._lock:
+            sprite = self.sprites.get(key)
+            if sprite is None:
+                sprite = self.add(key, render_glyph(text, height, color))
+            return sprite
+
+    def draw(self, frame, text, height, positions, color=(0, 0, 0)):
+        """
+        Draw one glyph at many top-left positions.
+        """
+        sprite = self.glyph(text, height, color)
+        for x, y in positions:
+            blend(frame, sprite, x, y)
+        return frame
+
+
+_atlas = None
+_atlas_lock = threading.Lock()
+
+
+def get_atlas():
+    global _atlas
+    with _atlas_lock:
+        if _atlas is None:
+            _atlas = SpriteAtlas()
+    return _atlas
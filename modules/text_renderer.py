@@ -0,0 +1,165 @@
+import threading
+from collections import OrderedDict
+import numpy as np
+from modules.compositing import Sprite, blend
+from modules.sprite_atlas import TEXT_FONTS, find_font, is_emoji, render_glyph
+
+STRING_CACHE_SIZE = 512  # Rendered strings kept as sprites
+
+
+class TextRenderer:
+    """
+    🔤 TrueType text with two caches.
+
+    Glyph masks are rasterized once per (char, size, weight) with Pillow;
+    whole strings are assembled from them once per (text, size, colour,
+    weight) into a premultiplied Sprite, so drawing a label that was seen
+    before is a single blend. Emoji inside strings come from the colour
+    emoji font via render_glyph().
+
+    Sizes are in pixels (the font's em size); weight thickens strokes,
+    like putText's thickness.
+    """
+
+    def __init__(self, font_path=None, cache_size=STRING_CACHE_SIZE):
+        self.font_path = font_path or find_font(TEXT_FONTS)
+        self.cache_size = cache_size
+        self.fonts = {}      # size -> FreeTypeFont
+        self.glyphs = {}     # (char, size, weight) -> (mask, x offset, y offset, advance)
+        self.strings = OrderedDict()  # (text, size, color, weight) -> (Sprite, ascent)
+        self._lock = threading.Lock()
+
+    def font(self, size):
+        font = self.fonts.get(size)
+        if font is None:
+            from PIL import ImageFont
+            if self.font_path:
+                font = ImageFont.truetype(self.font_path, size)
+            else:
+                font = ImageFont.load_default(size)  # Pillow's built-in scalable font
+            self.fonts[size] = font
+        return font
+
+    def glyph(self, char, size, weight=0):
+        key = (char, size, weight)
+        glyph = self.glyphs.get(key)
+        if glyph is None:
+            font = self.font(size)
+            mask, (ox, oy) = font.getmask2(char, mode="L", stroke_width=weight)
+            width, height = mask.size
+            mask = np.asarray(mask, np.uint8).reshape(height, width)
+            glyph = self.glyphs[key] = (mask, ox, oy, font.getlength(char) + weight)
+        return glyph
+
+    def _render(self, text, size, color, weight):
+        ascent, descent = self.font(size).getmetrics()
+        height = ascent + descent + 2 * weight
+
+        # Lay out the glyphs, then paint them into one BGRA image
+        pen, placed = 0.0, []
+        for char in text:
+            if is_emoji(char):
+                image = render_glyph(char, ascent)
+                placed.append(("emoji", image, int(pen), weight + descent // 2))
+                pen += image.shape[1] + weight
+            else:
+                mask, ox, oy, advance = self.glyph(char, size, weight)
+                placed.append(("mask", mask, int(pen) + ox, oy + weight))
+                pen += advance
+        # Glyphs such as "j" may start left of the pen; shift everything in
+        dx = max(0, -min((x for _, _, x, _ in placed), default=0))
+        dy = max(0, -min((y for _, _, _, y in placed), default=0))
+        placed = [(kind, image, x + dx, y + dy) for kind, image, x, y in placed]
+        height += dy
+        ascent += dy
+
+        width = max(1, int(np.ceil(pen)) + dx + 2 * weight)
+        for kind, image, x, y in placed:
+            width = max(width, x + image.shape[1])
+            height = max(height, y + image.shape[0])
+
+        bgra = np.zeros((height, width, 4), np.uint8)
+        bgra[:, :, :3] = color
+        for kind, image, x, y in placed:
+            h, w = image.shape[:2]
+            if kind == "mask":
+                np.maximum(bgra[y:y + h, x:x + w, 3], image, out=bgra[y:y + h, x:x + w, 3])
+            else:
+                bgra[y:y + h, x:x + w] = np.where(image[:, :, 3:] > 0, image, bgra[y:y + h, x:x + w])
+        return Sprite(bgra), ascent + weight
+
+    def render(self, text, size, color=(255, 255, 255), weight=0):
+        """
+        (Sprite, ascent) for text, from the string cache when possible.
+        """
+        key = (text, size, tuple(color), weight)
+        with self._lock:
+            cached = self.strings.get(key)
+            if cached is not None:
+                self.strings.move_to_end(key)
+                return cached
+            cached = self.strings[key] = self._render(text, size, key[2], weight)
+            if len(self.strings) > self.cache_size:
+                self.strings.popitem(last=False)
+            return cached
+
+    def draw(self, frame, text, org, size, color=(255, 255, 255), weight=0):
+        """
+        Draw text with its baseline starting at org, like cv2.putText.
+        Returns the rendered width.
+        """
+        sprite, ascent = self.render(text, size, color, weight)
+        blend(frame, sprite, org[0], org[1] - ascent)
+        return sprite.width
+
+    def measure(self, text, size, weight=0):
+        sprite, ascent = self.render(text, size, (0, 0, 0), weight)
+        return sprite.width, sprite.height
+
+
+class TextBatch:
+    """
+    Collects the labels of one frame and draws them together. When a
+    frame queues the same labels as the previous one, the resolved sprites
+    are reused without touching the renderer's cache at all.
+    """
+
+    def __init__(self, renderer=None):
+        self.renderer = renderer or get_text_renderer()
+        self.items = []
+        self._last_items = None
+        self._last_sprites = []
+
+    def add(self, text, org, size, color=(255, 255, 255), weight=0):
+        self.items.append((text, org, size, tuple(color), weight))
+
+    def draw(self, frame):
+        if self.items != self._last_items:
+            self._last_sprites = []
+            for text, (x, y), size, color, weight in self.items:
+                sprite, ascent = self.renderer.render(text, size, color, weight)
+                self._last_sprites.append((sprite, x, y - ascent))
+            self._last_items = self.items
+        for sprite, x, y in self._last_sprites:
+            blend(frame, sprite, x, y)
+        self.items = []
+        return frame
+
+
+_renderer = None
+_renderer_lock = threading.Lock()
+
+
+def get_text_renderer():
+    global _renderer
+    with _renderer_lock:
+        if _renderer is None:
+            _renderer = TextRenderer()
+    return _renderer
+
+
+def draw_text(frame, text, org, size=32, color=(255, 255, 255), weight=0):
+    """
+    Shortcut for get_text_renderer().draw(...).
+    """
+    return get_text_renderer().draw(frame, text, org, size, color, weight)
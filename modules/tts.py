@@ -0,0 +1,261 @@
+import abc
+import argparse
+import hashlib
+import os
+import queue
+import re
+import sys
+import threading
+from collections import OrderedDict
+from modules.audio_engine import get_engine
+
+# 🗂 Synthesized clips live here, one file per (text, lang, voice)
+CACHE_DIR = os.path.join("cache", "tts")
+CACHE_MAX_BYTES = 64 * 1024 * 1024
+CLIP_EXTENSIONS = (".wav", ".aiff", ".mp3")
+
+
+class TTSBackend(abc.ABC):
+    """
+    Turns text into an audio file. Subclasses set 'name' and 'extension'.
+    """
+    name = "base"
+    extension = ".wav"
+
+    @abc.abstractmethod
+    def synthesize(self, text, lang, voice, out_path):
+        """Writes the spoken text to out_path, raising on failure."""
+
+
+def _lang_codes(voice):
+    # "en", "en-us", ... from a pyttsx3 voice's languages (eSpeak gives
+    # bytes with a priority prefix), else from the words of its id / name
+    codes = []
+    for language in getattr(voice, "languages", None) or ():
+        if isinstance(language, bytes):
+            language = language.decode("utf-8", "ignore")
+        codes.append(re.sub(r"^[^a-zA-Z]+", "", language).lower().replace("_", "-"))
+    if not codes:
+        codes = re.split(r"[^a-z-]+", f"{voice.id} {getattr(voice, 'name', '')}".lower())
+    return codes
+
+
+def voice_for_lang(voices, lang):
+    """
+    Id of the first voice that speaks lang ("en" matches "en-gb"), or None.
+    """
+    lang = lang.lower().replace("_", "-")
+    for voice in voices:
+        if any(code == lang or code.startswith(lang + "-") for code in _lang_codes(voice)):
+            return voice.id
+    return None
+
+
+class Pyttsx3Backend(TTSBackend):
+    """
+    Offline speech through the OS voices (SAPI5 / NSSpeech / eSpeak).
+    Without an explicit voice, one speaking `lang` is picked; with none
+    installed it raises, so the next backend gets the text instead of a
+    clip in the wrong language being cached under lang's key.
+    pyttsx3 is not thread-safe, so only ever call it from one thread.
+    """
+    name = "pyttsx3"
+    # macOS's NSSpeechSynthesizer writes AIFF whatever the file name says
+    extension = ".aiff" if sys.platform == "darwin" else ".wav"
+
+    def __init__(self, rate=140):
+        self.rate = rate
+        self._engine = None
+        self._lang_voices = {}  # lang -> voice id (None: no voice speaks it)
+
+    def synthesize(self, text, lang, voice, out_path):
+        if self._engine is None:
+            import pyttsx3
+            self._engine = pyttsx3.init()
+            self._engine.setProperty("rate", self.rate)
+        if not voice:
+            if lang not in self._lang_voices:
+                self._lang_voices[lang] = voice_for_lang(self._engine.getProperty("voices"), lang)
+            voice = self._lang_voices[lang]
+            if voice is None:
+                raise LookupError(f"no installed voice speaks '{lang}'")
+        self._engine.setProperty("voice", voice)
+        self._engine.save_to_file(text, out_path)
+        self._engine.runAndWait()
+
+
+class GTTSBackend(TTSBackend):
+    """
+    Google TTS over the network; only used when no offline voice worked.
+    """
+    name = "gtts"
+    extension = ".mp3"
+
+    def synthesize(self, text, lang, voice, out_path):
+        from gtts import gTTS
+        gTTS(text=text, lang=lang).save(out_path)
+
+
+class TTSCache:
+    """
+    Content-addressed clip store keyed by sha1(text + lang + voice).
+    Keeps an in-memory LRU index so a hit costs no disk lookups, and evicts
+    least recently spoken clips once the folder grows past max_bytes.
+    """
+
+    def __init__(self, directory=CACHE_DIR, max_bytes=CACHE_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._index = OrderedDict()  # key -> (path, size), oldest first
+        self._total = 0
+        self._lock = threading.Lock()
+        self._scan()
+
+    @staticmethod
+    def key(text, lang="en", voice=None):
+        raw = f"{lang}\0{voice or ''}\0{text}".encode("utf-8")
+        return hashlib.sha1(raw).hexdigest()
+
+    def _scan(self):
+        os.makedirs(self.directory, exist_ok=True)
+        entries = []
+        for name in os.listdir(self.directory):
+            key, ext = os.path.splitext(name)
+            if ext not in CLIP_EXTENSIONS:
+                continue
+            path = os.path.join(self.directory, name)
+            stat = os.stat(path)
+            if stat.st_size == 0:
+                os.remove(path)
+                continue
+            entries.append((stat.st_mtime, key, path, stat.st_size))
+        for _, key, path, size in sorted(entries):
+            self._index[key] = (path, size)
+            self._total += size
+
+    def get(self, key):
+        with self._lock:
+            entry = self._index.get(key)
+            if entry is None:
+                return None
+            self._index.move_to_end(key)
+        path = entry[0]
+        try:
+            os.utime(path)  # Persist recency for the next session
+        except OSError:
+            with self._lock:
+                self._index.pop(key, None)
+                self._total -= entry[1]
+            return None
+        return path
+
+    def path_for(self, key, extension):
+        return os.path.join(self.directory, key + extension)
+
+    def add(self, key, path):
+        size = os.path.getsize(path)
+        with self._lock:
+            old = self._index.pop(key, None)
+            if old is not None:
+                self._total -= old[1]
+            self._index[key] = (path, size)
+            self._total += size
+            self._evict()
+
+    def _evict(self):
+        while self._total > self.max_bytes and len(self._index) > 1:
+            _, (path, size) = self._index.popitem(last=False)
+            self._total -= size
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+class Speaker:
+    """
+    Cache-first text-to-speech. A hit is just a non-blocking play on the
+    audio engine's voice lane; a miss is synthesized on a background thread
+    by the first backend that succeeds and then played.
+    """
+
+    def __init__(self, backends=None, cache=None):
+        self.backends = backends if backends is not None else [Pyttsx3Backend(), GTTSBackend()]
+        self.cache = cache or TTSCache()
+        self._jobs = queue.Queue()
+        self._thread = None
+
+    def speak(self, text, lang="en", voice=None, after=None):
+        path = self.cache.get(TTSCache.key(text, lang, voice))
+        if path:
+            return get_engine().play(path, lane="voice", after=after)
+        self._submit((text, lang, voice, True, after))
+        return None
+
+    def prewarm(self, texts, lang="en", voice=None):
+        """Queues synthesis of every text without playing it."""
+        for text in texts:
+            self._submit((text, lang, voice, False, None))
+
+    def render(self, text, lang="en", voice=None):
+        """Returns a cached clip path, synthesizing it on this thread if needed."""
+        key = TTSCache.key(text, lang, voice)
+        path = self.cache.get(key)
+        if path:
+            return path
+        for backend in self.backends:
+            out_path = self.cache.path_for(key, backend.extension)
+            try:
+                backend.synthesize(text, lang, voice, out_path)
+            except Exception as e:
+                print(f"❌ {backend.name} failed for '{text}':", e)
+                continue
+            if os.path.exists(out_path) and os.path.getsize(out_path) > 0:
+                self.cache.add(key, out_path)
+                return out_path
+        return None
+
+    def _submit(self, job):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="TTS", daemon=True)
+            self._thread.start()
+        self._jobs.put(job)
+
+    def _run(self):
+        while True:
+            text, lang, voice, play, after = self._jobs.get()
+            path = self.render(text, lang, voice)
+            if path and play:
+                get_engine().play(path, lane="voice", after=after)
+
+
+_speaker = None
+_speaker_lock = threading.Lock()
+
+
+def get_speaker():
+    global _speaker
+    with _speaker_lock:
+        if _speaker is None:
+            _speaker = Speaker()
+    return _speaker
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Text-to-speech cache tools")
+    parser.add_argument("--prewarm", action="store_true",
+                        help="render every spellings word into the cache")
+    parser.add_argument("--lang", default="en")
+    parser.add_argument("--voice", default=None)
+    args = parser.parse_args()
+
+    if args.prewarm:
+        from modules.spellings import words
+        speaker = get_speaker()
+        for i, word in enumerate(words, 1):
+            path = speaker.render(word.lower(), args.lang, args.voice)
+            print(f"[{i}/{len(words)}] {word}: {path or '❌ failed'}")
+
+
+if __name__ == "__main__":
+    main()
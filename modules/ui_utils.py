@@ -1,4 +1,6 @@
 import cv2
+from modules.gestures import is_pinching
+from modules.text_renderer import draw_text
 
 def draw_back_button(frame):
     h, w, _ = frame.shape
@@ -10,19 +12,24 @@ def draw_back_button(frame):
     cv2.rectangle(frame, (bx, by), (bx + bw, by + bh), (0, 0, 0), 2)
 
     # Optional: Add shadow
-    cv2.putText(frame, "← Back", (bx + 20, by + 40),
-                cv2.FONT_HERSHEY_DUPLEX, 1, (0, 0, 255), 2)
+    draw_text(frame, "← Back", (bx + 20, by + 40), 32, (0, 0, 255), weight=1)
 
     return (bx, by, bw, bh)
 
 
+def fit_scale(text, font, scale, thickness, width):
+    """
+    Largest font scale up to `scale` at which cv2.putText draws text at
+    most width pixels wide.
+    """
+    (tw, _), _ = cv2.getTextSize(text, font, scale, thickness)
+    return scale if tw <= width else scale * width / tw
+
+
 def is_back_pressed(landmarks, back_button_coords):
     if not landmarks:
         return False
-    x1, y1 = landmarks[4]   # Thumb
-    x2, y2 = landmarks[8]   # Index
-    cx, cy = (x1 + x2) // 2, (y1 + y2) // 2
-    dist = ((x1 - x2) ** 2 + (y1 - y2) ** 2) ** 0.5
+    cx, cy = landmarks.pinch_center()
 
     bx, by, bw, bh = back_button_coords
-    return dist < 40 and bx < cx < bx + bw and by < cy < by + bh
+    return is_pinching(landmarks) and bx < cx < bx + bw and by < cy < by + bh
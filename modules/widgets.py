@@ -0,0 +1,86 @@
+import math
+
+# 🔲 Grid cell size in pixels; about the size of a small button
+CELL_SIZE = 64
+
+
+class WidgetRegistry:
+    """
+    The on-screen targets of a lesson, each with an (x, y, w, h) box,
+    indexed in a uniform grid so "what is under this point" only checks
+    the few widgets sharing the point's cell instead of every widget.
+
+    When boxes overlap, the widget added first wins (same as scanning a
+    list). The registry is callable, so it can be passed straight to
+    GestureEngine.update() as the hit test.
+    """
+
+    def __init__(self, widgets=(), cell_size=CELL_SIZE):
+        self.cell_size = cell_size
+        self.boxes = {}   # target -> (order, box)
+        self.cells = {}   # (col, row) -> [(order, target, box)] in add order
+        self._order = 0
+        for target, box in widgets:
+            self.add(target, box)
+
+    def _cells_for(self, box):
+        x, y, w, h = box
+        cs = self.cell_size
+        for col in range(math.floor(x / cs), math.floor((x + w) / cs) + 1):
+            for row in range(math.floor(y / cs), math.floor((y + h) / cs) + 1):
+                yield col, row
+
+    def add(self, target, box):
+        if target in self.boxes:
+            self.remove(target)
+        box = tuple(box)
+        entry = (self._order, target, box)
+        self._order += 1
+        self.boxes[target] = (entry[0], box)
+        for cell in self._cells_for(box):
+            self.cells.setdefault(cell, []).append(entry)
+
+    def remove(self, target):
+        found = self.boxes.pop(target, None)
+        if found is None:
+            return
+        order, box = found
+        for cell in self._cells_for(box):
+            entries = [e for e in self.cells[cell] if e[0] != order]
+            if entries:
+                self.cells[cell] = entries
+            else:
+                del self.cells[cell]
+
+    def move(self, target, box):
+        # Keeps the widget's priority, unlike remove() + add()
+        order, _ = self.boxes[target]
+        self.remove(target)
+        entry = (order, target, tuple(box))
+        self.boxes[target] = (order, entry[2])
+        for cell in self._cells_for(entry[2]):
+            entries = self.cells.setdefault(cell, [])
+            entries.append(entry)
+            entries.sort(key=lambda e: e[0])
+
+    def clear(self):
+        self.boxes = {}
+        self.cells = {}
+
+    def box(self, target):
+        return self.boxes[target][1]
+
+    def at(self, x, y):
+        cs = self.cell_size
+        for _, target, (bx, by, bw, bh) in self.cells.get((math.floor(x / cs), math.floor(y / cs)), ()):
+            if bx < x < bx + bw and by < y < by + bh:
+                return target
+        return None
+
+    __call__ = at
+
+    def __contains__(self, target):
+        return target in self.boxes
+
+    def __len__(self):
+        return len(self.boxes)
@@ -0,0 +1,109 @@
+import os
+import time
+import wave
+import pytest
+
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")  # No sound card needed
+
+from modules.audio_engine import AudioEngine
+
+
+@pytest.fixture
+def clip(tmp_path):
+    # One second of silence
+    path = str(tmp_path / "clip.wav")
+    with wave.open(path, "wb") as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(22050)
+        f.writeframes(b"\0\0" * 22050)
+    return path
+
+
+@pytest.fixture
+def engine():
+    engine = AudioEngine().start()
+    if not engine.available:
+        pytest.skip("pygame mixer could not start")
+    yield engine
+    engine.shutdown()
+
+
+def settle():
+    time.sleep(0.15)  # A few worker polls
+
+
+def test_play_returns_at_once(engine, clip):
+    start = time.perf_counter()
+    handle = engine.play(clip)
+    assert time.perf_counter() - start < 0.05
+    settle()
+    assert not handle.done()
+
+
+def test_higher_lane_cuts_off_interruptible_lane(engine, clip):
+    hover = engine.play(clip, "hover")
+    settle()
+    feedback = engine.play(clip, "feedback")
+    settle()
+    assert hover.done() and not hover.dropped
+    assert not feedback.done()
+
+
+def test_lower_lane_does_not_cut_off_higher_one(engine, clip):
+    feedback = engine.play(clip, "feedback")
+    settle()
+    engine.play(clip, "hover")
+    settle()
+    assert not feedback.done()
+
+
+def test_preempting_lane_keeps_only_newest(engine, clip):
+    first = engine.play(clip, "feedback")
+    second = engine.play(clip, "feedback")
+    settle()
+    assert first.done()
+    assert not second.done()
+
+
+def test_queue_lane_plays_in_turn(engine, clip):
+    first = engine.play(clip, "voice")
+    second = engine.play(clip, "voice")
+    settle()
+    assert not first.done() and not second.done()
+
+
+def test_stop_one_lane(engine, clip):
+    feedback = engine.play(clip, "feedback")
+    voice = engine.play(clip, "voice")
+    settle()
+    engine.stop("feedback")
+    settle()
+    assert feedback.done() and not feedback.dropped
+    assert not voice.done()
+
+
+def test_stop_all_lanes(engine, clip):
+    handles = [engine.play(clip, lane) for lane in ("feedback", "voice")]
+    settle()
+    engine.stop()
+    settle()
+    assert all(h.done() for h in handles)
+
+
+def test_shutdown_finishes_everything(engine, clip):
+    playing = engine.play(clip, "voice")
+    waiting = engine.play(clip, "voice")
+    settle()
+    engine.shutdown()
+    assert not engine.available
+    assert playing.done()
+    assert waiting.done() and waiting.dropped
+
+
+def test_play_after_shutdown_restarts(engine, clip):
+    engine.shutdown()
+    handle = engine.play(clip)
+    settle()
+    assert engine.available
+    assert not handle.done()
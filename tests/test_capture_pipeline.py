@@ -0,0 +1,90 @@
+import time
+import numpy as np
+from modules.capture_pipeline import READ_WAIT, CapturePipeline
+
+
+class SlowCamera:
+    """cv2.VideoCapture stand-in: numbered frames, one every `period` seconds."""
+
+    def __init__(self, period, frames=None, shape=(48, 64, 3)):
+        self.period = period
+        self.frames = frames
+        self.shape = shape
+        self.count = 0
+
+    def isOpened(self):
+        return True
+
+    def get(self, prop):
+        return 0
+
+    def read(self, image=None):
+        if self.frames is not None and self.count >= self.frames:
+            return False, None
+        time.sleep(self.period)
+        if image is None:
+            image = np.empty(self.shape, np.uint8)
+        self.count += 1
+        image[:] = self.count % 256  # Every pixel holds the frame number
+        return True, image
+
+    def release(self):
+        pass
+
+
+class NullTracker:
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.poses = []
+        self.torn = 0
+
+    def process(self, frame):
+        value = frame[0, 0, 0]
+        time.sleep(self.delay)
+        self.torn += not (frame == value).all()
+        return None
+
+
+def test_read_never_waits_for_the_camera():
+    pipeline = CapturePipeline(SlowCamera(0.2), NullTracker())
+    try:
+        ok, first = pipeline.read()  # Waits for the camera to open
+        assert ok
+        times = []
+        for _ in range(5):
+            start = time.perf_counter()
+            ok, frame = pipeline.read()
+            times.append(time.perf_counter() - start)
+            assert ok and frame is not None
+        assert max(times) < READ_WAIT + 0.03
+    finally:
+        pipeline.release()
+
+
+def test_read_ends_when_the_source_does():
+    pipeline = CapturePipeline(SlowCamera(0.001, frames=5), NullTracker())
+    try:
+        reads = 0
+        while pipeline.read()[0]:
+            reads += 1
+            assert reads < 1000
+        assert reads >= 1
+    finally:
+        pipeline.release()
+
+
+def test_frames_are_not_overwritten_while_in_use():
+    # The camera runs far faster than both consumers, which hold each frame a while
+    tracker = NullTracker(delay=0.01)
+    pipeline = CapturePipeline(SlowCamera(0.0005), tracker, flip=False)
+    try:
+        for _ in range(20):
+            ok, frame = pipeline.read()
+            assert ok
+            value = frame[0, 0, 0]
+            time.sleep(0.01)
+            assert (frame == value).all()
+        assert tracker.torn == 0
+        assert len(pipeline.buffers) <= pipeline.frames.maxsize + 3
+    finally:
+        pipeline.release()
@@ -0,0 +1,83 @@
+import numpy as np
+import pytest
+from benchmarks.bench_compositing import old_icon_blend, old_stencil
+from modules.compositing import Sprite, blend, clip
+
+EDGE_POSITIONS = [(-30, -30), (620, 460), (-49, 200), (300, 479), (0, -49), (590, 0)]
+OFF_SCREEN = [(-50, 0), (0, -50), (640, 100), (100, 480), (700, 700)]
+
+
+def exact_blend(frame, icon, x, y):
+    h, w = icon.shape[:2]
+    a = icon[:, :, 3:4] / 255.0
+    roi = frame[y:y+h, x:x+w].astype(np.float64)
+    return np.round(icon[:, :, :3] * a + roi * (1 - a))
+
+
+@pytest.fixture
+def frame():
+    return np.random.default_rng(0).integers(0, 256, (480, 640, 3), dtype=np.uint8)
+
+
+@pytest.fixture
+def icon():
+    # Transparent, opaque and random-alpha bands
+    icon = np.random.default_rng(1).integers(0, 256, (50, 50, 4), dtype=np.uint8)
+    icon[:10, :, 3] = 0
+    icon[10:20, :, 3] = 255
+    return icon
+
+
+@pytest.fixture
+def outline():
+    outline = np.random.default_rng(2).integers(0, 256, (300, 200, 4), dtype=np.uint8)
+    outline[:, :, 3] = np.where(np.random.default_rng(3).random((300, 200)) < 0.3, 255, 0)
+    return outline
+
+
+def test_blend_is_within_one_level_of_exact(frame, icon):
+    out = blend(frame.copy(), Sprite(icon), 100, 100)
+    assert np.abs(out[100:150, 100:150] - exact_blend(frame, icon, 100, 100)).max() <= 1
+
+
+def test_blend_matches_old_icon_loop(frame, icon):
+    old = frame.copy()
+    old_icon_blend(old, icon, 100, 100)
+    new = blend(frame.copy(), Sprite(icon), 100, 100)
+    assert np.abs(old.astype(np.int16) - new).max() <= 1
+
+
+def test_transparent_and_opaque_pixels_are_exact(frame, icon):
+    out = blend(frame.copy(), Sprite(icon), 100, 100)
+    assert np.array_equal(out[100:110, 100:150], frame[100:110, 100:150])
+    assert np.array_equal(out[110:120, 100:150], icon[10:20, :, :3])
+
+
+def test_stencil_matches_old_masked_copy(frame, outline):
+    old = frame.copy()
+    old_stencil(old, outline, 220, 90)
+    new = blend(frame.copy(), Sprite(outline, binary=True), 220, 90)
+    assert np.array_equal(old, new)
+
+
+def test_opaque_image_is_copied(frame, icon):
+    out = blend(frame.copy(), Sprite(icon[:, :, :3]), 10, 20)
+    assert np.array_equal(out[20:70, 10:60], icon[:, :, :3])
+
+
+@pytest.mark.parametrize("binary", [False, True], ids=["alpha", "stencil"])
+@pytest.mark.parametrize("x, y", EDGE_POSITIONS)
+def test_edges_clip_like_a_padded_frame(frame, icon, binary, x, y):
+    # Same pixels as drawing onto a frame with a 60px border, then cropping
+    sprite = Sprite(icon, binary=binary)
+    padded = np.zeros((600, 760, 3), np.uint8)
+    padded[60:540, 60:700] = frame
+    blend(padded, sprite, x + 60, y + 60)
+    out = blend(frame.copy(), sprite, x, y)
+    assert np.array_equal(out, padded[60:540, 60:700])
+
+
+@pytest.mark.parametrize("x, y", OFF_SCREEN)
+def test_off_screen_sprite_draws_nothing(frame, icon, x, y):
+    assert clip(frame.shape, x, y, 50, 50) is None
+    assert np.array_equal(blend(frame.copy(), Sprite(icon), x, y), frame)
@@ -0,0 +1,78 @@
+import numpy as np
+import pytest
+from benchmarks.bench_filters import evaluate, synthetic
+from modules.filters import KalmanFilter, OneEuroFilter, PoseFilter, make_filter
+from modules.hand_pose import HandPose
+
+
+@pytest.fixture(scope="module")
+def measured():
+    # preset -> (jitter px, lag ms) on the synthetic still / circling / still path
+    stamps, noisy, truth = synthetic()
+    return {preset: evaluate(preset, stamps, noisy, truth)
+            for preset in ("raw", "menu", "lesson", "drawing", "kalman")}
+
+
+@pytest.mark.parametrize("preset", ["menu", "lesson"])
+def test_smoothing_presets_cut_jitter(measured, preset):
+    raw_jitter, _ = measured["raw"]
+    jitter, _ = measured[preset]
+    assert jitter < 0.7 * raw_jitter
+
+
+@pytest.mark.parametrize("preset", ["drawing", "kalman"])
+def test_predicting_presets_cut_lag(measured, preset):
+    _, raw_lag = measured["raw"]
+    jitter, lag = measured[preset]
+    assert lag < 0.5 * raw_lag
+    assert jitter < 4.0  # Prediction may not turn noise into visible shake
+
+
+@pytest.mark.parametrize("preset", ["menu", "lesson", "drawing", "kalman"])
+def test_every_preset_keeps_up(measured, preset):
+    _, lag = measured[preset]
+    assert lag < 150
+
+
+@pytest.mark.parametrize("make", [lambda: OneEuroFilter(1.0, 0.0), KalmanFilter], ids=["one_euro", "kalman"])
+def test_still_input_is_steadier_than_measured(make):
+    filt = make()
+    rng = np.random.default_rng(0)
+    target = np.full((21, 3), 0.5, np.float32)
+    errors, noise = [], []
+    for i in range(120):
+        measured = target + rng.normal(0, 0.003, target.shape)
+        out = filt.update(measured, i / 30)
+        if i >= 60:  # Settled
+            errors.append(((out - target) ** 2).mean())
+            noise.append(((measured - target) ** 2).mean())
+    assert np.sqrt(np.mean(errors)) < 0.8 * np.sqrt(np.mean(noise))
+
+
+def test_hands_are_filtered_separately():
+    pose_filter = make_filter("menu")
+    left = HandPose(np.full((21, 3), 0.2), (640, 480), timestamp=0.0, hand_id=1)
+    right = HandPose(np.full((21, 3), 0.8), (640, 480), timestamp=0.0, hand_id=2)
+    out = pose_filter.apply([left, right], now=0.0)
+    assert np.allclose(out[0].points, 0.2) and np.allclose(out[1].points, 0.8)
+    assert [p.hand_id for p in out] == [1, 2]
+
+
+def test_repeated_pose_does_not_update_filter():
+    pose_filter = PoseFilter(min_cutoff=1.0, beta=0.0)
+    pose = HandPose(np.full((21, 3), 0.5), (640, 480), timestamp=1.0)
+    pose_filter.apply([pose], now=1.0)
+    jumped = HandPose(np.full((21, 3), 0.9), (640, 480), timestamp=1.0)  # Same inference result time
+    out = pose_filter.apply([jumped], now=1.01)
+    assert np.allclose(out[0].points, 0.5)
+
+
+def test_lost_hands_are_forgotten():
+    pose_filter = PoseFilter(max_missing=0.5)
+    pose_filter.apply([HandPose(np.zeros((21, 3)), (640, 480), timestamp=0.0, hand_id=3)], now=0.0)
+    pose_filter.apply([], now=1.0)
+    assert 3 not in pose_filter.hands
+
+
+def test_raw_preset_has_no_filter():
+    assert make_filter("raw") is None
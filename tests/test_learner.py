@@ -0,0 +1,120 @@
+import pytest
+from modules.learner import (EASE, LEVELS, MIN_EASE, RETRY_INTERVAL, START_LEVEL, WINDOW, ItemState,
+                             LearnerModel, quality, register, schedule)
+from modules.numbers.problems import DEFAULT_DIFFICULTY
+
+LESSON = "test_lesson"
+register(LESSON, lambda level: [(level, i) for i in range(30)])
+
+
+@pytest.fixture
+def model():
+    return LearnerModel(seed=0)
+
+
+def answer(model, correct, latency=2.0):
+    key, level = model.next_item(LESSON)
+    model.record(LESSON, key, correct, latency)
+    return key, level
+
+
+def test_quality_grades():
+    assert quality(False, 1.0, 2.0) == 1
+    assert quality(True, 1.0, 2.0) == 5
+    assert quality(True, 3.0, 2.0) == 4
+    assert quality(True, 5.0, 2.0) == 3
+    assert quality(True, 9.0, None) == 5  # No typical time yet
+
+
+def test_sm2_intervals_grow():
+    item = ItemState("x", 1)
+    intervals, eases = [], []
+    for _ in range(4):
+        eases.append(item.ease)
+        schedule(item, 5, clock=0)
+        intervals.append(item.interval)
+    assert intervals[:2] == [2, 5]
+    assert intervals[2] == round(5 * eases[2])
+    assert intervals[3] == round(intervals[2] * eases[3])
+    assert item.ease == pytest.approx(EASE + 0.4)
+
+
+def test_miss_resets_the_interval():
+    item = ItemState("x", 1)
+    for _ in range(3):
+        schedule(item, 5, clock=0)
+    schedule(item, 1, clock=10)
+    assert (item.reps, item.interval, item.due) == (0, RETRY_INTERVAL, 10 + RETRY_INTERVAL)
+    schedule(item, 5, clock=12)
+    assert item.interval == 2  # Starts over from the first interval
+
+
+def test_ease_never_drops_below_the_floor():
+    item = ItemState("x", 1)
+    for _ in range(20):
+        schedule(item, 1, clock=0)
+    assert item.ease == MIN_EASE
+
+
+def test_starts_at_the_lessons_old_ranges(model):
+    assert START_LEVEL == DEFAULT_DIFFICULTY
+    assert model.level("addition") == DEFAULT_DIFFICULTY
+    _, level = model.next_item("addition")
+    assert level == DEFAULT_DIFFICULTY
+
+
+def test_fluent_answers_raise_the_level(model):
+    for _ in range(WINDOW):
+        answer(model, True)
+    assert model.level(LESSON) == START_LEVEL + 1
+    # New items now come from the new level (between the due reviews)
+    assert START_LEVEL + 1 in {answer(model, True)[1] for _ in range(4)}
+
+
+def test_wrong_answers_lower_the_level(model):
+    for _ in range(WINDOW):
+        answer(model, False)
+    assert model.level(LESSON) == START_LEVEL - 1
+
+
+@pytest.mark.parametrize("level, correct", [(LEVELS[-1], True), (LEVELS[0], False)], ids=["top", "bottom"])
+def test_level_stays_within_range(model, level, correct):
+    model.lesson(LESSON).level = level
+    for _ in range(WINDOW * 2):
+        answer(model, correct)
+    assert model.level(LESSON) == level
+
+
+def test_no_change_before_a_full_window(model):
+    for _ in range(WINDOW - 1):
+        answer(model, False)
+    assert model.level(LESSON) == START_LEVEL
+
+
+def test_missed_item_comes_back_after_one_question(model):
+    missed, _ = answer(model, False)
+    other, _ = answer(model, True)
+    assert other != missed
+    again, _ = model.next_item(LESSON)
+    assert again == missed
+
+
+def test_unanswered_item_is_asked_again(model):
+    first, _ = model.next_item(LESSON)
+    second, _ = model.next_item(LESSON)
+    assert second == first
+
+
+def test_save_and_load_keep_the_schedule(model, tmp_path):
+    for i in range(20):
+        answer(model, i % 3 != 0, 1.0 + i % 4)
+    path = str(tmp_path / "learner.json")
+    model.save(path)
+    loaded = LearnerModel(seed=0)
+    assert loaded.load(path)
+    assert loaded.stats(LESSON) == model.stats(LESSON)
+    saved, restored = model.lessons[LESSON], loaded.lessons[LESSON]
+    assert set(saved.items) == set(restored.items)  # Tuple keys survive JSON
+    for key, item in saved.items.items():
+        assert (item.interval, item.due, item.ease) == (restored.items[key].interval,
+                                                        restored.items[key].due, restored.items[key].ease)
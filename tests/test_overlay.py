@@ -0,0 +1,108 @@
+import cv2
+import numpy as np
+import pytest
+from benchmarks.bench_overlay import W, H, addition_screen, numbers_grid
+from modules.overlay import Overlay
+
+FONT = cv2.FONT_HERSHEY_SIMPLEX
+COLORS = [(0, 150, 255), (0, 255, 0), (255, 0, 0)]
+
+
+def panel(x, y, w, h, label):
+    # A filled box with anti-aliased text; its colour follows the state
+    def draw(img, state):
+        cv2.rectangle(img, (x, y), (x + w, y + h), COLORS[state], -1)
+        cv2.putText(img, label, (x + 5, y + h - 8), FONT, 0.6, (255, 255, 255), 2, cv2.LINE_AA)
+    return (x, y, w, h), draw
+
+
+def nested_and_overlapping():
+    return {
+        "outer": panel(100, 100, 200, 150, "outer"),
+        "inner": panel(140, 130, 80, 40, "in"),       # Entirely inside outer
+        "left": panel(20, 300, 120, 60, "left"),
+        "right": panel(110, 320, 120, 60, "right"),   # Overlaps left
+        "alone": panel(400, 50, 150, 80, "alone"),
+    }
+
+
+def build(widgets, states):
+    overlay = Overlay(W, H)
+    for name, (box, draw) in widgets.items():
+        overlay.add(name, box, draw, states[name])
+    return overlay
+
+
+def from_scratch(widgets, states, frame):
+    return build(widgets, states).composite(frame.copy())
+
+
+@pytest.fixture
+def frame():
+    return np.random.default_rng(0).integers(0, 256, (H, W, 3), dtype=np.uint8)
+
+
+def test_nested_widget_state_survives_outer_toggle(frame):
+    widgets = nested_and_overlapping()
+    states = dict.fromkeys(widgets, 0)
+    overlay = build(widgets, states)
+    for name, state in [("outer", 1), ("outer", 0), ("inner", 2), ("outer", 1), ("outer", 0)]:
+        overlay.set_state(name, state)
+        states[name] = state
+        assert np.array_equal(overlay.composite(frame.copy()), from_scratch(widgets, states, frame)), (name, state)
+
+
+def test_state_changes_match_a_full_rerender(frame):
+    widgets = nested_and_overlapping()
+    states = dict.fromkeys(widgets, 0)
+    overlay = build(widgets, states)
+    rng = np.random.default_rng(1)
+    names = list(widgets)
+    for step in range(200):
+        for name in rng.choice(names, rng.integers(1, 3), replace=False):
+            states[name] = int(rng.integers(len(COLORS)))
+            overlay.set_state(name, states[name])
+        assert np.array_equal(overlay.composite(frame.copy()), from_scratch(widgets, states, frame)), step
+
+
+def test_adding_and_removing_widgets_match_a_full_rerender(frame):
+    widgets = nested_and_overlapping()
+    states = dict.fromkeys(widgets, 0)
+    overlay = build(widgets, states)
+    shown = dict(widgets)
+    rng = np.random.default_rng(2)
+    for step in range(100):
+        name = str(rng.choice(list(widgets)))
+        if name in shown and rng.random() < 0.3:
+            overlay.remove(name)
+            del shown[name]
+        elif name not in shown:
+            box, draw = shown[name] = widgets[name]
+            overlay.add(name, box, draw, states[name])
+        else:
+            states[name] = int(rng.integers(len(COLORS)))
+            overlay.set_state(name, states[name])
+        expected = from_scratch(shown, states, frame)
+        assert np.array_equal(overlay.composite(frame.copy()), expected), step
+
+
+def test_clear_leaves_the_frame_untouched(frame):
+    overlay = build(nested_and_overlapping(), dict.fromkeys(nested_and_overlapping(), 0))
+    overlay.composite(frame.copy())
+    overlay.clear()
+    assert np.array_equal(overlay.composite(frame.copy()), frame)
+
+
+@pytest.mark.parametrize("items", [numbers_grid(), addition_screen()], ids=["numbers_grid", "addition"])
+def test_matches_immediate_drawing(frame, items):
+    overlay = Overlay(W, H)
+    for name, box, draw in items:
+        overlay.add(name, box, draw, False)
+    for i in range(len(items) * 2):  # Hover glow moving along, then back to none
+        for k, (name, _, _) in enumerate(items):
+            overlay.set_state(name, k == i % len(items) and i < len(items))
+        overlay.composite(frame.copy())
+    immediate = frame.copy()
+    for _, _, draw in items:
+        draw(immediate, False)
+    assert np.abs(overlay.composite(frame.copy()).astype(np.int16) - immediate).max() <= 1
@@ -0,0 +1,60 @@
+import pytest
+from benchmarks.bench_problems import CHECKS, validate
+from modules.numbers.problems import DIFFICULTIES, SPECS, ProblemBank, build_problems
+
+LESSONS = sorted(SPECS)
+
+
+@pytest.mark.parametrize("difficulty", DIFFICULTIES)
+@pytest.mark.parametrize("lesson", LESSONS)
+def test_answers_and_distractors_are_valid(lesson, difficulty):
+    # Right answer first, distinct options, the right count, none below the lesson's lowest
+    problems, errors = validate(lesson, difficulty)
+    assert problems
+    assert errors == []
+
+
+@pytest.mark.parametrize("lesson", LESSONS)
+def test_distractors_are_stable(lesson):
+    first = {p.operands: p.options for p in build_problems(lesson)}
+    build_problems.cache_clear()
+    assert {p.operands: p.options for p in build_problems(lesson)} == first
+
+
+@pytest.mark.parametrize("lesson", LESSONS)
+def test_a_round_deals_every_problem_once(lesson):
+    bank = ProblemBank(lesson, seed=3)
+    for _ in range(2):
+        dealt = [bank.draw() for _ in range(len(bank))]
+        items = {p.item for p in dealt}
+        assert len(items) == len(bank)
+        for p in dealt:
+            assert p.answer == CHECKS[lesson](p.operands)
+            assert p.answer in p.options and len(set(p.options)) == len(p.options)
+
+
+def test_no_problem_twice_in_a_row_across_rounds():
+    bank = ProblemBank("counting", 1, seed=0)
+    dealt = [bank.draw().operands for _ in range(10 * len(bank))]
+    assert all(a != b for a, b in zip(dealt, dealt[1:]))
+
+
+def test_same_seed_deals_the_same_problems():
+    a, b = ProblemBank("division", seed=9), ProblemBank("division", seed=9)
+    for _ in range(50):
+        x, y = a.draw(), b.draw()
+        assert (x.operands, x.options) == (y.operands, y.options)
+
+
+def test_problem_lookup_deals_that_problem():
+    bank = ProblemBank("multiplication", seed=1)
+    problem = bank.problem((3, 7))
+    assert sorted(problem.operands) == [3, 7] and problem.answer == 21
+    assert bank.problem((100, 100)) is None
+
+
+def test_tracing_levels_cover_every_digit():
+    assert [p.answer for p in build_problems("tracing", 2)] == list(range(10))
+    easy = {p.answer for p in build_problems("tracing", 1)}
+    hard = {p.answer for p in build_problems("tracing", 3)}
+    assert easy | hard == set(range(10)) and not easy & hard
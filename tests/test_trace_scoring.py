@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+from benchmarks.bench_tracing import ORIGIN, bad_traces, trace
+from modules.numbers.trace_scoring import (DIGIT_PATHS, TEMPLATE_SIZE, TrailBuffer, _strokes,
+                                           get_template, score_trace)
+
+DIGITS = sorted(DIGIT_PATHS)
+SEEDS = range(3)
+# Template digit -> digits whose path mostly runs along its ink (9 is 8's
+# top loop and 5's tail, 3's top arc is 2's), which may pass for it
+LOOKALIKES = {"2": {"3"}, "8": {"9"}, "9": {"5", "8"}}
+
+
+def digit_trace(digit, seed):
+    return trace(_strokes(DIGIT_PATHS[digit], TEMPLATE_SIZE), np.random.default_rng(seed))
+
+
+@pytest.mark.parametrize("digit", DIGITS)
+@pytest.mark.parametrize("seed", SEEDS)
+def test_good_trace_passes(digit, seed):
+    result = score_trace(get_template(digit), digit_trace(digit, seed), ORIGIN)
+    assert result.passed, result
+    assert result.score >= 90
+
+
+@pytest.mark.parametrize("kind", ["scribble", "reversed", "partial", "flat line", "held still"])
+@pytest.mark.parametrize("digit", DIGITS)
+def test_bad_trace_fails(digit, kind):
+    for seed in SEEDS:
+        points = bad_traces(digit, np.random.default_rng(seed))[kind]
+        result = score_trace(get_template(digit), points, ORIGIN)
+        assert not result.passed, (seed, result)
+
+
+@pytest.mark.parametrize("digit", DIGITS)
+def test_other_digit_fails(digit):
+    template = get_template(digit)
+    for other in DIGITS:
+        if other == digit or other in LOOKALIKES.get(digit, ()):
+            continue
+        for seed in SEEDS:
+            result = score_trace(template, digit_trace(other, seed), ORIGIN)
+            assert not result.passed, (other, seed, result)
+
+
+def test_trace_off_the_template_scores_zero():
+    far = np.float32([(0, 0), (5, 5), (10, 0)])
+    result = score_trace(get_template(3), far, ORIGIN)
+    assert (result.score, result.passed) == (0, False)
+
+
+def test_trail_keeps_the_newest_points_in_order():
+    trail = TrailBuffer(capacity=4)
+    for i in range(6):
+        trail.append((i, -i))
+    assert len(trail) == 4
+    assert trail.points().tolist() == [[2, -2], [3, -3], [4, -4], [5, -5]]
+    trail.clear()
+    assert len(trail) == 0
@@ -0,0 +1,62 @@
+import pytest
+from modules.tts import Pyttsx3Backend, voice_for_lang
+
+
+class Voice:
+    def __init__(self, id, languages=(), name=""):
+        self.id = id
+        self.languages = list(languages)
+        self.name = name
+
+
+class FakeEngine:
+    """pyttsx3 engine stand-in that records the voice each file is saved with."""
+
+    def __init__(self, voices):
+        self.voices = voices
+        self.props = {}
+        self.saved = []
+
+    def getProperty(self, name):
+        return self.voices if name == "voices" else self.props.get(name)
+
+    def setProperty(self, name, value):
+        self.props[name] = value
+
+    def save_to_file(self, text, path):
+        self.saved.append((text, self.props.get("voice")))
+
+    def runAndWait(self):
+        pass
+
+
+VOICES = [
+    Voice("espeak-fr", [b"\x05fr-fr"]),                # eSpeak: bytes with a priority prefix
+    Voice("com.apple.voice.Alex", ["en_US"]),          # NSSpeech
+    Voice("HKEY\\TTS_MS_DE-DE_HEDDA_11.0", name="Hedda"),  # SAPI5: no languages listed
+]
+
+
+@pytest.mark.parametrize("lang, expected", [("fr", "espeak-fr"), ("en", "com.apple.voice.Alex"),
+                                            ("en-us", "com.apple.voice.Alex"), ("de", "HKEY\\TTS_MS_DE-DE_HEDDA_11.0"),
+                                            ("es", None)])
+def test_voice_for_lang(lang, expected):
+    assert voice_for_lang(VOICES, lang) == expected
+
+
+def test_backend_speaks_each_lang_with_its_voice(tmp_path):
+    backend = Pyttsx3Backend()
+    backend._engine = FakeEngine(VOICES)
+    backend.synthesize("bonjour", "fr", None, str(tmp_path / "a.wav"))
+    backend.synthesize("hello", "en", None, str(tmp_path / "b.wav"))
+    backend.synthesize("hallo", "en", "espeak-fr", str(tmp_path / "c.wav"))  # Explicit voice wins
+    assert backend._engine.saved == [("bonjour", "espeak-fr"), ("hello", "com.apple.voice.Alex"),
+                                     ("hallo", "espeak-fr")]
+
+
+def test_backend_refuses_a_lang_it_cannot_speak(tmp_path):
+    backend = Pyttsx3Backend()
+    backend._engine = FakeEngine(VOICES)
+    with pytest.raises(LookupError):
+        backend.synthesize("hola", "es", None, str(tmp_path / "a.wav"))
+    assert backend._engine.saved == []